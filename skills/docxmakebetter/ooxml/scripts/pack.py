@@ -6,9 +6,7 @@ Example usage:
     python pack.py <input_directory> <office_file> [--force]
 """
 
-import argparse
 import shutil
-import subprocess
 import sys
 import tempfile
 import defusedxml.minidom
@@ -17,6 +15,8 @@ from pathlib import Path
 
 
 def main():
+    import argparse
+
     parser = argparse.ArgumentParser(description="Pack a directory into an Office file")
     parser.add_argument("input_directory", help="Unpacked Office document directory")
     parser.add_argument("output_file", help="Output Office file (.docx/.pptx/.xlsx)")
@@ -89,6 +89,8 @@ def pack_document(input_dir, output_file, validate=False):
 
 def validate_document(doc_path):
     """Validate document by converting to HTML with soffice."""
+    import subprocess
+
     # Determine the correct filter based on file extension
     match doc_path.suffix.lower():
         case ".docx":
@@ -10,7 +10,12 @@ import argparse
 import sys
 from pathlib import Path
 
-from validation import DOCXSchemaValidator, PPTXSchemaValidator, RedliningValidator
+from validation import (
+    DOCXSchemaValidator,
+    PPTXSchemaValidator,
+    RedliningValidator,
+    XLSXSchemaValidator,
+)
 
 
 def main():
@@ -48,6 +53,8 @@ def main():
             validators = [DOCXSchemaValidator, RedliningValidator]
         case ".pptx":
             validators = [PPTXSchemaValidator]
+        case ".xlsx":
+            validators = [XLSXSchemaValidator]
         case _:
             print(f"Error: Validation not supported for file type {file_extension}")
             sys.exit(1)
@@ -2,11 +2,16 @@
 Base validator with common validation logic for document files.
 """
 
+import os
 import re
 from pathlib import Path
 
 import lxml.etree
 
+# Template placeholders such as {{ name }}, stripped from text before XSD validation
+TEMPLATE_TAG_PATTERN = re.compile(r"\{\{[^}]*\}\}")
+TEMPLATE_TEXT_XPATH = lxml.etree.XPath("//text()[contains(., '{{')]")
+
 
 class BaseSchemaValidator:
     """Base validator with common validation logic for document files."""
@@ -111,6 +116,9 @@ class BaseSchemaValidator:
         # Set schemas directory
         self.schemas_dir = Path(__file__).parent.parent.parent / "schemas"
 
+        # Compiled XMLSchema objects by schema path, shared by all parts
+        self._schema_cache = {}
+
         # Get all XML and .rels files
         patterns = ["*.xml", "*.rels"]
         self.xml_files = [
@@ -298,6 +306,10 @@ class BaseSchemaValidator:
             ):  # This file is not referenced by .rels
                 all_files.append(file_path.resolve())
 
+        # Lexically normalized targets are looked up here before falling back
+        # to resolve(), which costs a few stat calls per relationship
+        known_files = set(all_files)
+
         # Track all files that are referenced by any .rels file
         all_referenced_files = set()
 
@@ -337,6 +349,12 @@ class BaseSchemaValidator:
                             base_dir = rels_dir.parent
                             target_path = base_dir / target
 
+                        normalized_path = Path(os.path.normpath(target_path))
+                        if normalized_path in known_files:
+                            referenced_files.add(normalized_path)
+                            all_referenced_files.add(normalized_path)
+                            continue
+
                         # Normalize the path and check if it exists
                         try:
                             target_path = target_path.resolve()
@@ -762,64 +780,65 @@ class BaseSchemaValidator:
 
         return None
 
-    def _clean_ignorable_namespaces(self, xml_doc):
-        """Remove attributes and elements not in allowed namespaces."""
-        # Create a clean copy
-        xml_string = lxml.etree.tostring(xml_doc, encoding="unicode")
-        xml_copy = lxml.etree.fromstring(xml_string)
-
-        # Remove attributes not in allowed namespaces
-        for elem in xml_copy.iter():
-            attrs_to_remove = []
-
-            for attr in elem.attrib:
-                # Check if attribute is from a namespace other than allowed ones
-                if "{" in attr:
-                    ns = attr.split("}")[0][1:]
-                    if ns not in self.OOXML_NAMESPACES:
-                        attrs_to_remove.append(attr)
+    def _preprocess_for_xsd(self, xml_doc, clean_namespaces):
+        """Prepare a parsed XML document for XSD validation, in place.
 
-            # Remove collected attributes
-            for attr in attrs_to_remove:
-                del elem.attrib[attr]
+        Works on the given tree without copying it:
+        - removes {{ ... }} template tags from text and tail content (except
+          inside w:t elements), visiting only the text nodes that contain them
+        - drops mc:Ignorable from the root element
+        - if clean_namespaces is True, removes attributes and elements that are
+          not in OOXML_NAMESPACES in one walk, deciding once per distinct
+          tag or attribute name
 
-        # Remove elements not in allowed namespaces
-        self._remove_ignorable_elements(xml_copy)
-
-        return lxml.etree.ElementTree(xml_copy)
+        Args:
+            xml_doc: lxml ElementTree, freshly parsed; it is modified
+            clean_namespaces: True for parts in MAIN_CONTENT_FOLDERS
 
-    def _remove_ignorable_elements(self, root):
-        """Recursively remove all elements not in allowed namespaces."""
-        elements_to_remove = []
+        Returns:
+            lxml ElementTree: xml_doc
+        """
+        root = xml_doc.getroot()
 
-        # Find elements to remove
-        for elem in list(root):
-            # Skip non-element nodes (comments, processing instructions, etc.)
-            if not hasattr(elem, "tag") or callable(elem.tag):
+        for text in TEMPLATE_TEXT_XPATH(root):
+            owner = text.getparent()
+            # Comments and processing instructions are left alone, as are
+            # the text and tail of w:t (and other *:t) elements
+            if not isinstance(owner.tag, str):
                 continue
+            if owner.tag.endswith("}t") or owner.tag == "t":
+                continue
+            if text.is_tail:
+                owner.tail = TEMPLATE_TAG_PATTERN.sub("", owner.tail)
+            else:
+                owner.text = TEMPLATE_TAG_PATTERN.sub("", owner.text)
 
-            tag_str = str(elem.tag)
-            if tag_str.startswith("{"):
-                ns = tag_str.split("}")[0][1:]
-                if ns not in self.OOXML_NAMESPACES:
-                    elements_to_remove.append(elem)
-                    continue
-
-            # Recursively clean child elements
-            self._remove_ignorable_elements(elem)
+        root.attrib.pop(f"{{{self.MC_NAMESPACE}}}Ignorable", None)
 
-        # Remove collected elements
-        for elem in elements_to_remove:
-            root.remove(elem)
+        if clean_namespaces:
+            allowed = self.OOXML_NAMESPACES
+            foreign = {}  # Clark name -> True if outside the allowed namespaces
 
-    def _preprocess_for_mc_ignorable(self, xml_doc):
-        """Preprocess XML to handle mc:Ignorable attribute properly."""
-        # Remove mc:Ignorable attributes before validation
-        root = xml_doc.getroot()
+            def is_foreign(name):
+                result = foreign.get(name)
+                if result is None:
+                    result = foreign[name] = (
+                        name[0] == "{" and name[1 : name.index("}")] not in allowed
+                    )
+                return result
 
-        # Remove mc:Ignorable attribute from root
-        if f"{{{self.MC_NAMESPACE}}}Ignorable" in root.attrib:
-            del root.attrib[f"{{{self.MC_NAMESPACE}}}Ignorable"]
+            doomed = []
+            for elem in root.iter(lxml.etree.Element):
+                if elem is not root and is_foreign(elem.tag):
+                    doomed.append(elem)
+                    continue
+                for attr in elem.keys():
+                    if is_foreign(attr):
+                        del elem.attrib[attr]
+            # Elements nested in a doomed element are removed from an already
+            # detached subtree, which is harmless
+            for elem in doomed:
+                elem.getparent().remove(elem)
 
         return xml_doc
 
@@ -830,28 +849,21 @@ class BaseSchemaValidator:
             return None, None  # Skip file
 
         try:
-            # Load schema
-            with open(schema_path, "rb") as xsd_file:
-                parser = lxml.etree.XMLParser()
-                xsd_doc = lxml.etree.parse(
-                    xsd_file, parser=parser, base_url=str(schema_path)
-                )
-                schema = lxml.etree.XMLSchema(xsd_doc)
+            schema = self._load_schema(schema_path)
 
-            # Load and preprocess XML
+            # Load and preprocess XML; ignorable namespaces are only cleaned
+            # in the main content folders
             with open(xml_file, "r") as f:
                 xml_doc = lxml.etree.parse(f)
 
-            xml_doc, _ = self._remove_template_tags_from_text_nodes(xml_doc)
-            xml_doc = self._preprocess_for_mc_ignorable(xml_doc)
-
-            # Clean ignorable namespaces if needed
             relative_path = xml_file.relative_to(base_path)
-            if (
-                relative_path.parts
-                and relative_path.parts[0] in self.MAIN_CONTENT_FOLDERS
-            ):
-                xml_doc = self._clean_ignorable_namespaces(xml_doc)
+            xml_doc = self._preprocess_for_xsd(
+                xml_doc,
+                clean_namespaces=bool(
+                    relative_path.parts
+                    and relative_path.parts[0] in self.MAIN_CONTENT_FOLDERS
+                ),
+            )
 
             # Validate
             if schema.validate(xml_doc):
@@ -866,6 +878,19 @@ class BaseSchemaValidator:
         except Exception as e:
             return False, {str(e)}
 
+    def _load_schema(self, schema_path):
+        """Compile an XSD schema once and reuse it for every file that maps to it."""
+        schema = self._schema_cache.get(schema_path)
+        if schema is None:
+            with open(schema_path, "rb") as xsd_file:
+                parser = lxml.etree.XMLParser()
+                xsd_doc = lxml.etree.parse(
+                    xsd_file, parser=parser, base_url=str(schema_path)
+                )
+                schema = lxml.etree.XMLSchema(xsd_doc)
+            self._schema_cache[schema_path] = schema
+        return schema
+
     def _get_original_file_errors(self, xml_file):
         """Get XSD validation errors from a single file in the original document.
 
@@ -886,66 +911,22 @@ class BaseSchemaValidator:
         with tempfile.TemporaryDirectory() as temp_dir:
             temp_path = Path(temp_dir)
 
-            # Extract original file
+            # Extract only the corresponding file from the original
             with zipfile.ZipFile(self.original_file, "r") as zip_ref:
-                zip_ref.extractall(temp_path)
+                try:
+                    zip_ref.extract(relative_path.as_posix(), temp_path)
+                except KeyError:
+                    # File didn't exist in original, so no original errors
+                    return set()
 
-            # Find corresponding file in original
             original_xml_file = temp_path / relative_path
 
-            if not original_xml_file.exists():
-                # File didn't exist in original, so no original errors
-                return set()
-
             # Validate the specific file in original
             is_valid, errors = self._validate_single_file_xsd(
                 original_xml_file, temp_path
             )
             return errors if errors else set()
 
-    def _remove_template_tags_from_text_nodes(self, xml_doc):
-        """Remove template tags from XML text nodes and collect warnings.
-
-        Template tags follow the pattern {{ ... }} and are used as placeholders
-        for content replacement. They should be removed from text content before
-        XSD validation while preserving XML structure.
-
-        Returns:
-            tuple: (cleaned_xml_doc, warnings_list)
-        """
-        warnings = []
-        template_pattern = re.compile(r"\{\{[^}]*\}\}")
-
-        # Create a copy of the document to avoid modifying the original
-        xml_string = lxml.etree.tostring(xml_doc, encoding="unicode")
-        xml_copy = lxml.etree.fromstring(xml_string)
-
-        def process_text_content(text, content_type):
-            if not text:
-                return text
-            matches = list(template_pattern.finditer(text))
-            if matches:
-                for match in matches:
-                    warnings.append(
-                        f"Found template tag in {content_type}: {match.group()}"
-                    )
-                return template_pattern.sub("", text)
-            return text
-
-        # Process all text nodes in the document
-        for elem in xml_copy.iter():
-            # Skip processing if this is a w:t element
-            if not hasattr(elem, "tag") or callable(elem.tag):
-                continue
-            tag_str = str(elem.tag)
-            if tag_str.endswith("}t") or tag_str == "t":
-                continue
-
-            elem.text = process_text_content(elem.text, "text content")
-            elem.tail = process_text_content(elem.tail, "tail content")
-
-        return lxml.etree.ElementTree(xml_copy), warnings
-
 
 if __name__ == "__main__":
     raise RuntimeError("This module should not be run directly.")
@@ -3,7 +3,6 @@ Validator for Word document XML files against XSD schemas.
 """
 
 import re
-import tempfile
 import zipfile
 
 import lxml.etree
@@ -170,9 +169,9 @@ class DOCXSchemaValidator(BaseSchemaValidator):
                 print("PASSED - No w:t elements found within w:del elements")
             return True
 
-    def count_paragraphs_in_unpacked(self):
-        """Count the number of paragraphs in the unpacked document."""
-        count = 0
+    def count_elements_in_unpacked(self):
+        """Count paragraphs, runs, tables and tracked changes in the unpacked document."""
+        counts = dict.fromkeys(COUNTED_ELEMENTS.values(), 0)
 
         for xml_file in self.xml_files:
             # Only check document.xml files
@@ -180,38 +179,27 @@ class DOCXSchemaValidator(BaseSchemaValidator):
                 continue
 
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-                # Count all w:p elements
-                paragraphs = root.findall(f".//{{{self.WORD_2006_NAMESPACE}}}p")
-                count = len(paragraphs)
+                counts = count_document_elements(xml_file)
             except Exception as e:
                 print(f"Error counting paragraphs in unpacked document: {e}")
 
-        return count
-
-    def count_paragraphs_in_original(self):
-        """Count the number of paragraphs in the original docx file."""
-        count = 0
+        return counts
 
+    def count_elements_in_original(self):
+        """Count paragraphs, runs, tables and tracked changes in the original docx file."""
         try:
-            # Create temporary directory to unpack original
-            with tempfile.TemporaryDirectory() as temp_dir:
-                # Unpack original docx
-                with zipfile.ZipFile(self.original_file, "r") as zip_ref:
-                    zip_ref.extractall(temp_dir)
-
-                # Parse document.xml
-                doc_xml_path = temp_dir + "/word/document.xml"
-                root = lxml.etree.parse(doc_xml_path).getroot()
-
-                # Count all w:p elements
-                paragraphs = root.findall(f".//{{{self.WORD_2006_NAMESPACE}}}p")
-                count = len(paragraphs)
-
+            return count_document_elements(self.original_file, "word/document.xml")
         except Exception as e:
             print(f"Error counting paragraphs in original document: {e}")
+            return dict.fromkeys(COUNTED_ELEMENTS.values(), 0)
 
-        return count
+    def count_paragraphs_in_unpacked(self):
+        """Count the number of paragraphs in the unpacked document."""
+        return self.count_elements_in_unpacked()["paragraphs"]
+
+    def count_paragraphs_in_original(self):
+        """Count the number of paragraphs in the original docx file."""
+        return self.count_elements_in_original()["paragraphs"]
 
     def validate_insertions(self):
         """
@@ -262,12 +250,68 @@ class DOCXSchemaValidator(BaseSchemaValidator):
 
     def compare_paragraph_counts(self):
         """Compare paragraph counts between original and new document."""
-        original_count = self.count_paragraphs_in_original()
-        new_count = self.count_paragraphs_in_unpacked()
+        original = self.count_elements_in_original()
+        new = self.count_elements_in_unpacked()
+        original_count = original["paragraphs"]
+        new_count = new["paragraphs"]
 
         diff = new_count - original_count
         diff_str = f"+{diff}" if diff > 0 else str(diff)
         print(f"\nParagraphs: {original_count} → {new_count} ({diff_str})")
+        if self.verbose:
+            for key in ("runs", "tables", "insertions", "deletions"):
+                print(f"{key.capitalize()}: {original[key]} → {new[key]}")
+
+
+# Word elements tallied by count_document_elements, by Clark-notation tag
+COUNTED_ELEMENTS = {
+    f"{{{DOCXSchemaValidator.WORD_2006_NAMESPACE}}}{tag}": key
+    for tag, key in (
+        ("p", "paragraphs"),
+        ("r", "runs"),
+        ("tbl", "tables"),
+        ("ins", "insertions"),
+        ("del", "deletions"),
+    )
+}
+
+
+def count_document_elements(source, member=None):
+    """Count paragraphs, runs, tables and tracked changes in one streaming pass.
+
+    Elements are cleared as soon as they have been counted, so memory stays
+    constant regardless of document size, and zip members are read directly
+    without extracting the archive.
+
+    Args:
+        source: Path to an XML file, or to an Office file when member is given
+        member: Name of the XML part inside the zip (e.g. "word/document.xml")
+
+    Returns:
+        dict: {"paragraphs", "runs", "tables", "insertions", "deletions"}
+    """
+    counts = dict.fromkeys(COUNTED_ELEMENTS.values(), 0)
+
+    def tally(stream):
+        # Only counted tags produce events; everything else is dropped along
+        # with the nearest counted ancestor
+        for _, elem in lxml.etree.iterparse(
+            stream, events=("end",), tag=list(COUNTED_ELEMENTS)
+        ):
+            counts[COUNTED_ELEMENTS[elem.tag]] += 1
+            # Drop the element and any already-counted siblings before it
+            elem.clear()
+            parent = elem.getparent()
+            if parent is not None:
+                while elem.getprevious() is not None:
+                    del parent[0]
+
+    if member is None:
+        tally(str(source))
+    else:
+        with zipfile.ZipFile(source) as zf, zf.open(member) as stream:
+            tally(stream)
+    return counts
 
 
 if __name__ == "__main__":
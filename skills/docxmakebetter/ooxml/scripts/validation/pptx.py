@@ -2,10 +2,22 @@
 Validator for PowerPoint presentation XML files against XSD schemas.
 """
 
+import html
 import re
 
 from .base import BaseSchemaValidator
 
+# UUID: 8-4-4-4-12 hex digits with optional braces/hyphens
+UUID_PATTERN = re.compile(
+    r"^[\{\(]?[0-9A-Fa-f]{8}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{12}[\}\)]?$"
+)
+
+# ID attributes (local name ending in "id", any case or prefix) with their raw
+# values, matched in the file text so parts without suspicious IDs need no parse
+ID_ATTRIBUTE_PATTERN = re.compile(
+    r"""\s[\w.:-]*[iI][dD]\s*=\s*(?:"([^"]*)"|'([^']*)')"""
+)
+
 
 class PPTXSchemaValidator(BaseSchemaValidator):
     """Validator for PowerPoint presentation XML files against XSD schemas."""
@@ -79,13 +91,13 @@ class PPTXSchemaValidator(BaseSchemaValidator):
         import lxml.etree
 
         errors = []
-        # UUID pattern: 8-4-4-4-12 hex digits with optional braces/hyphens
-        uuid_pattern = re.compile(
-            r"^[\{\(]?[0-9A-Fa-f]{8}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{12}[\}\)]?$"
-        )
 
         for xml_file in self.xml_files:
             try:
+                # Only parse files where a raw ID attribute value is suspicious
+                if not self._has_suspicious_uuid(xml_file):
+                    continue
+
                 root = lxml.etree.parse(str(xml_file)).getroot()
 
                 # Check all elements for ID attributes
@@ -97,7 +109,7 @@ class PPTXSchemaValidator(BaseSchemaValidator):
                             # Check if value looks like a UUID (has the right length and pattern structure)
                             if self._looks_like_uuid(value):
                                 # Validate that it contains only hex characters in the right positions
-                                if not uuid_pattern.match(value):
+                                if not UUID_PATTERN.match(value):
                                     errors.append(
                                         f"  {xml_file.relative_to(self.unpacked_dir)}: "
                                         f"Line {elem.sourceline}: ID '{value}' appears to be a UUID but contains invalid hex characters"
@@ -118,6 +130,19 @@ class PPTXSchemaValidator(BaseSchemaValidator):
                 print("PASSED - All UUID-like IDs contain valid hex values")
             return True
 
+    def _has_suspicious_uuid(self, xml_file):
+        """Check the raw text of a file for UUID-like ID values that are not valid UUIDs.
+
+        May report false positives (e.g. id="..." inside text content), which the
+        caller resolves with a full parse, but never misses an ID attribute.
+        """
+        text = xml_file.read_text(encoding="utf-8")
+        for match in ID_ATTRIBUTE_PATTERN.finditer(text):
+            value = html.unescape(match.group(1) if match.group(2) is None else match.group(2))
+            if self._looks_like_uuid(value) and not UUID_PATTERN.match(value):
+                return True
+        return False
+
     def _looks_like_uuid(self, value):
         """Check if a value has the general structure of a UUID."""
         # Remove common UUID delimiters
@@ -154,17 +179,12 @@ class PPTXSchemaValidator(BaseSchemaValidator):
                     )
                     continue
 
-                # Parse the relationships file
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
-
-                # Build a set of valid relationship IDs that point to slide layouts
-                valid_layout_rids = set()
-                for rel in rels_root.findall(
-                    f".//{{{self.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
-                ):
-                    rel_type = rel.get("Type", "")
-                    if "slideLayout" in rel_type:
-                        valid_layout_rids.add(rel.get("Id"))
+                # Valid relationship IDs that point to slide layouts
+                valid_layout_rids = {
+                    rid
+                    for rid, rel_type, _ in self._get_part_relationships(rels_file)
+                    if "slideLayout" in rel_type
+                }
 
                 # Find all sldLayoutId elements in the slide master
                 for sld_layout_id in root.findall(
@@ -202,22 +222,15 @@ class PPTXSchemaValidator(BaseSchemaValidator):
 
     def validate_no_duplicate_slide_layouts(self):
         """Validate that each slide has exactly one slideLayout reference."""
-        import lxml.etree
-
         errors = []
-        slide_rels_files = list(self.unpacked_dir.glob("ppt/slides/_rels/*.xml.rels"))
 
-        for rels_file in slide_rels_files:
+        for rels_file in self._get_slide_rels_files():
             try:
-                root = lxml.etree.parse(str(rels_file)).getroot()
-
                 # Find all slideLayout relationships
                 layout_rels = [
                     rel
-                    for rel in root.findall(
-                        f".//{{{self.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
-                    )
-                    if "slideLayout" in rel.get("Type", "")
+                    for rel in self._get_part_relationships(rels_file)
+                    if "slideLayout" in rel[1]
                 ]
 
                 if len(layout_rels) > 1:
@@ -242,13 +255,11 @@ class PPTXSchemaValidator(BaseSchemaValidator):
 
     def validate_notes_slide_references(self):
         """Validate that each notesSlide file is referenced by only one slide."""
-        import lxml.etree
-
         errors = []
         notes_slide_references = {}  # Track which slides reference each notesSlide
 
         # Find all slide relationship files
-        slide_rels_files = list(self.unpacked_dir.glob("ppt/slides/_rels/*.xml.rels"))
+        slide_rels_files = self._get_slide_rels_files()
 
         if not slide_rels_files:
             if self.verbose:
@@ -257,16 +268,9 @@ class PPTXSchemaValidator(BaseSchemaValidator):
 
         for rels_file in slide_rels_files:
             try:
-                # Parse the relationships file
-                root = lxml.etree.parse(str(rels_file)).getroot()
-
                 # Find all notesSlide relationships
-                for rel in root.findall(
-                    f".//{{{self.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
-                ):
-                    rel_type = rel.get("Type", "")
+                for _, rel_type, target in self._get_part_relationships(rels_file):
                     if "notesSlide" in rel_type:
-                        target = rel.get("Target", "")
                         if target:
                             # Normalize the target path to handle relative paths
                             normalized_target = target.replace("../", "")
@@ -282,7 +286,7 @@ class PPTXSchemaValidator(BaseSchemaValidator):
                                 (slide_name, rels_file)
                             )
 
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
+            except Exception as e:
                 errors.append(
                     f"  {rels_file.relative_to(self.unpacked_dir)}: Error: {e}"
                 )
@@ -310,6 +314,57 @@ class PPTXSchemaValidator(BaseSchemaValidator):
                 print("PASSED - All notes slide references are unique")
             return True
 
+    def _get_slide_rels_files(self):
+        """Relationship files of all slides (ppt/slides/_rels/*.xml.rels)."""
+        return [
+            rels_file
+            for rels_file in self._get_rels_index()
+            if rels_file.parent.parent.name == "slides"
+        ]
+
+    def _get_part_relationships(self, rels_file):
+        """Relationships of one slide, layout or master part from the rels index.
+
+        Returns:
+            list: (Id, Type, Target) tuples in document order
+
+        Raises:
+            Exception: The error raised while parsing rels_file, if any
+        """
+        relationships = self._get_rels_index()[rels_file]
+        if isinstance(relationships, Exception):
+            raise relationships
+        return relationships
+
+    def _get_rels_index(self):
+        """Parse the slide, layout and master .rels files once for all checks.
+
+        The slide -> layout -> master chain and notes links are all read from
+        these files, so a single sweep serves validate_slide_layout_ids,
+        validate_no_duplicate_slide_layouts and validate_notes_slide_references.
+
+        Returns:
+            dict: rels file path -> list of (Id, Type, Target), or the
+                exception raised while parsing that file
+        """
+        import lxml.etree
+
+        if getattr(self, "_rels_index", None) is None:
+            relationship_tag = f"{{{self.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
+            index = {}
+            for folder in ("slides", "slideLayouts", "slideMasters"):
+                for rels_file in self.unpacked_dir.glob(f"ppt/{folder}/_rels/*.xml.rels"):
+                    try:
+                        root = lxml.etree.parse(str(rels_file)).getroot()
+                        index[rels_file] = [
+                            (rel.get("Id"), rel.get("Type", ""), rel.get("Target", ""))
+                            for rel in root.iter(relationship_tag)
+                        ]
+                    except Exception as e:
+                        index[rels_file] = e
+            self._rels_index = index
+        return self._rels_index
+
 
 if __name__ == "__main__":
     raise RuntimeError("This module should not be run directly.")
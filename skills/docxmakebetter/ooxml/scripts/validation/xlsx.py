@@ -0,0 +1,539 @@
+"""
+Validator for Excel workbook XML files against XSD schemas.
+"""
+
+import os
+import re
+from pathlib import Path
+
+import lxml.etree
+
+from .base import BaseSchemaValidator
+
+# Characters Excel does not allow in sheet names
+INVALID_SHEET_NAME_CHARACTERS = set("[]:*?/\\")
+
+# Defined names start with a letter, underscore or backslash and continue with
+# letters, digits, underscores, periods, backslashes or question marks
+DEFINED_NAME_PATTERN = re.compile(r"^(?:[^\W\d]|\\)[\w.\\?]*$")
+
+# Defined names that would be read as a cell reference (A1, XFD1048576, R1C1, R, C)
+CELL_REFERENCE_PATTERN = re.compile(r"^(?:[A-Za-z]{1,3}\d+|[Rr]\d*[Cc]?\d*|[Cc]\d*)$")
+
+
+class XLSXSchemaValidator(BaseSchemaValidator):
+    """Validator for Excel workbook XML files against XSD schemas.
+
+    Worksheet parts can hold millions of cells, so they are not part of
+    xml_files (and therefore of the generic full-parse checks). They are read
+    once each by validate_worksheets with iterparse, clearing every row after
+    it has been checked, which keeps memory constant in the sheet size.
+
+    XSD validation needs the whole tree, so validate_worksheet_schemas checks
+    worksheets against sml.xsd one at a time, and only those up to
+    WORKSHEET_XSD_MAX_BYTES. Larger worksheets get the streaming checks only
+    and are listed as skipped.
+    """
+
+    # Excel main namespace
+    SPREADSHEETML_NAMESPACE = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+
+    # Excel-specific element to relationship type mappings
+    ELEMENT_RELATIONSHIP_TYPES = {
+        "drawing": "drawing",
+        "legacydrawing": "vmldrawing",
+        "legacydrawinghf": "vmldrawing",
+        "tablepart": "table",
+        "pivotcache": "pivotcachedefinition",
+        "externalreference": "externallink",
+    }
+
+    # Relationship types a <sheet> element in workbook.xml may point to
+    SHEET_RELATIONSHIP_TYPES = {
+        "worksheet",
+        "chartsheet",
+        "dialogsheet",
+        "xlMacrosheet",
+        "xlIntlMacrosheet",
+    }
+
+    # Invalid cell references reported per worksheet before summarizing the rest
+    MAX_CELL_ERRORS = 20
+
+    # Largest worksheet validated against the XSD; the tree takes about 20x the file size
+    WORKSHEET_XSD_MAX_BYTES = 10 * 1024 * 1024
+
+    def __init__(self, unpacked_dir, original_file, verbose=False):
+        super().__init__(unpacked_dir, original_file, verbose)
+
+        # Worksheets are kept out of the generic full-parse checks (see class docstring)
+        self.worksheet_files = [
+            f
+            for f in self.xml_files
+            if f.suffix == ".xml" and f.parent.name == "worksheets"
+        ]
+        worksheets = set(self.worksheet_files)
+        self.xml_files = [f for f in self.xml_files if f not in worksheets]
+
+    def validate(self):
+        """Run all validation checks and return True if all pass."""
+        # Test 0: XML well-formedness (worksheets are checked in Test 9)
+        if not self.validate_xml():
+            return False
+
+        # Test 1: Namespace declarations
+        all_valid = True
+        if not self.validate_namespaces():
+            all_valid = False
+
+        # Test 2: Unique IDs (includes sheetId uniqueness in workbook.xml)
+        if not self.validate_unique_ids():
+            all_valid = False
+
+        # Test 3: Relationship and file reference validation
+        if not self.validate_file_references():
+            all_valid = False
+
+        # Test 4: Content type declarations
+        if not self.validate_content_types():
+            all_valid = False
+
+        # Test 5: XSD schema validation
+        if not self.validate_against_xsd():
+            all_valid = False
+
+        # Test 6: Relationship ID reference validation
+        if not self.validate_all_relationship_ids():
+            all_valid = False
+
+        # Test 7: Sheet names, IDs and relationships
+        if not self.validate_sheets():
+            all_valid = False
+
+        # Test 8: Defined names
+        if not self.validate_defined_names():
+            all_valid = False
+
+        # Test 9: Streaming worksheet checks
+        if not self.validate_worksheets():
+            all_valid = False
+
+        # Test 10: XSD schema validation of worksheets, one at a time
+        if not self.validate_worksheet_schemas():
+            all_valid = False
+
+        return all_valid
+
+    def validate_sheets(self):
+        """Validate sheet names, sheetId values and sheet relationships in workbook.xml.
+
+        Duplicate sheetId values are reported by validate_unique_ids.
+        """
+        index = self._get_workbook_index()
+        if index["workbook"] is None:
+            print("FAILED - No workbook part found")
+            return False
+
+        errors = list(index["errors"])
+        workbook_path = index["workbook"].relative_to(self.unpacked_dir)
+        seen_names = {}
+
+        for sheet in index["sheets"]:
+            name = sheet["name"]
+            where = f"  {workbook_path}: Line {sheet['line']}:"
+
+            if not name:
+                errors.append(f"{where} Sheet has an empty name")
+            else:
+                if len(name) > 31:
+                    errors.append(f"{where} Sheet name '{name}' is longer than 31 characters")
+                invalid = sorted(INVALID_SHEET_NAME_CHARACTERS.intersection(name))
+                if invalid:
+                    errors.append(
+                        f"{where} Sheet name '{name}' contains invalid characters: {' '.join(invalid)}"
+                    )
+                if name.startswith("'") or name.endswith("'"):
+                    errors.append(
+                        f"{where} Sheet name '{name}' must not start or end with an apostrophe"
+                    )
+                # Sheet names are compared case-insensitively
+                key = name.casefold()
+                if key in seen_names:
+                    errors.append(
+                        f"{where} Duplicate sheet name '{name}' (first occurrence at line {seen_names[key]})"
+                    )
+                else:
+                    seen_names[key] = sheet["line"]
+
+            sheet_id = sheet["sheet_id"]
+            if not (sheet_id and sheet_id.isdigit() and int(sheet_id) > 0):
+                errors.append(
+                    f"{where} Sheet '{name}' has invalid sheetId '{sheet_id}' (must be a positive integer)"
+                )
+
+            # Missing r:ids are reported by validate_all_relationship_ids
+            rel = index["relationships"].get(sheet["rid"])
+            if rel and rel[0] not in self.SHEET_RELATIONSHIP_TYPES:
+                errors.append(
+                    f"{where} Sheet '{name}' references '{sheet['rid']}' which points to "
+                    f"'{rel[0]}' but should point to a worksheet or chartsheet relationship"
+                )
+
+        if errors:
+            print(f"FAILED - Found {len(errors)} sheet validation errors:")
+            for error in errors:
+                print(error)
+            return False
+        else:
+            if self.verbose:
+                print(f"PASSED - All {len(index['sheets'])} sheets are valid")
+            return True
+
+    def validate_defined_names(self):
+        """Validate defined name syntax, scope and uniqueness in workbook.xml."""
+        index = self._get_workbook_index()
+        if index["workbook"] is None:
+            # Already reported by validate_sheets
+            return False
+
+        errors = []
+        workbook_path = index["workbook"].relative_to(self.unpacked_dir)
+        sheet_count = len(index["sheets"])
+        seen = {}  # (casefolded name, localSheetId) -> line
+
+        for defined_name in index["defined_names"]:
+            name = defined_name["name"]
+            scope = defined_name["local_sheet_id"]
+            where = f"  {workbook_path}: Line {defined_name['line']}:"
+
+            if not name or not DEFINED_NAME_PATTERN.match(name):
+                errors.append(f"{where} Invalid defined name '{name}'")
+            elif CELL_REFERENCE_PATTERN.match(name):
+                errors.append(
+                    f"{where} Defined name '{name}' conflicts with a cell reference"
+                )
+
+            if scope is not None and not (
+                scope.isdigit() and int(scope) < sheet_count
+            ):
+                errors.append(
+                    f"{where} Defined name '{name}' has localSheetId '{scope}' "
+                    f"but the workbook has {sheet_count} sheets"
+                )
+
+            # Names are unique per scope, compared case-insensitively
+            key = (name.casefold(), scope)
+            if key in seen:
+                errors.append(
+                    f"{where} Duplicate defined name '{name}' "
+                    f"(first occurrence at line {seen[key]})"
+                )
+            else:
+                seen[key] = defined_name["line"]
+
+        if errors:
+            print(f"FAILED - Found {len(errors)} defined name validation errors:")
+            for error in errors:
+                print(error)
+            return False
+        else:
+            if self.verbose:
+                print(f"PASSED - All {len(index['defined_names'])} defined names are valid")
+            return True
+
+    def validate_worksheets(self):
+        """Stream every worksheet once and check it in constant memory.
+
+        Covers what the generic checks would otherwise do for worksheets
+        (well-formedness, Ignorable prefixes, r:id references, content type
+        declaration) and checks that shared-string cells (t="s") index an
+        existing entry in sharedStrings.xml.
+        """
+        index = self._get_workbook_index()
+        errors = []
+
+        for xml_file in self.worksheet_files:
+            try:
+                self._check_worksheet(xml_file, index, errors)
+            except lxml.etree.XMLSyntaxError as e:
+                errors.append(
+                    f"  {xml_file.relative_to(self.unpacked_dir)}: "
+                    f"Line {e.lineno}: {e.msg}"
+                )
+            except Exception as e:
+                errors.append(
+                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
+                )
+
+        if errors:
+            print(f"FAILED - Found {len(errors)} worksheet validation errors:")
+            for error in errors:
+                print(error)
+            return False
+        else:
+            if self.verbose:
+                print(
+                    f"PASSED - All {len(self.worksheet_files)} worksheets passed the "
+                    f"streaming checks ({index['shared_string_count']} shared strings)"
+                )
+            return True
+
+    def validate_worksheet_schemas(self):
+        """Validate worksheets against sml.xsd one at a time, reporting only new errors.
+
+        Worksheets larger than WORKSHEET_XSD_MAX_BYTES are not parsed into a
+        tree; they are listed as skipped, whatever the verbosity.
+        """
+        new_errors = []
+        skipped = []
+        validated = 0
+
+        for xml_file in self.worksheet_files:
+            relative_path = xml_file.relative_to(self.unpacked_dir)
+            if xml_file.stat().st_size > self.WORKSHEET_XSD_MAX_BYTES:
+                skipped.append(str(relative_path))
+                continue
+
+            is_valid, new_file_errors = self.validate_file_against_xsd(
+                xml_file, verbose=False
+            )
+            validated += 1
+            if is_valid:
+                continue
+            new_errors.append(f"  {relative_path}: {len(new_file_errors)} new error(s)")
+            for error in list(new_file_errors)[:3]:  # Show first 3 errors
+                new_errors.append(
+                    f"    - {error[:250]}..." if len(error) > 250 else f"    - {error}"
+                )
+
+        if skipped:
+            print(
+                f"SKIPPED - XSD validation of {len(skipped)} worksheet(s) larger than "
+                f"{self.WORKSHEET_XSD_MAX_BYTES / (1024 * 1024):g} MB (streaming checks only): "
+                + ", ".join(skipped)
+            )
+
+        if new_errors:
+            print("FAILED - Found NEW worksheet XSD validation errors:")
+            for error in new_errors:
+                print(error)
+            return False
+        else:
+            if self.verbose:
+                print(
+                    f"PASSED - No new XSD validation errors in {validated} of "
+                    f"{len(self.worksheet_files)} worksheets"
+                )
+            return True
+
+    def _get_schema_path(self, xml_file):
+        """Map worksheets to the SpreadsheetML schema; other parts as in the base class."""
+        if xml_file.parent.name == "worksheets" and xml_file.parent.parent.name == "xl":
+            return self.schemas_dir / self.SCHEMA_MAPPINGS["xl"]
+        return super()._get_schema_path(xml_file)
+
+    def _check_worksheet(self, xml_file, index, errors):
+        """Check one worksheet in a single iterparse pass, appending to errors."""
+        relative_path = xml_file.relative_to(self.unpacked_dir)
+        cell_tag = f"{{{self.SPREADSHEETML_NAMESPACE}}}c"
+        value_tag = f"{{{self.SPREADSHEETML_NAMESPACE}}}v"
+        row_tag = f"{{{self.SPREADSHEETML_NAMESPACE}}}row"
+        rid_attr = f"{{{self.OFFICE_RELATIONSHIPS_NAMESPACE}}}id"
+
+        shared_string_count = index["shared_string_count"]
+        check_shared_strings = shared_string_count is not None
+        rels_file = xml_file.parent / "_rels" / f"{xml_file.name}.rels"
+        relationship_ids = self._get_relationship_ids(rels_file)
+        bad_cells = 0
+
+        # Only cells and rows produce events; the rest of the tree is still
+        # built, and everything but sheetData is small
+        context = lxml.etree.iterparse(
+            str(xml_file), events=("end",), tag=(cell_tag, row_tag)
+        )
+        for _, elem in context:
+            if elem.tag == cell_tag:
+                if not check_shared_strings or elem.get("t") != "s":
+                    continue
+                value = elem.findtext(value_tag)
+                if value is None:
+                    continue
+                value = value.strip()
+                if value.isdigit() and int(value) < shared_string_count:
+                    continue
+                bad_cells += 1
+                if bad_cells <= self.MAX_CELL_ERRORS:
+                    errors.append(
+                        f"  {relative_path}: Line {elem.sourceline}: Cell {elem.get('r')} "
+                        f"references shared string '{value}' but sharedStrings.xml "
+                        f"has {shared_string_count} entries"
+                    )
+            else:
+                # Drop the checked row and the rows before it
+                elem.clear()
+                parent = elem.getparent()
+                while elem.getprevious() is not None:
+                    del parent[0]
+
+        if bad_cells > self.MAX_CELL_ERRORS:
+            errors.append(
+                f"  {relative_path}: ... and {bad_cells - self.MAX_CELL_ERRORS} more "
+                "invalid shared string references"
+            )
+
+        # What remains is the root with everything outside the cleared rows
+        root = context.root
+        for elem in root.iter(lxml.etree.Element):
+            rid = elem.get(rid_attr)
+            if rid is not None and rid not in relationship_ids:
+                elem_name = elem.tag.split("}")[-1] if "}" in elem.tag else elem.tag
+                errors.append(
+                    f"  {relative_path}: Line {elem.sourceline}: "
+                    f"<{elem_name}> references non-existent relationship '{rid}'"
+                )
+
+        declared = set(root.nsmap.keys()) - {None}
+        for attr_val in [v for k, v in root.attrib.items() if k.endswith("Ignorable")]:
+            errors.extend(
+                f"  {relative_path}: Namespace '{ns}' in Ignorable but not declared"
+                for ns in set(attr_val.split()) - declared
+            )
+        root_name = root.tag.split("}")[-1] if "}" in root.tag else root.tag
+        if root_name == "worksheet":
+            part_name = relative_path.as_posix()
+            if part_name not in index["declared_parts"]:
+                errors.append(
+                    f"  {part_name}: File with <{root_name}> root not declared in [Content_Types].xml"
+                )
+
+    def _get_relationship_ids(self, rels_file):
+        """Relationship IDs declared in a .rels file (empty if it does not exist)."""
+        if not rels_file.exists():
+            return set()
+        root = lxml.etree.parse(str(rels_file)).getroot()
+        return {
+            rel.get("Id")
+            for rel in root.iter(f"{{{self.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship")
+        }
+
+    def _get_relationships(self, rels_file):
+        """Map relationship Id -> (type name, resolved target path) for a .rels file."""
+        relationships = {}
+        if not rels_file.exists():
+            return relationships
+        root = lxml.etree.parse(str(rels_file)).getroot()
+        # Targets are relative to the part that owns the .rels file
+        base_dir = rels_file.parent.parent
+        for rel in root.iter(f"{{{self.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"):
+            target = rel.get("Target", "")
+            if rel.get("TargetMode") == "External":
+                target_path = None
+            elif target.startswith("/"):
+                target_path = self.unpacked_dir / target.lstrip("/")
+            else:
+                target_path = Path(os.path.normpath(base_dir / target))
+            relationships[rel.get("Id")] = (rel.get("Type", "").split("/")[-1], target_path)
+        return relationships
+
+    def _get_workbook_index(self):
+        """Read the workbook, its relationships and the shared-string count once.
+
+        Returns:
+            dict: {"workbook": Path or None, "sheets", "defined_names",
+                "relationships", "shared_string_count", "declared_parts",
+                "errors"}
+        """
+        if getattr(self, "_workbook_index", None) is not None:
+            return self._workbook_index
+
+        index = {
+            "workbook": None,
+            "sheets": [],
+            "defined_names": [],
+            "relationships": {},
+            "shared_string_count": 0,  # None if sharedStrings.xml is unreadable
+            "declared_parts": set(),
+            "errors": [],
+        }
+        self._workbook_index = index
+        main = f"{{{self.SPREADSHEETML_NAMESPACE}}}"
+
+        try:
+            content_types = lxml.etree.parse(
+                str(self.unpacked_dir / "[Content_Types].xml")
+            ).getroot()
+            index["declared_parts"] = {
+                override.get("PartName", "").lstrip("/")
+                for override in content_types.iter(
+                    f"{{{self.CONTENT_TYPES_NAMESPACE}}}Override"
+                )
+            }
+        except Exception:
+            pass  # Reported by validate_content_types
+
+        # The workbook is the package's officeDocument part
+        try:
+            package_rels = self._get_relationships(self.unpacked_dir / "_rels" / ".rels")
+        except Exception:
+            package_rels = {}  # Reported by validate_xml
+        for rel_type, target_path in package_rels.values():
+            if rel_type == "officeDocument" and target_path is not None:
+                index["workbook"] = target_path
+        if index["workbook"] is None or not index["workbook"].exists():
+            index["workbook"] = None
+            return index
+
+        workbook = index["workbook"]
+        try:
+            root = lxml.etree.parse(str(workbook)).getroot()
+            rid_attr = f"{{{self.OFFICE_RELATIONSHIPS_NAMESPACE}}}id"
+            index["sheets"] = [
+                {
+                    "name": sheet.get("name", ""),
+                    "sheet_id": sheet.get("sheetId"),
+                    "rid": sheet.get(rid_attr),
+                    "line": sheet.sourceline,
+                }
+                for sheet in root.iter(f"{main}sheet")
+            ]
+            index["defined_names"] = [
+                {
+                    "name": defined_name.get("name", ""),
+                    "local_sheet_id": defined_name.get("localSheetId"),
+                    "line": defined_name.sourceline,
+                }
+                for defined_name in root.iter(f"{main}definedName")
+            ]
+            index["relationships"] = self._get_relationships(
+                workbook.parent / "_rels" / f"{workbook.name}.rels"
+            )
+        except Exception as e:
+            index["errors"].append(
+                f"  {workbook.relative_to(self.unpacked_dir)}: Error: {e}"
+            )
+            return index
+
+        # Count the shared strings once; entries are cleared as they are counted
+        for rel_type, target_path in index["relationships"].values():
+            if rel_type != "sharedStrings" or target_path is None:
+                continue
+            try:
+                count = 0
+                for _, elem in lxml.etree.iterparse(
+                    str(target_path), events=("end",), tag=f"{main}si"
+                ):
+                    count += 1
+                    elem.clear()
+                    parent = elem.getparent()
+                    while elem.getprevious() is not None:
+                        del parent[0]
+                index["shared_string_count"] = count
+            except Exception:
+                # Reported by validate_xml; skip the index checks
+                index["shared_string_count"] = None
+
+        return index
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+Apply the same scripted edits to many Word documents in parallel.
+
+Usage:
+    from scripts.batch import run_batch
+
+    def edit(doc):
+        para = doc["word/document.xml"].get_node(tag="w:p", contains="Governing law")
+        doc.add_comment(start=para, end=para, text="Use the standard clause")
+
+    report = run_batch(["a.docx", "b.docx", "unpacked_c/"], edit, "out/", workers=4, seed=7)
+
+Command line (run from the docx skill root):
+    python -m scripts.batch --script my_edits:edit --output out/ --seed 7 contracts/*.docx
+
+Each document is opened in a worker process as a Document (used as a context
+manager so its temporary directory is removed even when the edit fails),
+passed to the edit script, and saved to the output directory: zipped inputs
+are written back as .docx files, unpacked inputs as directories. The edit
+script must be a module-level function so it can be sent to the workers.
+"""
+
+import argparse
+import hashlib
+import os
+import shutil
+import sys
+import tempfile
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+
+def batch_rsid(seed, path):
+    """Derive the RSID for a document from the batch seed and its path.
+
+    The same seed and path always give the same RSID, so re-running a batch
+    produces the same revision markup.
+
+    Args:
+        seed: Batch seed (any value with a stable str())
+        path: Document path as passed to run_batch
+
+    Returns:
+        str: 8-character uppercase hex RSID
+    """
+    digest = hashlib.sha256(f"{seed}:{Path(path).as_posix()}".encode("utf-8"))
+    return digest.hexdigest()[:8].upper()
+
+
+def run_batch(
+    documents,
+    edit_script,
+    output_dir,
+    workers=None,
+    seed=None,
+    validate=True,
+    **document_kwargs,
+):
+    """
+    Run an edit script over a list of documents in a process pool.
+
+    Args:
+        documents: Paths to .docx files or unpacked document directories
+        edit_script: Callable taking a Document; must be picklable (module-level)
+        output_dir: Directory for the edited documents, one entry per input.
+            When two inputs share a file name, every output keeps its path
+            relative to the inputs' common directory instead.
+        workers: Number of worker processes (default: os.cpu_count()). With 1,
+            documents are edited in this process, which helps when debugging.
+        seed: Optional seed. When given, each document gets an RSID derived from
+            the seed and its path, which also seeds the Document's ID allocator,
+            so repeated runs generate the same ids.
+        validate: If True, each document is validated when saved (default: True)
+        **document_kwargs: Passed to Document (author, initials, track_revisions)
+
+    Returns:
+        dict: {"documents": [...], "succeeded", "failed", "seconds"} where each
+            document entry is {"path", "output", "rsid", "ok", "seconds", "error"}
+            in input order; failed entries also carry the "traceback" text
+
+    Raises:
+        ValueError: If the same document is listed twice
+    """
+    documents = list(documents)
+    output_dir = Path(output_dir)
+    outputs = _output_paths(documents, output_dir)
+    for output in outputs:
+        output.parent.mkdir(parents=True, exist_ok=True)
+    jobs = [
+        (
+            str(path),
+            str(output),
+            batch_rsid(seed, path) if seed is not None else None,
+            edit_script,
+            validate,
+            document_kwargs,
+        )
+        for path, output in zip(documents, outputs)
+    ]
+
+    start = time.perf_counter()
+    if workers == 1:
+        results = [_run_job(job) for job in jobs]
+    else:
+        # Workers must import the script's module to unpickle it. Under forkserver
+        # they inherit sys.path from when the server started, which may be before
+        # _load_script added the script's directory
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_extend_sys_path,
+            initargs=(_import_root(edit_script),),
+        ) as pool:
+            results = list(pool.map(_run_job, jobs))
+    seconds = time.perf_counter() - start
+
+    succeeded = sum(1 for result in results if result["ok"])
+    return {
+        "documents": results,
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded,
+        "seconds": seconds,
+    }
+
+
+def _output_path(path, output_dir):
+    """Output location for a document: same name, under output_dir."""
+    path = Path(path)
+    return output_dir / (path.name if path.is_dir() else f"{path.stem}.docx")
+
+
+def _output_paths(documents, output_dir):
+    """
+    Output locations for all documents, without two inputs sharing one.
+
+    Inputs normally map to output_dir/<name>. If two inputs share a name
+    (a/contract.docx and b/contract.docx), every input keeps its directory
+    relative to the inputs' common directory (output_dir/a/contract.docx).
+
+    Raises:
+        ValueError: If the same document is listed twice
+    """
+    outputs = [_output_path(path, output_dir) for path in documents]
+    if len(set(outputs)) == len(outputs):
+        return outputs
+
+    resolved = [Path(path).resolve() for path in documents]
+    common = Path(os.path.commonpath([path.parent for path in resolved]))
+    outputs = [
+        _output_path(path, output_dir / path.parent.relative_to(common))
+        for path in resolved
+    ]
+    duplicates = sorted(
+        {str(path) for path, output in zip(documents, outputs) if outputs.count(output) > 1}
+    )
+    if duplicates:
+        raise ValueError(f"Documents listed more than once: {', '.join(duplicates)}")
+    return outputs
+
+
+def _import_root(edit_script):
+    """
+    sys.path entry the edit script's module was imported from, or None.
+
+    For a module inside a package this is the directory holding the top-level
+    package. Scripts defined in __main__ are handled by multiprocessing itself.
+    """
+    module_name = getattr(edit_script, "__module__", None)
+    module_file = getattr(sys.modules.get(module_name), "__file__", None)
+    if module_name in (None, "__main__") or module_file is None:
+        return None
+    root = Path(module_file).resolve().parent
+    if Path(module_file).name == "__init__.py":
+        root = root.parent
+    for _ in range(module_name.count(".")):
+        root = root.parent
+    return str(root)
+
+
+def _extend_sys_path(entry):
+    """Worker initializer: make the edit script's module importable."""
+    if entry is not None and entry not in sys.path:
+        sys.path.insert(0, entry)
+
+
+def _run_job(job):
+    """Open, edit and save one document; never raises."""
+    from ooxml.scripts.pack import pack_document
+    from ooxml.scripts.unpack import unpack_document
+
+    from .document import Document
+
+    path, output, rsid, edit_script, validate, document_kwargs = job
+    result = {
+        "path": path,
+        "output": output,
+        "rsid": rsid,
+        "ok": False,
+        "seconds": 0.0,
+        "error": None,
+    }
+    start = time.perf_counter()
+    work_dir = tempfile.mkdtemp(prefix="docx_batch_")
+    try:
+        source = Path(path)
+        if not source.is_dir():
+            source = unpack_document(path, Path(work_dir) / "source")
+        with Document(source, rsid=rsid, seed=rsid, **document_kwargs) as doc:
+            edit_script(doc)
+            if Path(path).is_dir():
+                doc.save(output, validate=validate)
+            else:
+                edited = Path(work_dir) / "edited"
+                doc.save(edited, validate=validate)
+                pack_document(edited, output, validate=False)
+        result["ok"] = True
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+        result["traceback"] = traceback.format_exc()
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+        result["seconds"] = time.perf_counter() - start
+    return result
+
+
+def _load_script(spec):
+    """Resolve "module:function" or "path/to/file.py:function" to a callable."""
+    import importlib
+
+    module_name, _, function_name = spec.rpartition(":")
+    if not module_name or not function_name:
+        raise ValueError(f"Expected module:function, got {spec!r}")
+    if module_name.endswith(".py"):
+        # Register under a stable name so worker processes can unpickle it
+        script_path = Path(module_name).resolve()
+        sys.path.insert(0, str(script_path.parent))
+        module_name = script_path.stem
+    return getattr(importlib.import_module(module_name), function_name)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Apply an edit script to many documents")
+    parser.add_argument("documents", nargs="+", help=".docx files or unpacked directories")
+    parser.add_argument("--script", required=True, help="Edit script as module:function")
+    parser.add_argument("--output", required=True, help="Output directory")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", default=None, help="Seed for deterministic RSIDs")
+    parser.add_argument("--author", default="Claude")
+    parser.add_argument("--initials", default="C")
+    parser.add_argument("--no-validate", action="store_true", help="Skip validation")
+    args = parser.parse_args()
+
+    report = run_batch(
+        args.documents,
+        _load_script(args.script),
+        args.output,
+        workers=args.workers,
+        seed=args.seed,
+        validate=not args.no_validate,
+        author=args.author,
+        initials=args.initials,
+    )
+
+    for result in report["documents"]:
+        status = "PASSED" if result["ok"] else "FAILED"
+        line = f"{status} - {result['path']} ({result['seconds']:.2f} s)"
+        if result["error"]:
+            line += f": {result['error']}"
+        print(line)
+    count = len(report["documents"])
+    print(f"{report['succeeded']}/{count} documents edited in {report['seconds']:.2f} s")
+    sys.exit(0 if report["failed"] == 0 else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,1263 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for the document library.
+
+Run from the docx skill root (the directory containing scripts/ and ooxml/):
+    python -m scripts.benchmark import-time
+    python -m scripts.benchmark import-time --budget-ms 150 --runs 10
+    python -m scripts.benchmark save-memory --paragraphs 200000
+    python -m scripts.benchmark parse-memory --paragraphs 50000
+    python -m scripts.benchmark text-lookup --paragraphs 5000 --queries 500
+    python -m scripts.benchmark comments --comments 10000
+    python -m scripts.benchmark reject-changes --paragraphs 2000
+    python -m scripts.benchmark change-queries --paragraphs 5000
+    python -m scripts.benchmark batch --documents 40 --workers 4
+    python -m scripts.benchmark paragraph-count --paragraphs 200000
+    python -m scripts.benchmark xsd-preprocess --paragraphs 30000
+    python -m scripts.benchmark pptx-validate --slides 1000
+    python -m scripts.benchmark xlsx-validate --rows 50000 --columns 20
+
+Each benchmark prints its measurements and exits non-zero when a gate fails,
+so it can be wired into CI to catch regressions.
+"""
+
+import argparse
+import re
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+# Skill root, used as the working directory for subprocess measurements
+SKILL_ROOT = Path(__file__).parent.parent
+
+# Modules that must not be loaded by a plain `import scripts.document`.
+# They are only needed at save/validation time and are imported on first use.
+DEFERRED_MODULES = (
+    "lxml",
+    "ooxml.scripts.pack",
+    "ooxml.scripts.validation",
+    "subprocess",
+)
+
+
+def measure_import_time(module="scripts.document"):
+    """Import a module in a fresh interpreter with -X importtime.
+
+    Args:
+        module: Dotted module name to import
+
+    Returns:
+        tuple: (cumulative_us, imported_modules) where cumulative_us is the
+            cumulative import time of the module in microseconds and
+            imported_modules is the set of all modules loaded along the way
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=SKILL_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr}")
+
+    cumulative_us = None
+    imported = set()
+    for line in result.stderr.splitlines():
+        # Format: "import time: <self> | <cumulative> | <indented name>"
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:") :].split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        name = parts[2].strip()
+        imported.add(name)
+        if name == module:
+            cumulative_us = int(parts[1])
+    return cumulative_us, imported
+
+
+def bench_import_time(args):
+    """Gate import time and deferred imports of scripts.document."""
+    timings = []
+    imported = set()
+    for _ in range(args.runs):
+        cumulative_us, imported = measure_import_time(args.module)
+        timings.append(cumulative_us)
+
+    best_ms = min(timings) / 1000
+    median_ms = sorted(timings)[len(timings) // 2] / 1000
+    print(f"{args.module}: best {best_ms:.1f} ms, median {median_ms:.1f} ms")
+
+    failures = []
+    eager = sorted(
+        name
+        for name in imported
+        if any(name == m or name.startswith(m + ".") for m in DEFERRED_MODULES)
+    )
+    if eager:
+        failures.append(f"Deferred modules imported eagerly: {', '.join(eager)}")
+    if best_ms > args.budget_ms:
+        failures.append(
+            f"Import time {best_ms:.1f} ms exceeds budget of {args.budget_ms:.1f} ms"
+        )
+
+    if failures:
+        print("FAILED - " + "\n         ".join(failures))
+        return False
+    print("PASSED - Import time within budget")
+    return True
+
+
+def write_synthetic_document(path, paragraphs, tracked=False):
+    """Write a pretty-printed word/document.xml with the given number of paragraphs.
+
+    Args:
+        path: Output file path
+        paragraphs: Number of w:p elements to generate
+        tracked: If True, every paragraph also gets a tracked insertion and a
+            tracked deletion by "Reviewer"
+    """
+    with open(path, "w", encoding="ascii") as f:
+        f.write('<?xml version="1.0" encoding="ascii"?>\n')
+        f.write(
+            '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">\n'
+            "  <w:body>\n"
+        )
+        for i in range(paragraphs):
+            f.write(
+                '    <w:p w:rsidR="00A1B2C3" w:rsidRDefault="00A1B2C3">\n'
+                '      <w:r w:rsidRPr="00D4E5F6">\n'
+                '        <w:rPr><w:b/><w:sz w:val="24"/></w:rPr>\n'
+                f"        <w:t>Paragraph {i} &#8220;quoted&#8221; clause text</w:t>\n"
+                "      </w:r>\n"
+            )
+            if tracked:
+                f.write(
+                    f'      <w:ins w:id="{2 * i}" w:author="Reviewer" w:date="2025-01-01T00:00:00Z">\n'
+                    f"        <w:r><w:t xml:space=\"preserve\"> inserted {i}</w:t></w:r>\n"
+                    "      </w:ins>\n"
+                    f'      <w:del w:id="{2 * i + 1}" w:author="Reviewer" w:date="2025-01-01T00:00:00Z">\n'
+                    f"        <w:r><w:delText xml:space=\"preserve\"> deleted {i}</w:delText></w:r>\n"
+                    "      </w:del>\n"
+                )
+            f.write("    </w:p>\n")
+        f.write("  </w:body>\n</w:document>\n")
+
+
+def write_synthetic_package(root, paragraphs):
+    """Write a minimal unpacked .docx directory with a synthetic document.xml.
+
+    Args:
+        root: Output directory
+        paragraphs: Number of w:p elements to generate
+    """
+    root = Path(root)
+    (root / "_rels").mkdir(parents=True, exist_ok=True)
+    (root / "word" / "_rels").mkdir(parents=True, exist_ok=True)
+    (root / "[Content_Types].xml").write_text(
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">\n'
+        '  <Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>\n'
+        '  <Default Extension="xml" ContentType="application/xml"/>\n'
+        '  <Override PartName="/word/document.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>\n'
+        '  <Override PartName="/word/settings.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.settings+xml"/>\n'
+        "</Types>\n"
+    )
+    (root / "_rels" / ".rels").write_text(
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">\n'
+        '  <Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="word/document.xml"/>\n'
+        "</Relationships>\n"
+    )
+    (root / "word" / "_rels" / "document.xml.rels").write_text(
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">\n'
+        '  <Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/settings" Target="settings.xml"/>\n'
+        "</Relationships>\n"
+    )
+    (root / "word" / "settings.xml").write_text(
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<w:settings xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">\n'
+        '  <w:defaultTabStop w:val="720"/>\n'
+        "  <w:compat/>\n"
+        "</w:settings>\n"
+    )
+    write_synthetic_document(root / "word" / "document.xml", paragraphs)
+
+
+_PML = "http://schemas.openxmlformats.org/presentationml/2006/main"
+_DML = "http://schemas.openxmlformats.org/drawingml/2006/main"
+_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_PKG = "http://schemas.openxmlformats.org/package/2006/relationships"
+_PPT_TYPE = "application/vnd.openxmlformats-officedocument.presentationml"
+
+
+def write_synthetic_deck(root, slides):
+    """Write a minimal unpacked .pptx with one master, one layout and notes per slide.
+
+    Every slide shape carries an a16:creationId UUID, as PowerPoint writes them.
+
+    Args:
+        root: Output directory
+        slides: Number of slides to generate
+    """
+    root = Path(root)
+    for folder in ("_rels", "ppt/_rels", "ppt/slides/_rels", "ppt/notesSlides/_rels",
+                   "ppt/slideLayouts/_rels", "ppt/slideMasters/_rels", "ppt/theme"):
+        (root / folder).mkdir(parents=True, exist_ok=True)
+
+    def rels(path, entries):
+        body = "".join(
+            f'<Relationship Id="{rid}" Type="{_REL}/{rel_type}" Target="{target}"/>'
+            for rid, rel_type, target in entries
+        )
+        (root / path).write_text(
+            f'<?xml version="1.0" encoding="UTF-8"?>\n<Relationships xmlns="{_PKG}">{body}</Relationships>'
+        )
+
+    def shape_tree(text):
+        return (
+            '<p:cSld><p:spTree><p:nvGrpSpPr><p:cNvPr id="1" name=""/><p:cNvGrpSpPr/><p:nvPr/>'
+            "</p:nvGrpSpPr><p:grpSpPr/>"
+            f'<p:sp><p:nvSpPr><p:cNvPr id="2" name="Title 1"/><p:cNvSpPr/><p:nvPr/></p:nvSpPr>'
+            f"<p:spPr/><p:txBody><a:bodyPr/><a:p><a:r><a:t>{text}</a:t></a:r></a:p></p:txBody></p:sp>"
+            "</p:spTree></p:cSld>"
+        )
+
+    ns = f'xmlns:a="{_DML}" xmlns:r="{_REL}" xmlns:p="{_PML}"'
+    overrides = [
+        ("/ppt/presentation.xml", f"{_PPT_TYPE}.presentation.main+xml"),
+        ("/ppt/slideMasters/slideMaster1.xml", f"{_PPT_TYPE}.slideMaster+xml"),
+        ("/ppt/slideLayouts/slideLayout1.xml", f"{_PPT_TYPE}.slideLayout+xml"),
+        ("/ppt/theme/theme1.xml", "application/vnd.openxmlformats-officedocument.theme+xml"),
+    ]
+    slide_ids = []
+    for i in range(1, slides + 1):
+        uuid = f"{{{i:08X}-1A2B-4C3D-8E9F-{i:012X}}}"
+        (root / f"ppt/slides/slide{i}.xml").write_text(
+            f'<?xml version="1.0" encoding="UTF-8"?>\n<p:sld {ns}>'
+            + shape_tree(f"Slide {i}").replace(
+                '<p:cNvPr id="2" name="Title 1"/>',
+                '<p:cNvPr id="2" name="Title 1"><a:extLst><a:ext uri="{FF2B5EF4-FFF2-40B4-BE49-F238E27FC236}">'
+                '<a16:creationId xmlns:a16="http://schemas.microsoft.com/office/drawing/2014/main"'
+                f' id="{uuid}"/></a:ext></a:extLst></p:cNvPr>',
+            )
+            + "</p:sld>"
+        )
+        rels(
+            f"ppt/slides/_rels/slide{i}.xml.rels",
+            [("rId1", "slideLayout", "../slideLayouts/slideLayout1.xml"),
+             ("rId2", "notesSlide", f"../notesSlides/notesSlide{i}.xml")],
+        )
+        (root / f"ppt/notesSlides/notesSlide{i}.xml").write_text(
+            f'<?xml version="1.0" encoding="UTF-8"?>\n<p:notes {ns}>{shape_tree(f"Notes {i}")}</p:notes>'
+        )
+        rels(f"ppt/notesSlides/_rels/notesSlide{i}.xml.rels",
+             [("rId1", "slide", f"../slides/slide{i}.xml")])
+        overrides.append((f"/ppt/slides/slide{i}.xml", f"{_PPT_TYPE}.slide+xml"))
+        overrides.append((f"/ppt/notesSlides/notesSlide{i}.xml", f"{_PPT_TYPE}.notesSlide+xml"))
+        slide_ids.append(f'<p:sldId id="{255 + i}" r:id="rId{i + 2}"/>')
+
+    (root / "ppt/presentation.xml").write_text(
+        f'<?xml version="1.0" encoding="UTF-8"?>\n<p:presentation {ns}>'
+        '<p:sldMasterIdLst><p:sldMasterId id="2147483648" r:id="rId1"/></p:sldMasterIdLst>'
+        f'<p:sldIdLst>{"".join(slide_ids)}</p:sldIdLst>'
+        '<p:sldSz cx="12192000" cy="6858000"/><p:notesSz cx="6858000" cy="9144000"/>'
+        "</p:presentation>"
+    )
+    rels(
+        "ppt/_rels/presentation.xml.rels",
+        [("rId1", "slideMaster", "slideMasters/slideMaster1.xml"),
+         ("rId2", "theme", "theme/theme1.xml")]
+        + [(f"rId{i + 2}", "slide", f"slides/slide{i}.xml") for i in range(1, slides + 1)],
+    )
+    (root / "ppt/slideMasters/slideMaster1.xml").write_text(
+        f'<?xml version="1.0" encoding="UTF-8"?>\n<p:sldMaster {ns}>{shape_tree("Master")}'
+        '<p:clrMap bg1="lt1" tx1="dk1" bg2="lt2" tx2="dk2" accent1="accent1" accent2="accent2"'
+        ' accent3="accent3" accent4="accent4" accent5="accent5" accent6="accent6" hlink="hlink"'
+        ' folHlink="folHlink"/>'
+        '<p:sldLayoutIdLst><p:sldLayoutId id="2147483649" r:id="rId1"/></p:sldLayoutIdLst>'
+        "</p:sldMaster>"
+    )
+    rels("ppt/slideMasters/_rels/slideMaster1.xml.rels",
+         [("rId1", "slideLayout", "../slideLayouts/slideLayout1.xml"),
+          ("rId2", "theme", "../theme/theme1.xml")])
+    (root / "ppt/slideLayouts/slideLayout1.xml").write_text(
+        f'<?xml version="1.0" encoding="UTF-8"?>\n<p:sldLayout {ns}>{shape_tree("Layout")}</p:sldLayout>'
+    )
+    rels("ppt/slideLayouts/_rels/slideLayout1.xml.rels",
+         [("rId1", "slideMaster", "../slideMasters/slideMaster1.xml")])
+    (root / "ppt/theme/theme1.xml").write_text(
+        f'<?xml version="1.0" encoding="UTF-8"?>\n<a:theme xmlns:a="{_DML}" name="Office"/>'
+    )
+    rels("_rels/.rels", [("rId1", "officeDocument", "ppt/presentation.xml")])
+    (root / "[Content_Types].xml").write_text(
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        f'<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        + "".join(f'<Override PartName="{part}" ContentType="{ctype}"/>' for part, ctype in overrides)
+        + "</Types>"
+    )
+
+
+_SML = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_XLSX_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml"
+
+
+def write_synthetic_workbook(root, rows, columns, unique_strings=1000, bad_index=False):
+    """Write a minimal unpacked .xlsx with one large worksheet.
+
+    Even columns hold numbers, odd columns shared-string references, and the
+    workbook has two defined names.
+
+    Args:
+        root: Output directory
+        rows: Number of worksheet rows
+        columns: Cells per row (at most 26)
+        unique_strings: Number of entries in sharedStrings.xml
+        bad_index: If True, the last cell of the last row references a shared
+            string past the end of sharedStrings.xml
+    """
+    root = Path(root)
+    for folder in ("_rels", "xl/_rels", "xl/worksheets"):
+        (root / folder).mkdir(parents=True, exist_ok=True)
+
+    def rels(path, entries):
+        body = "".join(
+            f'<Relationship Id="{rid}" Type="{_REL}/{rel_type}" Target="{target}"/>'
+            for rid, rel_type, target in entries
+        )
+        (root / path).write_text(
+            f'<?xml version="1.0" encoding="UTF-8"?>\n<Relationships xmlns="{_PKG}">{body}</Relationships>'
+        )
+
+    letters = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"[:columns]
+    with open(root / "xl/worksheets/sheet1.xml", "w", encoding="ascii") as f:
+        f.write(
+            f'<?xml version="1.0" encoding="UTF-8"?>\n<worksheet xmlns="{_SML}" xmlns:r="{_REL}">'
+            f'<dimension ref="A1:{letters[-1]}{rows}"/><sheetData>\n'
+        )
+        for r in range(1, rows + 1):
+            cells = []
+            for c, letter in enumerate(letters):
+                if c % 2:
+                    index = (r * columns + c) % unique_strings
+                    if bad_index and r == rows and c == columns - 1:
+                        index = unique_strings
+                    cells.append(f'<c r="{letter}{r}" t="s"><v>{index}</v></c>')
+                else:
+                    cells.append(f'<c r="{letter}{r}"><v>{r * c}</v></c>')
+            f.write(f'<row r="{r}">{"".join(cells)}</row>\n')
+        f.write("</sheetData></worksheet>\n")
+
+    strings = "".join(f"<si><t>Label {i}</t></si>" for i in range(unique_strings))
+    (root / "xl/sharedStrings.xml").write_text(
+        f'<?xml version="1.0" encoding="UTF-8"?>\n<sst xmlns="{_SML}" '
+        f'count="{rows * (columns // 2)}" uniqueCount="{unique_strings}">{strings}</sst>'
+    )
+    (root / "xl/workbook.xml").write_text(
+        f'<?xml version="1.0" encoding="UTF-8"?>\n<workbook xmlns="{_SML}" xmlns:r="{_REL}">'
+        '<sheets><sheet name="Data" sheetId="1" r:id="rId1"/></sheets>'
+        "<definedNames>"
+        f'<definedName name="Totals">Data!$A$1:$A${rows}</definedName>'
+        f'<definedName name="_xlnm.Print_Area" localSheetId="0">Data!$A$1:${letters[-1]}${rows}</definedName>'
+        "</definedNames></workbook>"
+    )
+    rels("xl/_rels/workbook.xml.rels",
+         [("rId1", "worksheet", "worksheets/sheet1.xml"),
+          ("rId2", "sharedStrings", "sharedStrings.xml")])
+    rels("_rels/.rels", [("rId1", "officeDocument", "xl/workbook.xml")])
+    (root / "[Content_Types].xml").write_text(
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        f'<Override PartName="/xl/workbook.xml" ContentType="{_XLSX_TYPE}.sheet.main+xml"/>'
+        f'<Override PartName="/xl/worksheets/sheet1.xml" ContentType="{_XLSX_TYPE}.worksheet+xml"/>'
+        f'<Override PartName="/xl/sharedStrings.xml" ContentType="{_XLSX_TYPE}.sharedStrings+xml"/>'
+        "</Types>"
+    )
+
+
+def _peak_memory(func):
+    """Run func under tracemalloc and return (peak_bytes, seconds)."""
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    start = time.perf_counter()
+    func()
+    seconds = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak, seconds
+
+
+def bench_save_memory(args):
+    """Compare peak memory of streaming XMLEditor.save against dom.toxml."""
+    from .utilities import XMLEditor
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        xml_path = Path(temp_dir) / "document.xml"
+        write_synthetic_document(xml_path, args.paragraphs)
+        size_mb = xml_path.stat().st_size / 1e6
+        editor = XMLEditor(xml_path)
+
+        legacy_path = Path(temp_dir) / "legacy.xml"
+
+        def legacy_save():
+            legacy_path.write_bytes(editor.dom.toxml(encoding=editor.encoding))
+
+        legacy_peak, legacy_seconds = _peak_memory(legacy_save)
+        stream_peak, stream_seconds = _peak_memory(editor.save)
+        identical = legacy_path.read_bytes() == xml_path.read_bytes()
+
+    print(f"document.xml: {size_mb:.1f} MB, {args.paragraphs} paragraphs")
+    print(f"  toxml + write_bytes: peak {legacy_peak / 1e6:8.1f} MB, {legacy_seconds:.2f} s")
+    print(f"  streaming save:      peak {stream_peak / 1e6:8.1f} MB, {stream_seconds:.2f} s")
+    if not identical:
+        print("FAILED - Streaming output differs from dom.toxml output")
+        return False
+    if stream_peak >= legacy_peak:
+        print("FAILED - Streaming save did not reduce peak memory")
+        return False
+    print("PASSED - Output identical, peak memory reduced")
+    return True
+
+
+def _parse_with_position_tuples(xml_path):
+    """Parse like the original line-tracking parser: a tuple attribute per element.
+
+    Used as the baseline for bench_parse_memory.
+    """
+    import defusedxml.minidom
+    import defusedxml.sax
+
+    def set_content_handler(dom_handler):
+        def startElementNS(name, tagName, attrs):
+            orig_start_cb(name, tagName, attrs)
+            dom_handler.elementStack[-1].parse_position = (
+                parser._parser.CurrentLineNumber,  # type: ignore
+                parser._parser.CurrentColumnNumber,  # type: ignore
+            )
+
+        orig_start_cb = dom_handler.startElementNS
+        dom_handler.startElementNS = startElementNS
+        orig_set_content_handler(dom_handler)
+
+    parser = defusedxml.sax.make_parser()
+    orig_set_content_handler = parser.setContentHandler
+    parser.setContentHandler = set_content_handler  # type: ignore
+    return defusedxml.minidom.parse(str(xml_path), parser)
+
+
+def _retained_memory(func):
+    """Run func under tracemalloc and return (result, retained_bytes, seconds)."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    seconds = time.perf_counter() - start
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, retained, seconds
+
+
+def bench_parse_memory(args):
+    """Compare memory retained by the XMLEditor tree against per-element tuples."""
+    from .utilities import XMLEditor
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        xml_path = Path(temp_dir) / "document.xml"
+        write_synthetic_document(xml_path, args.paragraphs)
+        size_mb = xml_path.stat().st_size / 1e6
+
+        legacy_dom, legacy_bytes, legacy_seconds = _retained_memory(
+            lambda: _parse_with_position_tuples(xml_path)
+        )
+        legacy_xml = legacy_dom.toxml()
+        legacy_elements = legacy_dom.getElementsByTagName("*")
+        element_count = len(legacy_elements)
+
+        editor, compact_bytes, compact_seconds = _retained_memory(
+            lambda: XMLEditor(xml_path)
+        )
+        identical = editor.dom.toxml() == legacy_xml
+        elements = editor.dom.getElementsByTagName("*")
+        same_positions = [e.parse_position for e in elements] == [
+            e.parse_position for e in legacy_elements
+        ]
+        same_text = all(
+            editor._get_element_text(e) == editor._get_element_text(legacy)
+            for e, legacy in zip(elements, legacy_elements)
+            if e.tagName == "w:p"
+        )
+        del legacy_dom, legacy_elements
+        last_p = editor.dom.getElementsByTagName("w:p")[-1]
+        found = editor.get_node(tag="w:p", line_number=last_p.parse_position[0])
+
+    ratio = legacy_bytes / compact_bytes
+    print(f"document.xml: {size_mb:.1f} MB, {element_count} elements")
+    print(
+        f"  tuple attributes: {legacy_bytes / 1e6:8.1f} MB "
+        f"({legacy_bytes / element_count:.0f} B/element), {legacy_seconds:.2f} s"
+    )
+    print(
+        f"  compact tree:     {compact_bytes / 1e6:8.1f} MB "
+        f"({compact_bytes / element_count:.0f} B/element), {compact_seconds:.2f} s"
+    )
+    print(f"  reduction:        {ratio:.2f}x")
+    if not identical:
+        print("FAILED - Compact tree serializes differently")
+        return False
+    if found is not last_p:
+        print("FAILED - Line-number lookup returned the wrong element")
+        return False
+    if not same_positions:
+        print("FAILED - Parse positions differ from the tuple baseline")
+        return False
+    if not same_text:
+        print("FAILED - Paragraph text differs from the tuple baseline")
+        return False
+    if ratio < args.min_ratio:
+        print(f"FAILED - Reduction below {args.min_ratio:.1f}x")
+        return False
+    print("PASSED - Output, positions and text identical, memory reduced")
+    return True
+
+
+def bench_text_lookup(args):
+    """Compare get_node(contains=...) against a full text scan, with edits in between."""
+    import random
+
+    from .utilities import XMLEditor
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        xml_path = Path(temp_dir) / "document.xml"
+        write_synthetic_document(xml_path, args.paragraphs)
+        editor = XMLEditor(xml_path)
+
+    rng = random.Random(0)
+    targets = [rng.randrange(args.paragraphs) for _ in range(args.queries)]
+
+    def scan(tag, text):
+        return [
+            elem
+            for elem in editor.dom.getElementsByTagName(tag)
+            if text in editor._get_element_text(elem)
+        ]
+
+    start = time.perf_counter()
+    expected = [scan("w:p", f"Paragraph {i} \u201c") for i in targets]
+    scan_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    found = [editor.get_node(tag="w:p", contains=f"Paragraph {i} &#8220;") for i in targets]
+    index_seconds = time.perf_counter() - start
+
+    # Edit every tenth target, through the editor and by writing Text.data
+    # directly, and look it up again through the updated index
+    start = time.perf_counter()
+    edited_ok = True
+    for n, i in enumerate(targets[::10]):
+        para = editor.get_node(tag="w:p", contains=f"Paragraph {i} &#8220;")
+        if n % 2:
+            editor.append_to(para, f"<w:r><w:t>edit {n}</w:t></w:r>")
+        else:
+            text_node = para.getElementsByTagName("w:t")[0].firstChild
+            text_node.data = f"edit {n} {text_node.data}"
+        edited_ok &= editor.get_node(tag="w:p", contains=f"edit {n}") is para
+    edit_seconds = time.perf_counter() - start
+
+    print(f"{args.paragraphs} paragraphs, {args.queries} contains= queries")
+    print(f"  full text scan:   {scan_seconds:.2f} s")
+    print(f"  text index:       {index_seconds:.2f} s (including build)")
+    print(f"  edit + re-query:  {edit_seconds:.2f} s for {len(targets[::10])} edits")
+    if [[elem] for elem in found] != expected or not edited_ok:
+        print("FAILED - Indexed lookups differ from a full scan")
+        return False
+    if index_seconds >= scan_seconds:
+        print("FAILED - Text index is not faster than scanning")
+        return False
+    print("PASSED - Results identical, lookups faster")
+    return True
+
+
+def _time_comments(count, paragraphs):
+    """Add count comments (every other one a reply) and save; return (add_s, save_s)."""
+    from .document import Document
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        source = Path(temp_dir) / "unpacked"
+        write_synthetic_package(source, paragraphs)
+        doc = Document(source, rsid="00BE0C11")
+        paras = doc["word/document.xml"].dom.getElementsByTagName("w:p")
+
+        start = time.perf_counter()
+        for i in range(count):
+            if i % 2:
+                doc.reply_to_comment(parent_comment_id=i - 1, text=f"Reply {i}")
+            else:
+                para = paras[i % len(paras)]
+                doc.add_comment(start=para, end=para, text=f"Comment {i}")
+        add_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        doc.save(Path(temp_dir) / "saved", validate=False)
+        save_seconds = time.perf_counter() - start
+
+        saved = (Path(temp_dir) / "saved" / "word" / "comments.xml").read_text()
+        if saved.count("<w:comment ") != count:
+            raise RuntimeError("Saved comments.xml does not contain every comment")
+    return add_seconds, save_seconds
+
+
+def bench_comments(args):
+    """Check that adding comments and replies scales linearly."""
+    small = max(args.comments // 4, 1)
+    results = {}
+    for count in (small, args.comments):
+        add_seconds, save_seconds = _time_comments(count, args.paragraphs)
+        results[count] = add_seconds + save_seconds
+        print(
+            f"{count:6d} comments: add {add_seconds:6.2f} s, save {save_seconds:6.2f} s, "
+            f"{(add_seconds + save_seconds) / count * 1e3:.2f} ms/comment"
+        )
+
+    growth = (results[args.comments] / args.comments) / (results[small] / small)
+    print(f"  per-comment cost growth ({small} -> {args.comments}): {growth:.2f}x")
+    if growth > args.max_growth:
+        print(f"FAILED - Per-comment cost grew more than {args.max_growth:.1f}x")
+        return False
+    print("PASSED - Comment cost scales linearly")
+    return True
+
+
+def bench_reject_changes(args):
+    """Compare reject_changes against per-change revert_insertion/revert_deletion."""
+    from .document import DocxXMLEditor
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        xml_path = Path(temp_dir) / "document.xml"
+        write_synthetic_document(xml_path, args.paragraphs, tracked=True)
+
+        editor = DocxXMLEditor(xml_path, rsid="00BE0C11")
+        start = time.perf_counter()
+        for ins in list(editor.dom.getElementsByTagName("w:ins")):
+            editor.revert_insertion(ins)
+        for del_elem in list(editor.dom.getElementsByTagName("w:del")):
+            if del_elem.getAttribute("w:author") == "Reviewer":
+                editor.revert_deletion(del_elem)
+        per_change_seconds = time.perf_counter() - start
+        per_change_xml = editor.dom.toxml()
+
+        editor = DocxXMLEditor(xml_path, rsid="00BE0C11")
+        report = editor.reject_changes(author="Reviewer")
+        bulk_xml = editor.dom.toxml()
+
+    # Dates differ between runs and change IDs are handed out in a different
+    # order; compare everything else and check that IDs stay unique
+    normalize = lambda xml: re.sub(r'(w:id|w:date|w16du:dateUtc)="[^"]*"', "", xml)
+    identical = normalize(per_change_xml) == normalize(bulk_xml)
+    ids = re.findall(r'<w:(?:ins|del) w:id="(\d+)"', bulk_xml)
+    identical &= len(ids) == len(set(ids))
+
+    print(f"{args.paragraphs} paragraphs, {args.paragraphs * 2} tracked changes")
+    print(f"  revert_* per change: {per_change_seconds:.2f} s")
+    print(
+        f"  reject_changes:      {report['seconds']:.2f} s "
+        f"({report['insertions']} insertions, {report['deletions']} deletions)"
+    )
+    if not identical:
+        print("FAILED - reject_changes output differs from per-change reverts")
+        return False
+    print("PASSED - Output identical")
+    return True
+
+
+def bench_change_queries(args):
+    """Compare tracked-change queries through the index against full DOM scans."""
+    from .document import DocxXMLEditor, _parse_change_date
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        xml_path = Path(temp_dir) / "document.xml"
+        write_synthetic_document(xml_path, args.paragraphs, tracked=True)
+        editor = DocxXMLEditor(xml_path, rsid="00BE0C11")
+
+    since = "2024-06-01T00:00:00Z"
+    window = max(args.paragraphs // 100, 1)
+
+    def scan_changes():
+        return [
+            elem
+            for elem in editor.dom.getElementsByTagName("*")
+            if elem.tagName in ("w:ins", "w:del")
+        ]
+
+    def scan(query):
+        changes = scan_changes()
+        if query == "author":
+            return [c for c in changes if c.getAttribute("w:author") == "Reviewer"]
+        if query == "since":
+            limit = _parse_change_date(since)
+            dated = [(_parse_change_date(c.getAttribute("w:date")), c) for c in changes]
+            # iter_changes_since yields oldest first; sorted() is stable for equal dates
+            return [c for date, c in sorted(dated, key=lambda item: item[0]) if date > limit]
+        paras = set(editor.dom.getElementsByTagName("w:p")[window : 2 * window])
+        selected = []
+        for change in changes:
+            para = change.parentNode
+            while para is not None and para.nodeName != "w:p":
+                para = para.parentNode
+            if para in paras:
+                selected.append(change)
+        return selected
+
+    def indexed(query):
+        if query == "author":
+            return list(editor.iter_changes_by_author("Reviewer"))
+        if query == "since":
+            return list(editor.iter_changes_since(since))
+        return [c for _, c in editor.iter_changes_in_paragraphs(window, 2 * window)]
+
+    queries = ["author", "since", "paragraphs"] * (args.queries // 3)
+
+    start = time.perf_counter()
+    expected = [scan(query) for query in queries]
+    scan_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    found = [indexed(query) for query in queries]
+    index_seconds = time.perf_counter() - start
+
+    # Reject a slice of changes and check the index followed the edit
+    editor.reject_changes(change_ids=range(0, args.paragraphs, 2))
+    edited_ok = all(indexed(query) == scan(query) for query in ("author", "since", "paragraphs"))
+
+    # Interleave text edits and author changes with queries; neither should
+    # make the next query rescan the document
+    texts = editor.dom.getElementsByTagName("w:t")
+    changes = scan_changes()
+    rounds = min(len(queries), len(texts), len(changes))
+    start = time.perf_counter()
+    for i in range(rounds):
+        texts[i].firstChild.data += " edited"
+        changes[i].setAttribute("w:author", "Reviewer" if i % 2 else "Editor")
+        indexed(queries[i])
+    edit_seconds = time.perf_counter() - start
+    edited_ok = edited_ok and all(
+        indexed(query) == scan(query) for query in ("author", "since", "paragraphs")
+    )
+
+    print(f"{args.paragraphs} paragraphs, {len(queries)} change queries")
+    print(f"  full DOM scan:  {scan_seconds:.2f} s")
+    print(f"  change index:   {index_seconds:.2f} s (including build)")
+    print(f"  edit + query:   {edit_seconds:.2f} s for {rounds} edits")
+    if found != expected or not edited_ok:
+        print("FAILED - Indexed queries differ from a full scan")
+        return False
+    if index_seconds >= scan_seconds:
+        print("FAILED - Change index is not faster than scanning")
+        return False
+    if edit_seconds >= scan_seconds * rounds / len(queries):
+        print("FAILED - Queries after edits are not faster than scanning")
+        return False
+    print("PASSED - Results identical, queries faster")
+    return True
+
+
+def _batch_edit(doc):
+    """Edit script for the batch benchmark: one comment and one deletion."""
+    editor = doc["word/document.xml"]
+    paras = editor.dom.getElementsByTagName("w:p")
+    doc.add_comment(start=paras[0], end=paras[0], text="Standard review comment")
+    editor.suggest_deletion(paras[1])
+
+
+def bench_batch(args):
+    """Compare run_batch with one worker against a process pool."""
+    from ooxml.scripts.pack import pack_document
+
+    from .batch import run_batch
+
+    # Dates are taken from the clock; everything else must match between runs
+    normalize = lambda xml: re.sub(r'(w:date|w16du:dateUtc)="[^"]*"', "", xml)
+
+    def outputs(report):
+        import zipfile
+
+        parts = []
+        for result in report["documents"]:
+            with zipfile.ZipFile(result["output"]) as zf:
+                parts.append(normalize(zf.read("word/document.xml").decode("utf-8")))
+        return parts
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        documents = []
+        for i in range(args.documents):
+            source = temp_path / "sources" / f"contract{i}"
+            write_synthetic_package(source, args.paragraphs)
+            documents.append(temp_path / f"contract{i}.docx")
+            pack_document(source, documents[-1], validate=False)
+
+        serial = run_batch(
+            documents, _batch_edit, temp_path / "serial", workers=1, seed=1, validate=False
+        )
+        pooled = run_batch(
+            documents,
+            _batch_edit,
+            temp_path / "pooled",
+            workers=args.workers,
+            seed=1,
+            validate=False,
+        )
+        identical = outputs(serial) == outputs(pooled)
+        leftovers = list(Path(tempfile.gettempdir()).glob("docx_batch_*"))
+
+    print(f"{args.documents} documents x {args.paragraphs} paragraphs")
+    for name, report in (("1 worker", serial), (f"{args.workers} workers", pooled)):
+        print(
+            f"  {name:10s} {report['seconds']:6.2f} s "
+            f"({report['succeeded']} ok, {report['failed']} failed)"
+        )
+    if serial["failed"] or pooled["failed"]:
+        errors = [r["error"] for r in serial["documents"] + pooled["documents"] if r["error"]]
+        print(f"FAILED - Edits failed: {errors[0]}")
+        return False
+    if not identical:
+        print("FAILED - Seeded runs produced different documents")
+        return False
+    if leftovers:
+        print(f"FAILED - Temporary directories left behind: {leftovers[0]}")
+        return False
+    print("PASSED - Seeded output identical across worker counts")
+    return True
+
+
+# Peak RSS of the current process in KB. VmHWM is reset by exec, unlike
+# ru_maxrss, which would include the parent's memory at fork time.
+_PEAK_RSS = """
+def peak_rss_kb():
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1])
+"""
+
+# Paragraph counting as compare_paragraph_counts did it before streaming:
+# extract the whole archive, then parse document.xml into a full tree
+_EXTRACT_AND_PARSE = _PEAK_RSS + """
+import json, sys, tempfile, time, zipfile
+import lxml.etree
+start = time.perf_counter()
+with tempfile.TemporaryDirectory() as temp_dir:
+    zipfile.ZipFile(sys.argv[1]).extractall(temp_dir)
+    root = lxml.etree.parse(temp_dir + "/word/document.xml").getroot()
+    w = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+    counts = {key: len(root.findall(f".//{w}{tag}")) for tag, key in
+              (("p", "paragraphs"), ("r", "runs"), ("tbl", "tables"),
+               ("ins", "insertions"), ("del", "deletions"))}
+seconds = time.perf_counter() - start
+print(json.dumps([counts, seconds, peak_rss_kb()]))
+"""
+
+_STREAMING_COUNT = _PEAK_RSS + """
+import json, sys, time
+from ooxml.scripts.validation.docx import count_document_elements
+start = time.perf_counter()
+counts = count_document_elements(sys.argv[1], "word/document.xml")
+seconds = time.perf_counter() - start
+print(json.dumps([counts, seconds, peak_rss_kb()]))
+"""
+
+# Full XLSX validation in a fresh process, so peak RSS reflects only the validator
+_XLSX_VALIDATE = _PEAK_RSS + """
+import contextlib, io, json, sys, time
+from ooxml.scripts.validation.xlsx import XLSXSchemaValidator
+output = io.StringIO()
+start = time.perf_counter()
+with contextlib.redirect_stdout(output):
+    valid = XLSXSchemaValidator(sys.argv[1], sys.argv[2]).validate()
+seconds = time.perf_counter() - start
+print(json.dumps([valid, output.getvalue(), seconds, peak_rss_kb()]))
+"""
+
+# Parsing the worksheet into a full tree, for comparison
+_WORKSHEET_PARSE = _PEAK_RSS + """
+import json, sys, time
+import lxml.etree
+start = time.perf_counter()
+tree = lxml.etree.parse(sys.argv[1] + "/xl/worksheets/sheet1.xml")
+seconds = time.perf_counter() - start
+print(json.dumps([None, "", seconds, peak_rss_kb()]))
+"""
+
+
+def bench_paragraph_count(args):
+    """Compare streaming element counts against extracting and parsing the docx."""
+    import json
+
+    import zipfile
+
+    def run(code, docx_path):
+        result = subprocess.run(
+            [sys.executable, "-c", code, str(docx_path)],
+            cwd=SKILL_ROOT,
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr)
+        return json.loads(result.stdout)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        source = Path(temp_dir) / "unpacked"
+        write_synthetic_package(source, args.paragraphs)
+        write_synthetic_document(
+            source / "word" / "document.xml", args.paragraphs, tracked=True
+        )
+        # Zip the parts directly; pack_document's reformatting is not under test
+        docx_path = Path(temp_dir) / "document.docx"
+        with zipfile.ZipFile(docx_path, "w", zipfile.ZIP_DEFLATED) as zf:
+            for part in source.rglob("*"):
+                if part.is_file():
+                    zf.write(part, part.relative_to(source))
+
+        parsed, parse_seconds, parse_kb = run(_EXTRACT_AND_PARSE, docx_path)
+        streamed, stream_seconds, stream_kb = run(_STREAMING_COUNT, docx_path)
+
+    print(f"{args.paragraphs} paragraphs: {streamed}")
+    print(f"  extract + parse: {parse_seconds:6.2f} s, peak RSS {parse_kb / 1024:7.1f} MB")
+    print(f"  streaming count: {stream_seconds:6.2f} s, peak RSS {stream_kb / 1024:7.1f} MB")
+    if streamed != parsed:
+        print(f"FAILED - Streaming counts differ from a full parse: {parsed}")
+        return False
+    if stream_kb >= parse_kb:
+        print("FAILED - Streaming count did not reduce peak memory")
+        return False
+    print("PASSED - Counts identical, peak memory reduced")
+    return True
+
+
+def _legacy_xsd_preprocess(validator, xml_doc):
+    """XSD preprocessing as it was before _preprocess_for_xsd.
+
+    Template tags and ignorable namespaces were each cleaned on a fresh
+    tostring/fromstring copy with per-element Python loops. Used as the
+    baseline for bench_xsd_preprocess.
+    """
+    import lxml.etree
+
+    template_pattern = re.compile(r"\{\{[^}]*\}\}")
+    copy = lxml.etree.fromstring(lxml.etree.tostring(xml_doc, encoding="unicode"))
+    for elem in copy.iter():
+        if not isinstance(elem.tag, str) or elem.tag.endswith("}t") or elem.tag == "t":
+            continue
+        if elem.text:
+            elem.text = template_pattern.sub("", elem.text)
+        if elem.tail:
+            elem.tail = template_pattern.sub("", elem.tail)
+    copy.attrib.pop(f"{{{validator.MC_NAMESPACE}}}Ignorable", None)
+
+    copy = lxml.etree.fromstring(lxml.etree.tostring(copy, encoding="unicode"))
+    for elem in copy.iter():
+        for attr in [
+            attr
+            for attr in elem.attrib
+            if "{" in attr and attr.split("}")[0][1:] not in validator.OOXML_NAMESPACES
+        ]:
+            del elem.attrib[attr]
+
+    def remove_ignorable(root):
+        for elem in list(root):
+            if not isinstance(elem.tag, str):
+                continue
+            if elem.tag.startswith("{"):
+                if elem.tag.split("}")[0][1:] not in validator.OOXML_NAMESPACES:
+                    root.remove(elem)
+                    continue
+            remove_ignorable(elem)
+
+    remove_ignorable(copy)
+    return lxml.etree.ElementTree(copy)
+
+
+def bench_xsd_preprocess(args):
+    """Compare _preprocess_for_xsd against the copy-and-walk preprocessing."""
+    import lxml.etree
+
+    from ooxml.scripts.validation.docx import DOCXSchemaValidator
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        xml_path = Path(temp_dir) / "document.xml"
+        write_synthetic_document(xml_path, args.paragraphs, tracked=True)
+        # Add Word 2010 ids and an ignorable extension element to every paragraph
+        xml = xml_path.read_text(encoding="ascii")
+        xml = xml.replace(
+            "<w:document ",
+            '<w:document xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006"'
+            ' xmlns:w14="http://schemas.microsoft.com/office/word/2010/wordml"'
+            ' mc:Ignorable="w14" ',
+            1,
+        ).replace(
+            "<w:p ", '<w:p w14:paraId="0A1B2C3D" w14:textId="77777777" '
+        ).replace(
+            "    </w:p>", '      <w14:checkbox w14:val="0"/>{{ field }}\n    </w:p>'
+        )
+        xml_path.write_text(xml, encoding="ascii")
+        size_mb = xml_path.stat().st_size / 1e6
+
+        validator = DOCXSchemaValidator(temp_dir, xml_path)
+        legacy_tree = lxml.etree.parse(str(xml_path))
+        new_tree = lxml.etree.parse(str(xml_path))
+
+    start = time.perf_counter()
+    legacy = _legacy_xsd_preprocess(validator, legacy_tree)
+    legacy_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    cleaned = validator._preprocess_for_xsd(new_tree, clean_namespaces=True)
+    new_seconds = time.perf_counter() - start
+
+    identical = lxml.etree.tostring(legacy) == lxml.etree.tostring(cleaned)
+    print(f"{size_mb:.1f} MB document.xml ({args.paragraphs} paragraphs)")
+    print(f"  copy + per-element walks: {legacy_seconds:.2f} s")
+    print(f"  _preprocess_for_xsd:      {new_seconds:.2f} s")
+    if not identical:
+        print("FAILED - Preprocessed trees differ")
+        return False
+    if new_seconds >= legacy_seconds:
+        print("FAILED - Preprocessing is not faster")
+        return False
+    print("PASSED - Output identical, preprocessing faster")
+    return True
+
+
+def bench_pptx_validate(args):
+    """Time PPTXSchemaValidator.validate on a large synthetic deck."""
+    import contextlib
+    import io
+    import zipfile
+
+    from ooxml.scripts.validation.pptx import PPTXSchemaValidator
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        unpacked = Path(temp_dir) / "deck"
+        write_synthetic_deck(unpacked, args.slides)
+        original = Path(temp_dir) / "deck.pptx"
+        with zipfile.ZipFile(original, "w", zipfile.ZIP_DEFLATED) as zf:
+            for path in unpacked.rglob("*"):
+                if path.is_file():
+                    zf.write(path, path.relative_to(unpacked).as_posix())
+
+        output = io.StringIO()
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(output):
+            valid = PPTXSchemaValidator(unpacked, original).validate()
+        seconds = time.perf_counter() - start
+
+        # A corrupted creationId in the last slide must still be reported
+        last_slide = unpacked / f"ppt/slides/slide{args.slides}.xml"
+        xml = last_slide.read_text()
+        last_slide.write_text(re.sub(r'(creationId[^>]*id="\{)[0-9A-F]', r"\1G", xml))
+        with contextlib.redirect_stdout(io.StringIO()):
+            detected = not PPTXSchemaValidator(unpacked, original).validate_uuid_ids()
+
+    print(f"{args.slides} slides: validate() {seconds:.2f} s")
+    if not valid:
+        print(output.getvalue())
+        print("FAILED - Synthetic deck did not validate")
+        return False
+    if not detected:
+        print("FAILED - Invalid UUID was not reported")
+        return False
+    if seconds > args.budget_seconds:
+        print(f"FAILED - Validation exceeds budget of {args.budget_seconds:.1f} s")
+        return False
+    print("PASSED - Deck validated within budget, invalid UUID detected")
+    return True
+
+
+def bench_xlsx_validate(args):
+    """Validate a large synthetic workbook and compare memory with a full sheet parse.
+
+    The memory gate applies to sheets above the validator's XSD size limit,
+    which are checked by streaming only.
+    """
+    import json
+    import zipfile
+
+    from ooxml.scripts.validation.xlsx import XLSXSchemaValidator
+
+    def run(code, unpacked, original):
+        result = subprocess.run(
+            [sys.executable, "-c", code, str(unpacked), str(original)],
+            cwd=SKILL_ROOT,
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr)
+        return json.loads(result.stdout)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        unpacked = Path(temp_dir) / "workbook"
+        write_synthetic_workbook(unpacked, args.rows, args.columns)
+        original = Path(temp_dir) / "workbook.xlsx"
+        with zipfile.ZipFile(original, "w", zipfile.ZIP_DEFLATED) as zf:
+            for path in unpacked.rglob("*"):
+                if path.is_file():
+                    zf.write(path, path.relative_to(unpacked).as_posix())
+        sheet_size = (unpacked / "xl/worksheets/sheet1.xml").stat().st_size
+        size_mb = sheet_size / 1e6
+        streamed = sheet_size > XLSXSchemaValidator.WORKSHEET_XSD_MAX_BYTES
+
+        valid, output, seconds, validate_kb = run(_XLSX_VALIDATE, unpacked, original)
+        _, _, parse_seconds, parse_kb = run(_WORKSHEET_PARSE, unpacked, original)
+
+        # An out-of-range shared string index must be reported
+        broken = Path(temp_dir) / "broken"
+        write_synthetic_workbook(broken, 10, args.columns, bad_index=True)
+        detected, _, _, _ = run(_XLSX_VALIDATE, broken, original)
+        detected = not detected
+
+    cells = args.rows * args.columns
+    print(f"{cells} cells ({size_mb:.1f} MB sheet1.xml)")
+    print(f"  validate():       {seconds:6.2f} s, peak RSS {validate_kb / 1024:7.1f} MB")
+    print(f"  parse sheet only: {parse_seconds:6.2f} s, peak RSS {parse_kb / 1024:7.1f} MB")
+    for line in output.splitlines():
+        if line.startswith("SKIPPED"):
+            print(f"  {line}")
+    if not valid:
+        print(output)
+        print("FAILED - Synthetic workbook did not validate")
+        return False
+    if not detected:
+        print("FAILED - Invalid shared string index was not reported")
+        return False
+    if not streamed:
+        # Sheets within the limit are parsed whole for XSD validation
+        print("PASSED - Workbook validated against the schema, invalid index detected")
+        return True
+    if validate_kb >= parse_kb:
+        print("FAILED - Validation uses as much memory as parsing the sheet")
+        return False
+    print("PASSED - Workbook validated with streaming memory, invalid index detected")
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Document library benchmarks")
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+
+    import_time = subparsers.add_parser(
+        "import-time", help="Measure import time with -X importtime"
+    )
+    import_time.add_argument("--module", default="scripts.document")
+    import_time.add_argument("--runs", type=int, default=5)
+    import_time.add_argument(
+        "--budget-ms",
+        type=float,
+        default=150.0,
+        help="Fail if the best cumulative import time exceeds this (default: 150)",
+    )
+    import_time.set_defaults(func=bench_import_time)
+
+    save_memory = subparsers.add_parser(
+        "save-memory", help="Peak memory of XMLEditor.save vs dom.toxml"
+    )
+    save_memory.add_argument("--paragraphs", type=int, default=100_000)
+    save_memory.set_defaults(func=bench_save_memory)
+
+    parse_memory = subparsers.add_parser(
+        "parse-memory", help="Retained memory of the XMLEditor tree"
+    )
+    parse_memory.add_argument("--paragraphs", type=int, default=50_000)
+    parse_memory.add_argument(
+        "--min-ratio",
+        type=float,
+        default=3.0,
+        help="Fail if memory is not reduced by at least this factor (default: 3.0)",
+    )
+    parse_memory.set_defaults(func=bench_parse_memory)
+
+    text_lookup = subparsers.add_parser(
+        "text-lookup", help="get_node(contains=...) with the text index vs a full scan"
+    )
+    text_lookup.add_argument("--paragraphs", type=int, default=5_000)
+    text_lookup.add_argument("--queries", type=int, default=500)
+    text_lookup.set_defaults(func=bench_text_lookup)
+
+    comments = subparsers.add_parser(
+        "comments", help="Scaling of add_comment/reply_to_comment and save"
+    )
+    comments.add_argument("--comments", type=int, default=10_000)
+    comments.add_argument("--paragraphs", type=int, default=2_000)
+    comments.add_argument(
+        "--max-growth",
+        type=float,
+        default=1.5,
+        help="Fail if per-comment cost grows more than this from n/4 to n (default: 1.5)",
+    )
+    comments.set_defaults(func=bench_comments)
+
+    reject_changes = subparsers.add_parser(
+        "reject-changes", help="Document-wide reject_changes vs per-change reverts"
+    )
+    reject_changes.add_argument("--paragraphs", type=int, default=2_000)
+    reject_changes.set_defaults(func=bench_reject_changes)
+
+    change_queries = subparsers.add_parser(
+        "change-queries", help="Tracked-change index queries vs full DOM scans"
+    )
+    change_queries.add_argument("--paragraphs", type=int, default=5_000)
+    change_queries.add_argument("--queries", type=int, default=300)
+    change_queries.set_defaults(func=bench_change_queries)
+
+    batch = subparsers.add_parser("batch", help="run_batch with a process pool vs serial")
+    batch.add_argument("--documents", type=int, default=40)
+    batch.add_argument("--paragraphs", type=int, default=500)
+    batch.add_argument("--workers", type=int, default=4)
+    batch.set_defaults(func=bench_batch)
+
+    paragraph_count = subparsers.add_parser(
+        "paragraph-count", help="Streaming element counts vs extract + full parse"
+    )
+    paragraph_count.add_argument("--paragraphs", type=int, default=200_000)
+    paragraph_count.set_defaults(func=bench_paragraph_count)
+
+    xsd_preprocess = subparsers.add_parser(
+        "xsd-preprocess", help="XSD preprocessing of a large document.xml"
+    )
+    xsd_preprocess.add_argument(
+        "--paragraphs", type=int, default=30_000, help="30000 gives about 20 MB"
+    )
+    xsd_preprocess.set_defaults(func=bench_xsd_preprocess)
+
+    pptx_validate = subparsers.add_parser(
+        "pptx-validate", help="Full PPTX validation of a large synthetic deck"
+    )
+    pptx_validate.add_argument("--slides", type=int, default=1_000)
+    pptx_validate.add_argument(
+        "--budget-seconds",
+        type=float,
+        default=5.0,
+        help="Fail if validation takes longer than this (default: 5)",
+    )
+    pptx_validate.set_defaults(func=bench_pptx_validate)
+
+    xlsx_validate = subparsers.add_parser(
+        "xlsx-validate", help="Streaming XLSX validation of a 1M-cell workbook"
+    )
+    xlsx_validate.add_argument("--rows", type=int, default=50_000)
+    xlsx_validate.add_argument("--columns", type=int, default=20)
+    xlsx_validate.set_defaults(func=bench_xlsx_validate)
+
+    args = parser.parse_args()
+    sys.exit(0 if args.func(args) else 1)
+
+
+if __name__ == "__main__":
+    main()
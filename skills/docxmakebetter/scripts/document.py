@@ -19,6 +19,7 @@ Usage:
 
     # Suggest tracked changes
     doc["word/document.xml"].suggest_deletion(node)  # Delete content
+    doc["word/document.xml"].suggest_deletion_range(first, last)  # Delete siblings
     doc["word/document.xml"].revert_insertion(ins_node)  # Reject insertion
     doc["word/document.xml"].revert_deletion(del_node)  # Reject deletion
 
@@ -26,19 +27,20 @@ Usage:
     doc.save()
 """
 
+import bisect
 import html
 import random
+import re
 import shutil
 import tempfile
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 
-from defusedxml import minidom
-from ooxml.scripts.pack import pack_document
-from ooxml.scripts.validation.docx import DOCXSchemaValidator
-from ooxml.scripts.validation.redlining import RedliningValidator
+from .utilities import XMLEditor, _is_attached
 
-from .utilities import XMLEditor
+# Validators (lxml), the pack/soffice bridge and standalone minidom parsing are
+# imported on first use so that importing this module stays cheap.
 
 # Path to template files
 TEMPLATE_DIR = Path(__file__).parent / "templates"
@@ -57,7 +59,12 @@ class DocxXMLEditor(XMLEditor):
     """
 
     def __init__(
-        self, xml_path, rsid: str, author: str = "Claude", initials: str = "C"
+        self,
+        xml_path,
+        rsid: str,
+        author: str = "Claude",
+        initials: str = "C",
+        ids=None,
     ):
         """Initialize with required RSID and optional author.
 
@@ -66,11 +73,112 @@ class DocxXMLEditor(XMLEditor):
             rsid: RSID to automatically apply to new elements
             author: Author name for tracked changes and comments (default: "Claude")
             initials: Author initials (default: "C")
+            ids: Optional _IdAllocator shared with other parts of the package.
+                If not provided, one is seeded from this file alone.
         """
         super().__init__(xml_path)
         self.rsid = rsid
         self.author = author
         self.initials = initials
+        if ids is None:
+            ids = _IdAllocator()
+            ids.scan([self.xml_path])
+        self._ids = ids
+        self._ids.reserve(rsid)
+        # Tracked-change index, built on first query and updated from DOM changes
+        self._change_index = None
+        self.dom._attribute_listener = self._notify_attribute_changed
+
+    def _notify_changed(self, parent, node):
+        """Also report inserted or removed elements of the document to the change index.
+
+        Text edits and mutations of detached fragments cannot affect tracked
+        changes in the document and are not reported.
+        """
+        super()._notify_changed(parent, node)
+        if (
+            self._change_index is not None
+            and node.nodeType == node.ELEMENT_NODE
+            and self._is_attached(parent)
+            and not self._change_index.mark_changed(node)
+        ):
+            self._change_index = None
+
+    def _notify_attribute_changed(self, elem):
+        """Re-read an indexed change after its w:id, w:author or w:date was set."""
+        if self._change_index is not None:
+            self._change_index.attributes_changed(elem)
+
+    def _get_change_index(self):
+        """Return the tracked-change index, building it on first use."""
+        if self._change_index is None:
+            self._change_index = _ChangeIndex(self.dom)
+        return self._change_index
+
+    def iter_changes_by_id(self, change_id):
+        """Iterate over tracked changes (w:ins/w:del) with the given w:id.
+
+        IDs should be unique, but documents from other tools sometimes reuse them,
+        so this yields every match in document order.
+
+        Args:
+            change_id: Change ID (int or str)
+
+        Yields:
+            Element: Matching w:ins/w:del elements
+        """
+        yield from self._get_change_index().by_id(str(change_id))
+
+    def iter_changes_by_author(self, author):
+        """Iterate over all tracked changes by an author, in document order.
+
+        Args:
+            author: Value of w:author to match
+
+        Yields:
+            Element: Matching w:ins/w:del elements
+
+        Example:
+            editor = doc["word/document.xml"]
+            for change in editor.iter_changes_by_author("Jane Smith"):
+                print(change.tagName, change.getAttribute("w:id"))
+        """
+        yield from self._get_change_index().by_author(author)
+
+    def iter_changes_in_paragraphs(self, start, stop=None):
+        """Iterate over tracked changes inside a range of paragraphs.
+
+        Paragraph ordinals count every w:p in document order, starting at 0,
+        including paragraphs in tables. Changes outside any paragraph (e.g. table
+        row markers) are not included.
+
+        Args:
+            start: Ordinal of the first paragraph
+            stop: Ordinal after the last paragraph (default: start + 1)
+
+        Yields:
+            tuple: (paragraph_ordinal, element) in document order
+
+        Example:
+            for ordinal, change in editor.iter_changes_in_paragraphs(100, 200):
+                print(ordinal, change.getAttribute("w:author"))
+        """
+        if stop is None:
+            stop = start + 1
+        yield from self._get_change_index().in_paragraphs(start, stop)
+
+    def iter_changes_since(self, since):
+        """Iterate over tracked changes dated after a point in time, oldest first.
+
+        Changes without a w:date are not included.
+
+        Args:
+            since: datetime or ISO 8601 string; only changes strictly newer are yielded
+
+        Yields:
+            Element: Matching w:ins/w:del elements
+        """
+        yield from self._get_change_index().newer_than(_parse_change_date(since))
 
     def _get_next_change_id(self):
         """Get the next available change ID by checking all tracked change elements."""
@@ -88,32 +196,23 @@ class DocxXMLEditor(XMLEditor):
 
     def _ensure_w16du_namespace(self):
         """Ensure w16du namespace is declared on the root element."""
-        root = self.dom.documentElement
-        if not root.hasAttribute("xmlns:w16du"):  # type: ignore
-            root.setAttribute(  # type: ignore
-                "xmlns:w16du",
-                "http://schemas.microsoft.com/office/word/2023/wordml/word16du",
-            )
+        self._declare_namespace(
+            "w16du", "http://schemas.microsoft.com/office/word/2023/wordml/word16du"
+        )
 
     def _ensure_w16cex_namespace(self):
         """Ensure w16cex namespace is declared on the root element."""
-        root = self.dom.documentElement
-        if not root.hasAttribute("xmlns:w16cex"):  # type: ignore
-            root.setAttribute(  # type: ignore
-                "xmlns:w16cex",
-                "http://schemas.microsoft.com/office/word/2018/wordml/cex",
-            )
+        self._declare_namespace(
+            "w16cex", "http://schemas.microsoft.com/office/word/2018/wordml/cex"
+        )
 
     def _ensure_w14_namespace(self):
         """Ensure w14 namespace is declared on the root element."""
-        root = self.dom.documentElement
-        if not root.hasAttribute("xmlns:w14"):  # type: ignore
-            root.setAttribute(  # type: ignore
-                "xmlns:w14",
-                "http://schemas.microsoft.com/office/word/2010/wordml",
-            )
+        self._declare_namespace(
+            "w14", "http://schemas.microsoft.com/office/word/2010/wordml"
+        )
 
-    def _inject_attributes_to_nodes(self, nodes):
+    def _inject_attributes_to_nodes(self, nodes, timestamp=None):
         """Inject RSID, author, and date attributes into DOM nodes where applicable.
 
         Adds attributes to elements that support them:
@@ -124,12 +223,15 @@ class DocxXMLEditor(XMLEditor):
         - w:comment: gets w:author, w:date, w:initials
         - w16cex:commentExtensible: gets w16cex:dateUtc
 
+        Change IDs are allocated with a single scan of the document per call.
+
         Args:
             nodes: List of DOM nodes to process
+            timestamp: w:date value to use (default: now, in UTC)
         """
-        from datetime import datetime, timezone
-
-        timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        if timestamp is None:
+            timestamp = _utc_timestamp()
+        next_change_id = None
 
         def is_inside_deletion(elem):
             """Check if element is inside a w:del element."""
@@ -147,13 +249,14 @@ class DocxXMLEditor(XMLEditor):
                 elem.setAttribute("w:rsidRDefault", self.rsid)
             if not elem.hasAttribute("w:rsidP"):
                 elem.setAttribute("w:rsidP", self.rsid)
-            # Add w14:paraId and w14:textId if not present
-            if not elem.hasAttribute("w14:paraId"):
-                self._ensure_w14_namespace()
-                elem.setAttribute("w14:paraId", _generate_hex_id())
-            if not elem.hasAttribute("w14:textId"):
-                self._ensure_w14_namespace()
-                elem.setAttribute("w14:textId", _generate_hex_id())
+            # Add w14:paraId and w14:textId if not present; keep any given ones
+            # out of the allocator so they are never handed out again
+            for attr in ("w14:paraId", "w14:textId"):
+                if elem.hasAttribute(attr):
+                    self._ids.reserve(elem.getAttribute(attr))
+                else:
+                    self._ensure_w14_namespace()
+                    elem.setAttribute(attr, self._ids.hex_id())
 
         def add_rsid_to_r(elem):
             # Use w:rsidDel for <w:r> inside <w:del>, otherwise w:rsidR
@@ -165,9 +268,13 @@ class DocxXMLEditor(XMLEditor):
                     elem.setAttribute("w:rsidR", self.rsid)
 
         def add_tracked_change_attrs(elem):
+            nonlocal next_change_id
             # Auto-assign w:id if not present
             if not elem.hasAttribute("w:id"):
-                elem.setAttribute("w:id", str(self._get_next_change_id()))
+                if next_change_id is None:
+                    next_change_id = self._get_next_change_id()
+                elem.setAttribute("w:id", str(next_change_id))
+                next_change_id += 1
             if not elem.hasAttribute("w:author"):
                 elem.setAttribute("w:author", self.author)
             if not elem.hasAttribute("w:date"):
@@ -300,42 +407,14 @@ class DocxXMLEditor(XMLEditor):
             )
 
         # Process all insertions - wrap all children in w:del
+        changes = []
         for ins_elem in ins_elements:
-            runs = list(ins_elem.getElementsByTagName("w:r"))
-            if not runs:
-                continue
+            del_wrapper = self._reject_insertion(ins_elem)
+            if del_wrapper is not None:
+                changes.append(del_wrapper)
 
-            # Create deletion wrapper
-            del_wrapper = self.dom.createElement("w:del")
-
-            # Process each run
-            for run in runs:
-                # Convert w:t → w:delText and w:rsidR → w:rsidDel
-                if run.hasAttribute("w:rsidR"):
-                    run.setAttribute("w:rsidDel", run.getAttribute("w:rsidR"))
-                    run.removeAttribute("w:rsidR")
-                elif not run.hasAttribute("w:rsidDel"):
-                    run.setAttribute("w:rsidDel", self.rsid)
-
-                for t_elem in list(run.getElementsByTagName("w:t")):
-                    del_text = self.dom.createElement("w:delText")
-                    # Copy ALL child nodes (not just firstChild) to handle entities
-                    while t_elem.firstChild:
-                        del_text.appendChild(t_elem.firstChild)
-                    for i in range(t_elem.attributes.length):
-                        attr = t_elem.attributes.item(i)
-                        del_text.setAttribute(attr.name, attr.value)
-                    t_elem.parentNode.replaceChild(del_text, t_elem)
-
-            # Move all children from ins to del wrapper
-            while ins_elem.firstChild:
-                del_wrapper.appendChild(ins_elem.firstChild)
-
-            # Add del wrapper back to ins
-            ins_elem.appendChild(del_wrapper)
-
-            # Inject attributes to the deletion wrapper
-            self._inject_attributes_to_nodes([del_wrapper])
+        # Inject attributes to the deletion wrappers
+        self._inject_attributes_to_nodes(changes, timestamp=_utc_timestamp())
 
         return [elem]
 
@@ -380,104 +459,280 @@ class DocxXMLEditor(XMLEditor):
                 f"The provided element <{elem.tagName}> contains no deletions. "
             )
 
-        # Track created insertion (only relevant if elem is a single w:del)
-        created_insertion = None
-
         # Process all deletions - create insertions that copy the deleted content
+        changes = []
         for del_elem in del_elements:
-            # Clone the deleted runs and convert them to insertions
-            runs = list(del_elem.getElementsByTagName("w:r"))
-            if not runs:
+            ins_elem = self._reject_deletion(del_elem)
+            if ins_elem is not None:
+                changes.append(ins_elem)
+
+        # Inject attributes to the new insertions
+        self._inject_attributes_to_nodes(changes, timestamp=_utc_timestamp())
+
+        # Return based on input type
+        if is_single_del and changes:
+            return [elem, changes[0]]
+        else:
+            return [elem]
+
+    def accept_changes(self, author=None, since=None, until=None, change_ids=None):
+        """Accept tracked changes matching the filters, across the whole document.
+
+        Accepting is not itself tracked: insertions are unwrapped (their content
+        stays), deletions are removed with their content. Paragraph-mark and table
+        row markers (w:ins/w:del in w:rPr of w:pPr or in w:trPr) are removed; an
+        accepted paragraph-mark deletion merges the paragraph into the next one and
+        an accepted row deletion removes the row.
+
+        Args:
+            author: Only changes by this author (default: any author)
+            since: Only changes dated at or after this datetime or ISO 8601 string
+            until: Only changes dated at or before this datetime or ISO 8601 string
+            change_ids: Only changes whose w:id is in this collection (ints or strings)
+
+        Returns:
+            dict: {"insertions": int, "deletions": int, "seconds": float}
+
+        Example:
+            editor = doc["word/document.xml"]
+            report = editor.accept_changes(author="Jane Smith")
+            report = editor.accept_changes(since="2025-01-01T00:00:00Z", change_ids={3, 4})
+        """
+        start_time = time.perf_counter()
+        report = {"insertions": 0, "deletions": 0}
+        for elem in self._select_changes(author, since, until, change_ids):
+            if not self._is_attached(elem):
                 continue
+            if elem.tagName == "w:ins":
+                if not _is_property_marker(elem):
+                    _unwrap(elem)
+                else:
+                    elem.parentNode.removeChild(elem)
+                report["insertions"] += 1
+            else:
+                if not _is_property_marker(elem):
+                    elem.parentNode.removeChild(elem)
+                else:
+                    self._accept_marker_deletion(elem)
+                report["deletions"] += 1
+        report["seconds"] = time.perf_counter() - start_time
+        return report
 
-            # Create insertion wrapper
-            ins_elem = self.dom.createElement("w:ins")
+    def reject_changes(self, author=None, since=None, until=None, change_ids=None):
+        """Reject tracked changes matching the filters, across the whole document.
 
-            for run in runs:
-                # Clone the run
-                new_run = run.cloneNode(True)
+        Changes by other authors are rejected with tracked changes by this editor's
+        author, exactly like revert_insertion and revert_deletion. This editor's own
+        changes are simply undone: its insertions are removed and its deletions are
+        restored to plain text. Paragraph-mark and table row markers are skipped.
 
-                # Convert w:delText → w:t
-                for del_text in list(new_run.getElementsByTagName("w:delText")):
-                    t_elem = self.dom.createElement("w:t")
-                    # Copy ALL child nodes (not just firstChild) to handle entities
-                    while del_text.firstChild:
-                        t_elem.appendChild(del_text.firstChild)
-                    for i in range(del_text.attributes.length):
-                        attr = del_text.attributes.item(i)
-                        t_elem.setAttribute(attr.name, attr.value)
-                    del_text.parentNode.replaceChild(t_elem, del_text)
+        Args:
+            author: Only changes by this author (default: any author)
+            since: Only changes dated at or after this datetime or ISO 8601 string
+            until: Only changes dated at or before this datetime or ISO 8601 string
+            change_ids: Only changes whose w:id is in this collection (ints or strings)
 
-                # Update run attributes: w:rsidDel → w:rsidR
-                if new_run.hasAttribute("w:rsidDel"):
-                    new_run.setAttribute("w:rsidR", new_run.getAttribute("w:rsidDel"))
-                    new_run.removeAttribute("w:rsidDel")
-                elif not new_run.hasAttribute("w:rsidR"):
-                    new_run.setAttribute("w:rsidR", self.rsid)
+        Returns:
+            dict: {"insertions": int, "deletions": int, "skipped": int, "seconds": float}
 
-                ins_elem.appendChild(new_run)
+        Example:
+            editor = doc["word/document.xml"]
+            report = editor.reject_changes(author="Jane Smith")
+            print(f"Rejected {report['insertions']} insertions in {report['seconds']:.2f}s")
+        """
+        start_time = time.perf_counter()
+        report = {"insertions": 0, "deletions": 0, "skipped": 0}
+        changes = []
+        for elem in self._select_changes(author, since, until, change_ids):
+            if not self._is_attached(elem) or _is_property_marker(elem):
+                report["skipped"] += 1
+                continue
+            own = elem.getAttribute("w:author") == self.author
+            if elem.tagName == "w:ins":
+                if own:
+                    elem.parentNode.removeChild(elem)
+                else:
+                    new_change = self._reject_insertion(elem)
+                    if new_change is None:
+                        report["skipped"] += 1
+                        continue
+                    changes.append(new_change)
+                report["insertions"] += 1
+            else:
+                if own:
+                    for run in elem.getElementsByTagName("w:r"):
+                        self._restore_run(run)
+                    _unwrap(elem)
+                else:
+                    new_change = self._reject_deletion(elem)
+                    if new_change is None:
+                        report["skipped"] += 1
+                        continue
+                    changes.append(new_change)
+                report["deletions"] += 1
+        self._inject_attributes_to_nodes(changes, timestamp=_utc_timestamp())
+        report["seconds"] = time.perf_counter() - start_time
+        return report
+
+    def _select_changes(self, author, since, until, change_ids):
+        """Return w:ins/w:del elements matching the filters, in document order."""
+        since = _parse_change_date(since) if since is not None else None
+        until = _parse_change_date(until) if until is not None else None
+        index = self._get_change_index()
+
+        if change_ids is not None:
+            candidates = [
+                elem
+                for change_id in {str(change_id) for change_id in change_ids}
+                for elem in index.by_id(change_id)
+            ]
+        elif author is not None:
+            candidates = list(index.by_author(author))
+        else:
+            candidates = list(index.all())
 
-            # Insert the new insertion after the deletion
-            nodes = self.insert_after(del_elem, ins_elem.toxml())
+        selected = []
+        for elem in candidates:
+            change_id, elem_author, date = index.entry(elem)
+            if author is not None and elem_author != author:
+                continue
+            if since is not None or until is not None:
+                if date is None:
+                    continue
+                if (since is not None and date < since) or (
+                    until is not None and date > until
+                ):
+                    continue
+            selected.append(elem)
+        return index.sort(selected)
+
+    def _reject_insertion(self, ins_elem):
+        """Wrap the content of a w:ins in a new w:del (attributes not yet injected).
 
-            # If processing a single w:del, track the created insertion
-            if is_single_del and nodes:
-                created_insertion = nodes[0]
+        Returns:
+            Element: The new w:del wrapper, or None if the insertion has no runs
+        """
+        runs = list(ins_elem.getElementsByTagName("w:r"))
+        if not runs:
+            return None
 
-        # Return based on input type
-        if is_single_del and created_insertion:
-            return [elem, created_insertion]
+        # Create deletion wrapper
+        del_wrapper = self.dom.createElement("w:del")
+
+        # Convert w:t → w:delText and w:rsidR → w:rsidDel
+        for run in runs:
+            self._mark_run_deleted(run)
+
+        # Move all children from ins to del wrapper
+        while ins_elem.firstChild:
+            del_wrapper.appendChild(ins_elem.firstChild)
+
+        # Add del wrapper back to ins
+        ins_elem.appendChild(del_wrapper)
+        return del_wrapper
+
+    def _reject_deletion(self, del_elem):
+        """Insert a w:ins with copies of the deleted runs after a w:del.
+
+        The copies are built directly in this document; attributes are not yet
+        injected.
+
+        Returns:
+            Element: The new w:ins, or None if the deletion has no runs
+        """
+        runs = list(del_elem.getElementsByTagName("w:r"))
+        if not runs:
+            return None
+
+        # Create insertion wrapper with restored copies of the deleted runs
+        ins_elem = self.dom.createElement("w:ins")
+        for run in runs:
+            new_run = run.cloneNode(True)
+            self._restore_run(new_run)
+            ins_elem.appendChild(new_run)
+
+        # Insert the new insertion after the deletion
+        parent = del_elem.parentNode
+        if del_elem.nextSibling:
+            parent.insertBefore(ins_elem, del_elem.nextSibling)
         else:
-            return [elem]
+            parent.appendChild(ins_elem)
+        return ins_elem
+
+    def _restore_run(self, run):
+        """Convert w:delText back to w:t and w:rsidDel to w:rsidR in a single run."""
+        for del_text in list(run.getElementsByTagName("w:delText")):
+            t_elem = self.dom.createElement("w:t")
+            # Copy ALL child nodes (not just firstChild) to handle entities
+            while del_text.firstChild:
+                t_elem.appendChild(del_text.firstChild)
+            for i in range(del_text.attributes.length):
+                attr = del_text.attributes.item(i)
+                t_elem.setAttribute(attr.name, attr.value)
+            del_text.parentNode.replaceChild(t_elem, del_text)
+
+        # Update run attributes: w:rsidDel → w:rsidR
+        if run.hasAttribute("w:rsidDel"):
+            run.setAttribute("w:rsidR", run.getAttribute("w:rsidDel"))
+            run.removeAttribute("w:rsidDel")
+        elif not run.hasAttribute("w:rsidR"):
+            run.setAttribute("w:rsidR", self.rsid)
+
+    def _accept_marker_deletion(self, marker):
+        """Accept a deleted paragraph mark or table row marker."""
+        props = marker.parentNode
+        props.removeChild(marker)
+        if props.tagName == "w:trPr":
+            row = props.parentNode
+            if row is not None and row.parentNode is not None:
+                row.parentNode.removeChild(row)
+            return
+
+        # w:rPr in w:pPr: join the paragraph with the next one
+        pPr = props.parentNode
+        para = pPr.parentNode if pPr is not None else None
+        if para is None or para.nodeName != "w:p":
+            return
+        next_para = para.nextSibling
+        while next_para is not None and next_para.nodeType != next_para.ELEMENT_NODE:
+            next_para = next_para.nextSibling
+        if next_para is None or next_para.tagName != "w:p":
+            return
+        anchor = next_para.firstChild
+        while anchor is not None and anchor.nodeName == "w:pPr":
+            anchor = anchor.nextSibling
+        for child in [c for c in para.childNodes if c.nodeName != "w:pPr"]:
+            next_para.insertBefore(child, anchor)
+        para.parentNode.removeChild(para)
 
     @staticmethod
     def suggest_paragraph(xml_content: str) -> str:
         """Transform paragraph XML to add tracked change wrapping for insertion.
 
         Wraps runs in <w:ins> and adds <w:ins/> to w:rPr in w:pPr for numbered lists.
+        Several paragraphs can be passed at once; they are parsed together and
+        each one is wrapped.
 
         Args:
-            xml_content: XML string containing a <w:p> element
+            xml_content: XML string containing one or more <w:p> elements
 
         Returns:
             str: Transformed XML with tracked change wrapping
         """
+        from defusedxml import minidom
+
         wrapper = f'<root xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">{xml_content}</root>'
         doc = minidom.parseString(wrapper)
-        para = doc.getElementsByTagName("w:p")[0]
-
-        # Ensure w:pPr exists
-        pPr_list = para.getElementsByTagName("w:pPr")
-        if not pPr_list:
-            pPr = doc.createElement("w:pPr")
-            para.insertBefore(
-                pPr, para.firstChild
-            ) if para.firstChild else para.appendChild(pPr)
-        else:
-            pPr = pPr_list[0]
-
-        # Ensure w:rPr exists in w:pPr
-        rPr_list = pPr.getElementsByTagName("w:rPr")
-        if not rPr_list:
-            rPr = doc.createElement("w:rPr")
-            pPr.appendChild(rPr)
-        else:
-            rPr = rPr_list[0]
+        paras = [
+            node
+            for node in doc.documentElement.childNodes
+            if node.nodeType == node.ELEMENT_NODE and node.tagName == "w:p"
+        ] or doc.getElementsByTagName("w:p")[:1]
 
-        # Add <w:ins/> to w:rPr
-        ins_marker = doc.createElement("w:ins")
-        rPr.insertBefore(
-            ins_marker, rPr.firstChild
-        ) if rPr.firstChild else rPr.appendChild(ins_marker)
-
-        # Wrap all non-pPr children in <w:ins>
-        ins_wrapper = doc.createElement("w:ins")
-        for child in [c for c in para.childNodes if c.nodeName != "w:pPr"]:
-            para.removeChild(child)
-            ins_wrapper.appendChild(child)
-        para.appendChild(ins_wrapper)
+        for para in paras:
+            _wrap_paragraph_content(doc, para, "w:ins", mark_paragraph=True)
 
-        return para.toxml()
+        return "".join(para.toxml() for para in paras)
 
     def suggest_deletion(self, elem):
         """Mark a w:r or w:p element as deleted with tracked changes (in-place DOM manipulation).
@@ -495,29 +750,120 @@ class DocxXMLEditor(XMLEditor):
         Raises:
             ValueError: If element has existing tracked changes or invalid structure
         """
+        self._check_can_delete(elem)
+        result, changes = self._delete_element(elem)
+        self._inject_attributes_to_nodes(changes)
+        return result
+
+    def suggest_deletion_range(self, start, end):
+        """Mark every element from start to end (inclusive siblings) as deleted.
+
+        w:p and w:r siblings are processed like suggest_deletion. For any other
+        sibling (e.g. w:tbl, w:sdt, w:hyperlink) the w:p elements inside it are
+        deleted, or its w:r elements if it contains no paragraphs. All targets are
+        validated before anything is modified, and all new w:del elements share one
+        timestamp and get consecutive change IDs.
+
+        Args:
+            start: First element of the range
+            end: Last element of the range; must be start or a following sibling
+
+        Returns:
+            list: For each deleted run its w:del wrapper, for each paragraph the w:p
+
+        Raises:
+            ValueError: If end does not follow start, or any target has existing
+                tracked changes
+
+        Example:
+            editor = doc["word/document.xml"]
+            first = editor.get_node(tag="w:p", contains="Section 4")
+            last = editor.get_node(tag="w:p", contains="End of section 4")
+            editor.suggest_deletion_range(first, last)
+        """
+        targets = _range_targets(start, end)
+        for elem in targets:
+            self._check_can_delete(elem)
+
+        results, changes = [], []
+        for elem in targets:
+            result, elem_changes = self._delete_element(elem)
+            results.append(result)
+            changes.extend(elem_changes)
+        self._inject_attributes_to_nodes(changes, timestamp=_utc_timestamp())
+        return results
+
+    def suggest_insertion_range(self, start, end):
+        """Mark every element from start to end (inclusive siblings) as inserted.
+
+        Use this for content that is already in the document but was added without
+        tracking. w:r siblings are wrapped in <w:ins>; w:p siblings are handled like
+        suggest_paragraph (content wrapped in <w:ins>, <w:ins/> added to w:rPr in
+        w:pPr). Other siblings are descended into as in suggest_deletion_range.
+        All new w:ins elements share one timestamp and get consecutive change IDs.
+
+        Args:
+            start: First element of the range
+            end: Last element of the range; must be start or a following sibling
+
+        Returns:
+            list: For each run its w:ins wrapper, for each paragraph the w:p
+
+        Raises:
+            ValueError: If end does not follow start, or any target already has
+                tracked changes
+        """
+        targets = _range_targets(start, end)
+        for elem in targets:
+            if elem.nodeName == "w:r":
+                if elem.getElementsByTagName("w:delText") or (
+                    elem.parentNode.nodeName in ("w:ins", "w:del")
+                ):
+                    raise ValueError("w:r element already has tracked changes")
+            elif elem.getElementsByTagName("w:ins") or elem.getElementsByTagName(
+                "w:del"
+            ):
+                raise ValueError("w:p element already contains tracked changes")
+
+        results, changes = [], []
+        for elem in targets:
+            if elem.nodeName == "w:r":
+                ins_wrapper = self.dom.createElement("w:ins")
+                elem.parentNode.replaceChild(ins_wrapper, elem)
+                ins_wrapper.appendChild(elem)
+                results.append(ins_wrapper)
+                changes.append(ins_wrapper)
+            else:
+                marker, ins_wrapper = _wrap_paragraph_content(
+                    self.dom, elem, "w:ins", mark_paragraph=True
+                )
+                results.append(elem)
+                changes.extend([marker, ins_wrapper])
+        self._inject_attributes_to_nodes(changes, timestamp=_utc_timestamp())
+        return results
+
+    def _check_can_delete(self, elem):
+        """Raise ValueError unless elem is a w:r or w:p that suggest_deletion accepts."""
         if elem.nodeName == "w:r":
             # Check for existing w:delText
             if elem.getElementsByTagName("w:delText"):
                 raise ValueError("w:r element already contains w:delText")
+        elif elem.nodeName == "w:p":
+            # Check for existing tracked changes
+            if elem.getElementsByTagName("w:ins") or elem.getElementsByTagName("w:del"):
+                raise ValueError("w:p element already contains tracked changes")
+        else:
+            raise ValueError(f"Element must be w:r or w:p, got {elem.nodeName}")
+
+    def _delete_element(self, elem):
+        """Convert a validated w:r or w:p to a tracked deletion without injecting attributes.
 
-            # Convert w:t → w:delText
-            for t_elem in list(elem.getElementsByTagName("w:t")):
-                del_text = self.dom.createElement("w:delText")
-                # Copy ALL child nodes (not just firstChild) to handle entities
-                while t_elem.firstChild:
-                    del_text.appendChild(t_elem.firstChild)
-                # Preserve attributes like xml:space
-                for i in range(t_elem.attributes.length):
-                    attr = t_elem.attributes.item(i)
-                    del_text.setAttribute(attr.name, attr.value)
-                t_elem.parentNode.replaceChild(del_text, t_elem)
-
-            # Update run attributes: w:rsidR → w:rsidDel
-            if elem.hasAttribute("w:rsidR"):
-                elem.setAttribute("w:rsidDel", elem.getAttribute("w:rsidR"))
-                elem.removeAttribute("w:rsidR")
-            elif not elem.hasAttribute("w:rsidDel"):
-                elem.setAttribute("w:rsidDel", self.rsid)
+        Returns:
+            tuple: (result, changes) where result is what suggest_deletion returns and
+                changes are the new w:del elements that need attributes
+        """
+        if elem.nodeName == "w:r":
+            self._mark_run_deleted(elem)
 
             # Wrap in w:del
             del_wrapper = self.dom.createElement("w:del")
@@ -525,88 +871,465 @@ class DocxXMLEditor(XMLEditor):
             parent.insertBefore(del_wrapper, elem)
             parent.removeChild(elem)
             del_wrapper.appendChild(elem)
+            return del_wrapper, [del_wrapper]
 
-            # Inject attributes to the deletion wrapper
-            self._inject_attributes_to_nodes([del_wrapper])
+        # Convert w:t → w:delText and w:rsidR → w:rsidDel in all runs
+        for run in elem.getElementsByTagName("w:r"):
+            self._mark_run_deleted(run)
 
-            return del_wrapper
+        # Numbered list items also get a <w:del/> marker in w:rPr in w:pPr
+        pPr_list = elem.getElementsByTagName("w:pPr")
+        is_numbered = bool(pPr_list and pPr_list[0].getElementsByTagName("w:numPr"))
+        marker, del_wrapper = _wrap_paragraph_content(
+            self.dom, elem, "w:del", mark_paragraph=is_numbered
+        )
+        return elem, [del_wrapper] + ([marker] if marker is not None else [])
+
+    def _mark_run_deleted(self, run):
+        """Convert w:t to w:delText and w:rsidR to w:rsidDel in a single run."""
+        for t_elem in list(run.getElementsByTagName("w:t")):
+            del_text = self.dom.createElement("w:delText")
+            # Copy ALL child nodes (not just firstChild) to handle entities
+            while t_elem.firstChild:
+                del_text.appendChild(t_elem.firstChild)
+            # Preserve attributes like xml:space
+            for i in range(t_elem.attributes.length):
+                attr = t_elem.attributes.item(i)
+                del_text.setAttribute(attr.name, attr.value)
+            t_elem.parentNode.replaceChild(del_text, t_elem)
+
+        if run.hasAttribute("w:rsidR"):
+            run.setAttribute("w:rsidDel", run.getAttribute("w:rsidR"))
+            run.removeAttribute("w:rsidR")
+        elif not run.hasAttribute("w:rsidDel"):
+            run.setAttribute("w:rsidDel", self.rsid)
+
+
+def _is_property_marker(elem):
+    """Check whether a w:ins/w:del marks a paragraph mark or table row, not content."""
+    return elem.parentNode is not None and elem.parentNode.nodeName in (
+        "w:rPr",
+        "w:trPr",
+    )
+
+
+def _unwrap(elem):
+    """Replace an element with its children."""
+    parent = elem.parentNode
+    while elem.firstChild:
+        parent.insertBefore(elem.firstChild, elem)
+    parent.removeChild(elem)
+
+
+def _iter_elements(root, tags):
+    """Yield descendants of root with one of the given tag names, in document order."""
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if node.nodeType != node.ELEMENT_NODE:
+            continue
+        if node.tagName in tags:
+            yield node
+        stack.extend(reversed(node.childNodes))
+
+
+def _parse_change_date(value):
+    """Parse a w:date value (or datetime) into an aware UTC datetime."""
+    if isinstance(value, datetime):
+        date = value
+    else:
+        date = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return date
+
+
+def _range_targets(start, end):
+    """Collect the w:p/w:r elements covered by the sibling range start..end.
+
+    Raises:
+        ValueError: If end is not start or one of its following siblings
+    """
+    targets = []
+    node = start
+    while node is not None:
+        if node.nodeType == node.ELEMENT_NODE:
+            if node.tagName in ("w:p", "w:r"):
+                targets.append(node)
+            else:
+                targets.extend(
+                    node.getElementsByTagName("w:p")
+                    or node.getElementsByTagName("w:r")
+                )
+        if node is end:
+            return targets
+        node = node.nextSibling
+    raise ValueError("end must be the start element or one of its following siblings")
 
-        elif elem.nodeName == "w:p":
-            # Check for existing tracked changes
-            if elem.getElementsByTagName("w:ins") or elem.getElementsByTagName("w:del"):
-                raise ValueError("w:p element already contains tracked changes")
 
-            # Check if it's a numbered list item
-            pPr_list = elem.getElementsByTagName("w:pPr")
-            is_numbered = pPr_list and pPr_list[0].getElementsByTagName("w:numPr")
+def _wrap_paragraph_content(doc, para, tag, mark_paragraph):
+    """Wrap all non-pPr children of a paragraph in a new <tag> element.
 
-            if is_numbered:
-                # Add <w:del/> to w:rPr in w:pPr
-                pPr = pPr_list[0]
-                rPr_list = pPr.getElementsByTagName("w:rPr")
+    Args:
+        doc: Document used to create elements
+        para: w:p element to modify in place
+        tag: "w:ins" or "w:del"
+        mark_paragraph: If True, also add an empty <tag/> marker to w:rPr in w:pPr
+            (creating both if needed) so the paragraph mark itself is tracked
 
-                if not rPr_list:
-                    rPr = self.dom.createElement("w:rPr")
-                    pPr.appendChild(rPr)
-                else:
-                    rPr = rPr_list[0]
-
-                # Add <w:del/> marker
-                del_marker = self.dom.createElement("w:del")
-                rPr.insertBefore(
-                    del_marker, rPr.firstChild
-                ) if rPr.firstChild else rPr.appendChild(del_marker)
-
-            # Convert w:t → w:delText in all runs
-            for t_elem in list(elem.getElementsByTagName("w:t")):
-                del_text = self.dom.createElement("w:delText")
-                # Copy ALL child nodes (not just firstChild) to handle entities
-                while t_elem.firstChild:
-                    del_text.appendChild(t_elem.firstChild)
-                # Preserve attributes like xml:space
-                for i in range(t_elem.attributes.length):
-                    attr = t_elem.attributes.item(i)
-                    del_text.setAttribute(attr.name, attr.value)
-                t_elem.parentNode.replaceChild(del_text, t_elem)
-
-            # Update run attributes: w:rsidR → w:rsidDel
-            for run in elem.getElementsByTagName("w:r"):
-                if run.hasAttribute("w:rsidR"):
-                    run.setAttribute("w:rsidDel", run.getAttribute("w:rsidR"))
-                    run.removeAttribute("w:rsidR")
-                elif not run.hasAttribute("w:rsidDel"):
-                    run.setAttribute("w:rsidDel", self.rsid)
-
-            # Wrap all non-pPr children in <w:del>
-            del_wrapper = self.dom.createElement("w:del")
-            for child in [c for c in elem.childNodes if c.nodeName != "w:pPr"]:
-                elem.removeChild(child)
-                del_wrapper.appendChild(child)
-            elem.appendChild(del_wrapper)
+    Returns:
+        tuple: (marker, wrapper) where marker is None if mark_paragraph is False
+    """
+    marker = None
+    if mark_paragraph:
+        # Ensure w:pPr exists
+        pPr_list = para.getElementsByTagName("w:pPr")
+        if not pPr_list:
+            pPr = doc.createElement("w:pPr")
+            para.insertBefore(
+                pPr, para.firstChild
+            ) if para.firstChild else para.appendChild(pPr)
+        else:
+            pPr = pPr_list[0]
 
-            # Inject attributes to the deletion wrapper
-            self._inject_attributes_to_nodes([del_wrapper])
+        # Ensure w:rPr exists in w:pPr
+        rPr_list = pPr.getElementsByTagName("w:rPr")
+        if not rPr_list:
+            rPr = doc.createElement("w:rPr")
+            pPr.appendChild(rPr)
+        else:
+            rPr = rPr_list[0]
+
+        # Add <tag/> marker to w:rPr
+        marker = doc.createElement(tag)
+        rPr.insertBefore(
+            marker, rPr.firstChild
+        ) if rPr.firstChild else rPr.appendChild(marker)
 
-            return elem
+    # Wrap all non-pPr children in <tag>
+    wrapper = doc.createElement(tag)
+    for child in [c for c in para.childNodes if c.nodeName != "w:pPr"]:
+        para.removeChild(child)
+        wrapper.appendChild(child)
+    para.appendChild(wrapper)
+    return marker, wrapper
 
-        else:
-            raise ValueError(f"Element must be w:r or w:p, got {elem.nodeName}")
+
+def _utc_timestamp():
+    """Current UTC time in the format used for w:date attributes."""
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
-def _generate_hex_id() -> str:
-    """Generate random 8-character hex ID for para/durable IDs.
+class _ChangeIndex:
+    """Index of tracked changes (w:ins/w:del) by ID, author, date and paragraph.
 
-    Values are constrained to be less than 0x7FFFFFFF per OOXML spec:
-    - paraId must be < 0x80000000
-    - durableId must be < 0x7FFFFFFF
-    We use the stricter constraint (0x7FFFFFFF) for both.
+    Built with one traversal of the document. Afterwards, removed subtrees
+    reported through mark_changed are dropped from the index at once, inserted
+    ones are read before the next query, and attribute edits reported through
+    attributes_changed re-read the element, so the ID/author/date maps stay
+    current without rescanning. Document order and paragraph ordinals are
+    recomputed with a single traversal only when paragraphs or changes were
+    inserted, or paragraphs removed, and a query needs them.
     """
-    return f"{random.randint(1, 0x7FFFFFFE):08X}"
 
+    def __init__(self, dom):
+        self._dom = dom
+        self._entries = {}  # element -> (change_id, author, date)
+        self._ids = {}  # change_id -> {element: None}
+        self._authors = {}  # author -> {element: None}
+        self._pending = []  # roots of inserted subtrees
+        self._order = None  # element -> (position, paragraph ordinal or None)
+        self._paragraphs = None  # paragraph ordinal -> [elements]
+        self._dated = None  # sorted [(date, position, element)]
+        for elem in _iter_elements(dom.documentElement, ("w:ins", "w:del")):
+            self._add(elem)
+
+    def mark_changed(self, node):
+        """
+        Record that the element node was inserted or removed.
+
+        Returns:
+            bool: False if so many changes are pending that rebuilding is cheaper
+        """
+        if node.parentNode is None:
+            self._remove_subtree(node)
+            return True
+        self._pending.append(node)
+        return len(self._pending) <= len(self._entries) + 64
+
+    def attributes_changed(self, elem):
+        """Re-read an element's w:id, w:author and w:date if it is indexed."""
+        if elem not in self._entries:
+            return
+        self._discard(elem)
+        self._add(elem)
+        self._dated = None
+
+    def entry(self, elem):
+        """Return (change_id, author, date) for an indexed element."""
+        self._apply_pending()
+        return self._entries[elem]
+
+    def all(self):
+        """Return all indexed changes in document order."""
+        self._apply_pending()
+        return self.sort(self._entries)
+
+    def by_id(self, change_id):
+        """Return changes with the given w:id in document order."""
+        self._apply_pending()
+        return self.sort(self._ids.get(change_id, ()))
+
+    def by_author(self, author):
+        """Return changes by the given author in document order."""
+        self._apply_pending()
+        return self.sort(self._authors.get(author, ()))
+
+    def in_paragraphs(self, start, stop):
+        """Yield (ordinal, element) for changes in paragraphs start..stop-1."""
+        self._ensure_order()
+        for ordinal in range(max(start, 0), min(stop, len(self._paragraphs))):
+            for elem in self._paragraphs[ordinal]:
+                yield ordinal, elem
+
+    def newer_than(self, since):
+        """Return dated changes strictly newer than since, oldest first."""
+        self._ensure_order()
+        if self._dated is None:
+            self._dated = sorted(
+                (date, self._order[elem][0], elem)
+                for elem, (_, _, date) in self._entries.items()
+                if date is not None
+            )
+        first = bisect.bisect_right(self._dated, (since, float("inf")))
+        return [elem for _, _, elem in self._dated[first:]]
+
+    def sort(self, elements):
+        """Return elements sorted by document order."""
+        self._ensure_order()
+        return sorted(elements, key=lambda elem: self._order[elem][0])
+
+    def _add(self, elem):
+        change_id = elem.getAttribute("w:id")
+        author = elem.getAttribute("w:author")
+        date = elem.getAttribute("w:date")
+        try:
+            date = _parse_change_date(date) if date else None
+        except ValueError:
+            date = None
+        self._entries[elem] = (change_id, author, date)
+        self._ids.setdefault(change_id, {})[elem] = None
+        self._authors.setdefault(author, {})[elem] = None
+
+    def _discard(self, elem):
+        entry = self._entries.pop(elem, None)
+        if entry is None:
+            return
+        change_id, author, _ = entry
+        self._ids[change_id].pop(elem, None)
+        self._authors[author].pop(elem, None)
+
+    def _remove_subtree(self, node):
+        """Drop the changes inside a removed subtree, keeping positions if possible."""
+        for elem in _iter_elements(node, ("w:p", "w:ins", "w:del")):
+            if elem.tagName == "w:p":
+                # Later paragraph ordinals shift
+                self._order = self._paragraphs = None
+                continue
+            if elem not in self._entries:
+                continue
+            self._discard(elem)
+            self._dated = None
+            if self._order is None:
+                continue
+            # Positions of the remaining elements keep their relative order
+            _, ordinal = self._order.pop(elem, (None, None))
+            if ordinal is not None and self._paragraphs is not None:
+                self._paragraphs[ordinal].remove(elem)
+
+    def _apply_pending(self):
+        """Read every change inside subtrees inserted since the last query."""
+        if not self._pending:
+            return
+        affected = {}
+        for node in self._pending:
+            for elem in _iter_elements(node, ("w:p", "w:ins", "w:del")):
+                affected[elem] = None
+        self._pending.clear()
+        if not affected:
+            return
+        # New paragraphs or changes need positions
+        self._order = self._paragraphs = self._dated = None
+        for elem in affected:
+            if elem.tagName == "w:p":
+                continue
+            self._discard(elem)
+            if _is_attached(elem, self._dom):
+                self._add(elem)
+
+    def _ensure_order(self):
+        """Compute document positions and paragraph ordinals if the tree changed."""
+        self._apply_pending()
+        if self._order is not None:
+            return
+        self._order, self._paragraphs = {}, []
+        ordinals = {}
+        for position, elem in enumerate(
+            _iter_elements(self._dom.documentElement, ("w:p", "w:ins", "w:del"))
+        ):
+            if elem.tagName == "w:p":
+                ordinals[elem] = len(self._paragraphs)
+                self._paragraphs.append([])
+                continue
+            # The enclosing paragraph precedes its content in document order
+            para = elem.parentNode
+            while para is not None and para.nodeName != "w:p":
+                para = para.parentNode
+            ordinal = ordinals.get(para)
+            if ordinal is not None:
+                self._paragraphs[ordinal].append(elem)
+            self._order[elem] = (position, ordinal)
+
+
+def _find_element(nodes, tag):
+    """Return the first element with the given tag among nodes or their descendants."""
+    for node in nodes:
+        if node.nodeType != node.ELEMENT_NODE:
+            continue
+        if node.tagName == tag:
+            return node
+        found = node.getElementsByTagName(tag)
+        if found:
+            return found[0]
+    return None
+
+
+# 8-digit hex values of paraId/textId/durableId/RSID attributes and of
+# <w:rsid w:val="..."/> entries in settings.xml, whatever the prefix. Names,
+# prefixes and whitespace are bounded so that a match is never longer than
+# _ID_MATCH_LIMIT bytes.
+_ID_PATTERN = re.compile(
+    rb'(?:paraId|paraIdParent|textId|durableId|rsid[A-Za-z]{0,16})="([0-9A-Fa-f]{8})"'
+    rb'|<\w{1,32}:rsid(?:Root)?\s{1,32}\w{1,32}:val="([0-9A-Fa-f]{8})"'
+)
+_ID_MATCH_LIMIT = 128
+# Bytes of a part read at a time when scanning for IDs
+_ID_SCAN_CHUNK_SIZE = 1 << 20
+
+
+class _IdAllocator:
+    """Hands out paraId/textId/durableId and RSID values unique in a package.
+
+    Seeded with one scan of the existing IDs; every value handed out or
+    reserved afterwards is added to the same set, so new IDs never collide
+    and no rescan is needed. All four kinds share one pool, which is stricter
+    than OOXML requires but keeps the bookkeeping to a single set.
+    """
+
+    def __init__(self, seed=None):
+        """
+        Args:
+            seed: Optional seed. With a seed, the same package and sequence of
+                edits always produces the same IDs; without, IDs are random.
+        """
+        self._used = set()
+        self._random = random.Random(seed)
 
-def _generate_rsid() -> str:
-    """Generate random 8-character hex RSID."""
-    return "".join(random.choices("0123456789ABCDEF", k=8))
+    def scan(self, paths):
+        """Reserve every ID found in the given XML files.
+
+        Files are read in chunks; the last _ID_MATCH_LIMIT bytes of each chunk
+        are searched again with the next one, so IDs split across a chunk
+        boundary are still found.
+        """
+        for path in paths:
+            with open(path, "rb") as f:
+                tail = b""
+                while True:
+                    chunk = f.read(_ID_SCAN_CHUNK_SIZE)
+                    data = tail + chunk
+                    # Matches starting past the cutoff may continue in the next chunk
+                    cutoff = len(data) - _ID_MATCH_LIMIT if chunk else len(data)
+                    resume = max(cutoff, 0)
+                    for match in _ID_PATTERN.finditer(data):
+                        if match.start() >= cutoff:
+                            break
+                        self._used.add(
+                            (match.group(1) or match.group(2)).decode().upper()
+                        )
+                        resume = max(resume, match.end())
+                    if not chunk:
+                        break
+                    tail = data[resume:]
+
+    def reserve(self, value):
+        """Mark an existing ID as taken."""
+        if value:
+            self._used.add(value.upper())
+
+    def hex_id(self) -> str:
+        """Allocate an 8-character hex ID for para/durable IDs.
+
+        Values are constrained to be less than 0x7FFFFFFF per OOXML spec:
+        - paraId must be < 0x80000000
+        - durableId must be < 0x7FFFFFFF
+        We use the stricter constraint (0x7FFFFFFF) for both.
+        """
+        return self._allocate(lambda: f"{self._random.randint(1, 0x7FFFFFFE):08X}")
+
+    def rsid(self) -> str:
+        """Allocate an 8-character hex RSID."""
+        return self._allocate(
+            lambda: "".join(self._random.choices("0123456789ABCDEF", k=8))
+        )
+
+    def _allocate(self, generate):
+        value = generate()
+        while value in self._used:
+            value = generate()
+        self._used.add(value)
+        return value
+
+
+# Comment parts maintained by Document, in the order they are flushed
+COMMENT_PARTS = (
+    "word/comments.xml",
+    "word/commentsExtended.xml",
+    "word/commentsIds.xml",
+    "word/commentsExtensible.xml",
+)
+
+
+class _CommentStore:
+    """In-memory index of comments and the queue of comments not yet written.
+
+    Attributes:
+        comments: comment id -> {"para_id", "durable_id", "author", "parent"}, where
+            parent is the comment id of the thread parent or None
+        para_ids: para id -> comment id
+        anchors: comment id -> (w:commentRangeStart, w:commentReference) elements
+            in document.xml, filled in as comments are added or looked up
+        pending: Comments added since the last flush, in insertion order
+        next_id: Next free comment id
+    """
+
+    def __init__(self):
+        self.comments = {}
+        self.para_ids = {}
+        self.anchors = {}
+        self.pending = []
+        self.next_id = 0
+
+    def register(self, comment_id, para_id, durable_id=None, author=None, parent=None):
+        """Record a comment in the indexes."""
+        self.comments[comment_id] = {
+            "para_id": para_id,
+            "durable_id": durable_id,
+            "author": author,
+            "parent": parent,
+        }
+        self.para_ids[para_id] = comment_id
+        self.next_id = max(self.next_id, comment_id + 1)
 
 
 class Document:
@@ -619,6 +1342,7 @@ class Document:
         track_revisions=False,
         author="Claude",
         initials="C",
+        seed=None,
     ):
         """
         Initialize with path to unpacked Word document directory.
@@ -630,6 +1354,8 @@ class Document:
             track_revisions: If True, enables track revisions in settings.xml (default: False)
             author: Default author name for comments (default: "Claude")
             initials: Default author initials for comments (default: "C")
+            seed: Optional seed for reproducible paraIds, durableIds and RSID.
+                New IDs never collide with IDs already in the document.
         """
         self.original_path = Path(unpacked_dir)
 
@@ -642,13 +1368,19 @@ class Document:
         shutil.copytree(self.original_path, self.unpacked_path)
 
         # Pack original directory into temporary .docx for validation baseline (outside unpacked dir)
+        from ooxml.scripts.pack import pack_document
+
         self.original_docx = Path(self.temp_dir) / "original.docx"
         pack_document(self.original_path, self.original_docx, validate=False)
 
         self.word_path = self.unpacked_path / "word"
 
+        # One scan of existing paraId/textId/durableId/RSID values for all parts
+        self._ids = _IdAllocator(seed)
+        self._ids.scan(self.unpacked_path.rglob("*.xml"))
+
         # Generate RSID if not provided
-        self.rsid = rsid if rsid else _generate_rsid()
+        self.rsid = rsid if rsid else self._ids.rsid()
         print(f"Using RSID: {self.rsid}")
 
         # Set default author and initials
@@ -657,6 +1389,8 @@ class Document:
 
         # Cache for lazy-loaded editors
         self._editors = {}
+        # (xml_path, tag, attribute) -> attribute values, see _values_in_part
+        self._part_values = {}
 
         # Comment file paths
         self.comments_path = self.word_path / "comments.xml"
@@ -665,8 +1399,10 @@ class Document:
         self.comments_extensible_path = self.word_path / "commentsExtensible.xml"
 
         # Load existing comments and determine next ID (before setup modifies files)
-        self.existing_comments = self._load_existing_comments()
-        self.next_comment_id = self._get_next_comment_id()
+        self._comments = _CommentStore()
+        self._load_existing_comments()
+        self.existing_comments = self._comments.comments
+        self.next_comment_id = self._comments.next_id
 
         # Convenient access to document.xml editor (semi-private)
         self._document = self["word/document.xml"]
@@ -700,13 +1436,19 @@ class Document:
             # Get node from comments.xml
             comment = doc["word/comments.xml"].get_node(tag="w:comment", attrs={"w:id": "0"})
         """
+        if xml_path in COMMENT_PARTS and self._comments.pending:
+            self._flush_comments()
         if xml_path not in self._editors:
             file_path = self.unpacked_path / xml_path
             if not file_path.exists():
                 raise ValueError(f"XML file not found: {xml_path}")
             # Use DocxXMLEditor with RSID, author, and initials for all editors
             self._editors[xml_path] = DocxXMLEditor(
-                file_path, rsid=self.rsid, author=self.author, initials=self.initials
+                file_path,
+                rsid=self.rsid,
+                author=self.author,
+                initials=self.initials,
+                ids=self._ids,
             )
         return self._editors[xml_path]
 
@@ -728,37 +1470,33 @@ class Document:
             cm.add_comment(start=start_node, end=end_node, text="Explanation")
         """
         comment_id = self.next_comment_id
-        para_id = _generate_hex_id()
-        durable_id = _generate_hex_id()
-        timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        para_id = self._ids.hex_id()
+        durable_id = self._ids.hex_id()
+        timestamp = _utc_timestamp()
 
         # Add comment ranges to document.xml immediately
-        self._document.insert_before(start, self._comment_range_start_xml(comment_id))
+        start_nodes = self._document.insert_before(
+            start, self._comment_range_start_xml(comment_id)
+        )
 
         # If end node is a paragraph, append comment markup inside it
         # Otherwise insert after it (for run-level anchors)
         if end.tagName == "w:p":
-            self._document.append_to(end, self._comment_range_end_xml(comment_id))
+            end_nodes = self._document.append_to(
+                end, self._comment_range_end_xml(comment_id)
+            )
         else:
-            self._document.insert_after(end, self._comment_range_end_xml(comment_id))
+            end_nodes = self._document.insert_after(
+                end, self._comment_range_end_xml(comment_id)
+            )
 
-        # Add to comments.xml immediately
-        self._add_to_comments_xml(
-            comment_id, para_id, text, self.author, self.initials, timestamp
+        # Queue the comment parts; they are written in one batch by _flush_comments
+        self._queue_comment(comment_id, para_id, durable_id, text, timestamp, None)
+        self._comments.anchors[comment_id] = (
+            _find_element(start_nodes, "w:commentRangeStart"),
+            _find_element(end_nodes, "w:commentReference"),
         )
 
-        # Add to commentsExtended.xml immediately
-        self._add_to_comments_extended_xml(para_id, parent_para_id=None)
-
-        # Add to commentsIds.xml immediately
-        self._add_to_comments_ids_xml(para_id, durable_id)
-
-        # Add to commentsExtensible.xml immediately
-        self._add_to_comments_extensible_xml(durable_id)
-
-        # Update existing_comments so replies work
-        self.existing_comments[comment_id] = {"para_id": para_id}
-
         self.next_comment_id += 1
         return comment_id
 
@@ -783,57 +1521,61 @@ class Document:
         if parent_comment_id not in self.existing_comments:
             raise ValueError(f"Parent comment with id={parent_comment_id} not found")
 
-        parent_info = self.existing_comments[parent_comment_id]
         comment_id = self.next_comment_id
-        para_id = _generate_hex_id()
-        durable_id = _generate_hex_id()
-        timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        para_id = self._ids.hex_id()
+        durable_id = self._ids.hex_id()
+        timestamp = _utc_timestamp()
 
         # Add comment ranges to document.xml immediately
-        parent_start_elem = self._document.get_node(
-            tag="w:commentRangeStart", attrs={"w:id": str(parent_comment_id)}
-        )
-        parent_ref_elem = self._document.get_node(
-            tag="w:commentReference", attrs={"w:id": str(parent_comment_id)}
+        parent_start_elem, parent_ref_elem = self._get_comment_anchors(
+            parent_comment_id
         )
 
-        self._document.insert_after(
+        start_nodes = self._document.insert_after(
             parent_start_elem, self._comment_range_start_xml(comment_id)
         )
         parent_ref_run = parent_ref_elem.parentNode
         self._document.insert_after(
             parent_ref_run, f'<w:commentRangeEnd w:id="{comment_id}"/>'
         )
-        self._document.insert_after(
+        ref_nodes = self._document.insert_after(
             parent_ref_run, self._comment_ref_run_xml(comment_id)
         )
 
-        # Add to comments.xml immediately
-        self._add_to_comments_xml(
-            comment_id, para_id, text, self.author, self.initials, timestamp
+        # Queue the comment parts (with thread parent) for the next flush
+        self._queue_comment(
+            comment_id, para_id, durable_id, text, timestamp, parent_comment_id
         )
-
-        # Add to commentsExtended.xml immediately (with parent)
-        self._add_to_comments_extended_xml(
-            para_id, parent_para_id=parent_info["para_id"]
+        self._comments.anchors[comment_id] = (
+            _find_element(start_nodes, "w:commentRangeStart"),
+            _find_element(ref_nodes, "w:commentReference"),
         )
 
-        # Add to commentsIds.xml immediately
-        self._add_to_comments_ids_xml(para_id, durable_id)
+        self.next_comment_id += 1
+        return comment_id
 
-        # Add to commentsExtensible.xml immediately
-        self._add_to_comments_extensible_xml(durable_id)
+    def close(self) -> None:
+        """
+        Remove the temporary working directory.
 
-        # Update existing_comments so replies work
-        self.existing_comments[comment_id] = {"para_id": para_id}
+        Safe to call more than once. Unsaved edits are discarded, so call save()
+        first. Prefer using the Document as a context manager, which closes it on
+        exit; relying on garbage collection is unreliable in worker processes.
+        """
+        temp_dir = getattr(self, "temp_dir", None)
+        if temp_dir and Path(temp_dir).exists():
+            shutil.rmtree(temp_dir, ignore_errors=True)
 
-        self.next_comment_id += 1
-        return comment_id
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
 
     def __del__(self):
         """Clean up temporary directory on deletion."""
-        if hasattr(self, "temp_dir") and Path(self.temp_dir).exists():
-            shutil.rmtree(self.temp_dir)
+        self.close()
 
     def validate(self) -> None:
         """
@@ -842,6 +1584,9 @@ class Document:
         Raises:
             ValueError: If validation fails.
         """
+        from ooxml.scripts.validation.docx import DOCXSchemaValidator
+        from ooxml.scripts.validation.redlining import RedliningValidator
+
         # Create validators with current state
         schema_validator = DOCXSchemaValidator(
             self.unpacked_path, self.original_docx, verbose=False
@@ -860,12 +1605,16 @@ class Document:
         """
         Save all modified XML files to disk and copy to destination directory.
 
-        This persists all changes made via add_comment() and reply_to_comment().
+        This persists all changes made via add_comment() and reply_to_comment(),
+        writing queued comments to the comment parts first.
 
         Args:
             destination: Optional path to save to. If None, saves back to original directory.
             validate: If True, validates document before saving (default: True).
         """
+        # Write queued comments to the comment parts
+        self._flush_comments()
+
         # Only ensure comment relationships and content types if comment files exist
         if self.comments_path.exists():
             self._ensure_comment_relationships()
@@ -885,34 +1634,27 @@ class Document:
 
     # ==================== Private: Initialization ====================
 
-    def _get_next_comment_id(self):
-        """Get the next available comment ID."""
-        if not self.comments_path.exists():
-            return 0
-
-        editor = self["word/comments.xml"]
-        max_id = -1
-        for comment_elem in editor.dom.getElementsByTagName("w:comment"):
-            comment_id = comment_elem.getAttribute("w:id")
-            if comment_id:
-                try:
-                    max_id = max(max_id, int(comment_id))
-                except ValueError:
-                    pass
-        return max_id + 1
-
     def _load_existing_comments(self):
-        """Load existing comments from files to enable replies."""
+        """Load existing comments from the comment parts to enable replies.
+
+        Reads ids, para ids and authors from comments.xml, thread parents from
+        commentsExtended.xml and durable ids from commentsIds.xml into the
+        comment store.
+        """
+        store = self._comments
         if not self.comments_path.exists():
-            return {}
+            return
 
         editor = self["word/comments.xml"]
-        existing = {}
-
         for comment_elem in editor.dom.getElementsByTagName("w:comment"):
             comment_id = comment_elem.getAttribute("w:id")
             if not comment_id:
                 continue
+            try:
+                comment_id = int(comment_id)
+            except ValueError:
+                continue
+            store.next_id = max(store.next_id, comment_id + 1)
 
             # Find para_id from the w:p element within the comment
             para_id = None
@@ -924,9 +1666,28 @@ class Document:
             if not para_id:
                 continue
 
-            existing[int(comment_id)] = {"para_id": para_id}
+            store.register(
+                comment_id, para_id, author=comment_elem.getAttribute("w:author")
+            )
 
-        return existing
+        if self.comments_extended_path.exists():
+            editor = self["word/commentsExtended.xml"]
+            for elem in editor.dom.getElementsByTagName("w15:commentEx"):
+                comment_id = store.para_ids.get(elem.getAttribute("w15:paraId"))
+                parent_para_id = elem.getAttribute("w15:paraIdParent")
+                if comment_id is not None and parent_para_id:
+                    store.comments[comment_id]["parent"] = store.para_ids.get(
+                        parent_para_id
+                    )
+
+        if self.comments_ids_path.exists():
+            editor = self["word/commentsIds.xml"]
+            for elem in editor.dom.getElementsByTagName("w16cid:commentId"):
+                comment_id = store.para_ids.get(elem.getAttribute("w16cid:paraId"))
+                if comment_id is not None:
+                    store.comments[comment_id]["durable_id"] = elem.getAttribute(
+                        "w16cid:durableId"
+                    )
 
     # ==================== Private: Setup Methods ====================
 
@@ -961,19 +1722,20 @@ class Document:
         """Add people.xml content type to [Content_Types].xml if not already present."""
         editor = self["[Content_Types].xml"]
 
-        if self._has_override(editor, "/word/people.xml"):
+        if self._has_override("/word/people.xml"):
             return
 
         # Add Override element
         root = editor.dom.documentElement
         override_xml = '<Override PartName="/word/people.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.people+xml"/>'
         editor.append_to(root, override_xml)
+        self._override_part_names().add("/word/people.xml")
 
     def _add_relationship_for_people(self, path):
         """Add people.xml relationship to document.xml.rels if not already present."""
         editor = self["word/_rels/document.xml.rels"]
 
-        if self._has_relationship(editor, "people.xml"):
+        if self._has_relationship("people.xml"):
             return
 
         root = editor.dom.documentElement
@@ -984,6 +1746,7 @@ class Document:
         # Create the relationship entry
         rel_xml = f'<{prefix}Relationship Id="{next_rid}" Type="http://schemas.microsoft.com/office/2011/relationships/people" Target="people.xml"/>'
         editor.append_to(root, rel_xml)
+        self._relationship_targets().add("people.xml")
 
     def _update_settings(self, path, track_revisions=False):
         """Add RSID and optionally enable track revisions in settings.xml.
@@ -1065,68 +1828,112 @@ class Document:
 
     # ==================== Private: XML File Creation ====================
 
-    def _add_to_comments_xml(
-        self, comment_id, para_id, text, author, initials, timestamp
-    ):
-        """Add a single comment to comments.xml."""
-        if not self.comments_path.exists():
-            shutil.copy(TEMPLATE_DIR / "comments.xml", self.comments_path)
+    def _queue_comment(self, comment_id, para_id, durable_id, text, timestamp, parent):
+        """Index a new comment and queue its entries for the four comment parts."""
+        self._comments.register(
+            comment_id, para_id, durable_id, author=self.author, parent=parent
+        )
+        parent_para_id = (
+            self._comments.comments[parent]["para_id"] if parent is not None else None
+        )
+        self._comments.pending.append(
+            (
+                self._comment_xml(comment_id, para_id, text, timestamp),
+                self._comment_ex_xml(para_id, parent_para_id),
+                self._comment_id_xml(para_id, durable_id),
+                self._comment_extensible_xml(durable_id, timestamp),
+            )
+        )
 
-        editor = self["word/comments.xml"]
-        root = editor.get_node(tag="w:comments")
+    def _flush_comments(self):
+        """Append all queued comments to the comment parts, one batch per part.
+
+        Missing parts are created from templates. Each part is parsed and
+        extended once per flush regardless of how many comments were queued.
+        """
+        pending, self._comments.pending = self._comments.pending, []
+        if not pending:
+            return
 
+        parts = [
+            (self.comments_path, "w:comments"),
+            (self.comments_extended_path, "w15:commentsEx"),
+            (self.comments_ids_path, "w16cid:commentsIds"),
+            (self.comments_extensible_path, "w16cex:commentsExtensible"),
+        ]
+        for i, (xml_path, (path, root_tag)) in enumerate(zip(COMMENT_PARTS, parts)):
+            if not path.exists():
+                shutil.copy(TEMPLATE_DIR / path.name, path)
+            editor = self[xml_path]
+            root = editor.get_node(tag=root_tag)
+            editor.append_to(root, "".join(entry[i] for entry in pending))
+
+    def _comment_xml(self, comment_id, para_id, text, timestamp):
+        """Generate the w:comment entry for comments.xml."""
         escaped_text = (
             text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
         )
-        # Note: w:rsidR, w:rsidRDefault, w:rsidP on w:p, w:rsidR on w:r,
-        # and w:author, w:date, w:initials on w:comment are automatically added by DocxXMLEditor
-        comment_xml = f'''<w:comment w:id="{comment_id}">
+        author = html.escape(self.author, quote=True)
+        initials = html.escape(self.initials, quote=True)
+        # Note: w:rsidR, w:rsidRDefault, w:rsidP on w:p and w:rsidR on w:r are
+        # automatically added by DocxXMLEditor. Author and date are set here so that
+        # they reflect when the comment was added, not when the batch is written.
+        return f'''<w:comment w:id="{comment_id}" w:author="{author}" w:date="{timestamp}" w:initials="{initials}">
   <w:p w14:paraId="{para_id}" w14:textId="77777777">
     <w:r><w:rPr><w:rStyle w:val="CommentReference"/></w:rPr><w:annotationRef/></w:r>
     <w:r><w:rPr><w:color w:val="000000"/><w:sz w:val="20"/><w:szCs w:val="20"/></w:rPr><w:t>{escaped_text}</w:t></w:r>
   </w:p>
 </w:comment>'''
-        editor.append_to(root, comment_xml)
-
-    def _add_to_comments_extended_xml(self, para_id, parent_para_id):
-        """Add a single comment to commentsExtended.xml."""
-        if not self.comments_extended_path.exists():
-            shutil.copy(
-                TEMPLATE_DIR / "commentsExtended.xml", self.comments_extended_path
-            )
-
-        editor = self["word/commentsExtended.xml"]
-        root = editor.get_node(tag="w15:commentsEx")
 
+    def _comment_ex_xml(self, para_id, parent_para_id):
+        """Generate the w15:commentEx entry for commentsExtended.xml."""
         if parent_para_id:
-            xml = f'<w15:commentEx w15:paraId="{para_id}" w15:paraIdParent="{parent_para_id}" w15:done="0"/>'
-        else:
-            xml = f'<w15:commentEx w15:paraId="{para_id}" w15:done="0"/>'
-        editor.append_to(root, xml)
-
-    def _add_to_comments_ids_xml(self, para_id, durable_id):
-        """Add a single comment to commentsIds.xml."""
-        if not self.comments_ids_path.exists():
-            shutil.copy(TEMPLATE_DIR / "commentsIds.xml", self.comments_ids_path)
+            return f'<w15:commentEx w15:paraId="{para_id}" w15:paraIdParent="{parent_para_id}" w15:done="0"/>'
+        return f'<w15:commentEx w15:paraId="{para_id}" w15:done="0"/>'
 
-        editor = self["word/commentsIds.xml"]
-        root = editor.get_node(tag="w16cid:commentsIds")
+    def _comment_id_xml(self, para_id, durable_id):
+        """Generate the w16cid:commentId entry for commentsIds.xml."""
+        return f'<w16cid:commentId w16cid:paraId="{para_id}" w16cid:durableId="{durable_id}"/>'
 
-        xml = f'<w16cid:commentId w16cid:paraId="{para_id}" w16cid:durableId="{durable_id}"/>'
-        editor.append_to(root, xml)
+    def _comment_extensible_xml(self, durable_id, timestamp):
+        """Generate the w16cex:commentExtensible entry for commentsExtensible.xml."""
+        return f'<w16cex:commentExtensible w16cex:durableId="{durable_id}" w16cex:dateUtc="{timestamp}"/>'
 
-    def _add_to_comments_extensible_xml(self, durable_id):
-        """Add a single comment to commentsExtensible.xml."""
-        if not self.comments_extensible_path.exists():
-            shutil.copy(
-                TEMPLATE_DIR / "commentsExtensible.xml", self.comments_extensible_path
-            )
+    def _get_comment_anchors(self, comment_id):
+        """Return the (w:commentRangeStart, w:commentReference) elements of a comment.
 
-        editor = self["word/commentsExtensible.xml"]
-        root = editor.get_node(tag="w16cex:commentsExtensible")
+        Uses the anchors recorded by add_comment/reply_to_comment. Anchors of
+        comments that predate this session, or that were detached by later edits,
+        are found with a single scan of document.xml that indexes all comments.
 
-        xml = f'<w16cex:commentExtensible w16cex:durableId="{durable_id}"/>'
-        editor.append_to(root, xml)
+        Raises:
+            ValueError: If the comment has no range start or reference in document.xml
+        """
+        anchors = self._comments.anchors.get(comment_id)
+        if anchors is None or not all(
+            self._document._is_attached(elem) for elem in anchors
+        ):
+            starts, refs = {}, {}
+            for elem in self._document.dom.getElementsByTagName("w:commentRangeStart"):
+                starts.setdefault(elem.getAttribute("w:id"), elem)
+            for elem in self._document.dom.getElementsByTagName("w:commentReference"):
+                refs.setdefault(elem.getAttribute("w:id"), elem)
+            for key, start in starts.items():
+                if key in refs and key.isdigit():
+                    self._comments.anchors[int(key)] = (start, refs[key])
+            anchors = self._comments.anchors.get(comment_id)
+
+        if anchors is None:
+            # Not anchored in the document; get_node raises a descriptive error
+            return (
+                self._document.get_node(
+                    tag="w:commentRangeStart", attrs={"w:id": str(comment_id)}
+                ),
+                self._document.get_node(
+                    tag="w:commentReference", attrs={"w:id": str(comment_id)}
+                ),
+            )
+        return anchors
 
     # ==================== Private: XML Fragments ====================
 
@@ -1157,26 +1964,46 @@ class Document:
 
     # ==================== Private: Metadata Updates ====================
 
-    def _has_relationship(self, editor, target):
+    def _values_in_part(self, xml_path, tag, attribute):
+        """
+        Set of an attribute's values over the elements with a tag in one part.
+
+        Read from the DOM on first use; entries this class appends afterwards
+        are added to the returned set by the caller, so later checks need no walk.
+        """
+        key = (xml_path, tag, attribute)
+        values = self._part_values.get(key)
+        if values is None:
+            values = {
+                elem.getAttribute(attribute)
+                for elem in self[xml_path].dom.getElementsByTagName(tag)
+            }
+            self._part_values[key] = values
+        return values
+
+    def _relationship_targets(self):
+        """Targets of the relationships in document.xml.rels."""
+        return self._values_in_part("word/_rels/document.xml.rels", "Relationship", "Target")
+
+    def _override_part_names(self):
+        """Part names of the Override entries in [Content_Types].xml."""
+        return self._values_in_part("[Content_Types].xml", "Override", "PartName")
+
+    def _people_authors(self):
+        """Authors listed in people.xml."""
+        return self._values_in_part("word/people.xml", "w15:person", "w15:author")
+
+    def _has_relationship(self, target):
         """Check if a relationship with given target exists."""
-        for rel_elem in editor.dom.getElementsByTagName("Relationship"):
-            if rel_elem.getAttribute("Target") == target:
-                return True
-        return False
+        return target in self._relationship_targets()
 
-    def _has_override(self, editor, part_name):
+    def _has_override(self, part_name):
         """Check if an override with given part name exists."""
-        for override_elem in editor.dom.getElementsByTagName("Override"):
-            if override_elem.getAttribute("PartName") == part_name:
-                return True
-        return False
+        return part_name in self._override_part_names()
 
-    def _has_author(self, editor, author):
+    def _has_author(self, author):
         """Check if an author already exists in people.xml."""
-        for person_elem in editor.dom.getElementsByTagName("w15:person"):
-            if person_elem.getAttribute("w15:author") == author:
-                return True
-        return False
+        return author in self._people_authors()
 
     def _add_author_to_people(self, author):
         """Add author to people.xml (called during initialization)."""
@@ -1190,7 +2017,7 @@ class Document:
         root = editor.get_node(tag="w15:people")
 
         # Check if author already exists
-        if self._has_author(editor, author):
+        if self._has_author(author):
             return
 
         # Add author with proper XML escaping to prevent injection
@@ -1199,12 +2026,13 @@ class Document:
   <w15:presenceInfo w15:providerId="None" w15:userId="{escaped_author}"/>
 </w15:person>'''
         editor.append_to(root, person_xml)
+        self._people_authors().add(author)
 
     def _ensure_comment_relationships(self):
         """Ensure word/_rels/document.xml.rels has comment relationships."""
         editor = self["word/_rels/document.xml.rels"]
 
-        if self._has_relationship(editor, "comments.xml"):
+        if self._has_relationship("comments.xml"):
             return
 
         root = editor.dom.documentElement
@@ -1239,12 +2067,13 @@ class Document:
         for rel_id, rel_type, target in rels:
             rel_xml = f'<{prefix}Relationship Id="rId{rel_id}" Type="{rel_type}" Target="{target}"/>'
             editor.append_to(root, rel_xml)
+            self._relationship_targets().add(target)
 
     def _ensure_comment_content_types(self):
         """Ensure [Content_Types].xml has comment content types."""
         editor = self["[Content_Types].xml"]
 
-        if self._has_override(editor, "/word/comments.xml"):
+        if self._has_override("/word/comments.xml"):
             return
 
         root = editor.dom.documentElement
@@ -1274,3 +2103,4 @@ class Document:
                 f'<Override PartName="{part_name}" ContentType="{content_type}"/>'
             )
             editor.append_to(root, override_xml)
+            self._override_part_names().add(part_name)
@@ -4,7 +4,9 @@ Utilities for editing OOXML documents.
 
 This module provides XMLEditor, a tool for manipulating XML files with support for
 line-number-based node finding and DOM manipulation. Each element is automatically
-annotated with its original line and column position during parsing.
+annotated with its original line and column position during parsing. Positions are
+kept in compact arrays on the document rather than as per-element attributes, and
+attributes read from the file stay packed until something needs minidom Attr nodes.
 
 Example usage:
     editor = XMLEditor("document.xml")
@@ -31,12 +33,38 @@ Example usage:
 """
 
 import html
+import io
+import xml.dom.minidom
+import xml.dom.pulldom
+import xml.sax.expatreader
+import xml.sax.handler
+from array import array
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional, Union
+from xml.parsers.expat import ExpatError
 
 import defusedxml.minidom
 import defusedxml.sax
 
+# Maximum number of pre-parsed fragment templates kept per editor
+FRAGMENT_CACHE_SIZE = 256
+
+# Fragments longer than this (e.g. batched comment parts) are not cached
+FRAGMENT_CACHE_MAX_LENGTH = 64 * 1024
+
+# Buffer size for streaming serialization in XMLEditor.save
+SAVE_BUFFER_SIZE = 1024 * 1024
+
+# Length of the n-grams used by the contains= text index
+TEXT_INDEX_GRAM = 3
+
+XMLNS_NAMESPACE = "http://www.w3.org/2000/xmlns/"
+
+# Base-class slots behind the _attrs/_attrsNS properties of _TrackedElement
+_ELEMENT_ATTRS = xml.dom.minidom.Element._attrs
+_ELEMENT_ATTRS_NS = xml.dom.minidom.Element._attrsNS
+
 
 class XMLEditor:
     """
@@ -49,7 +77,7 @@ class XMLEditor:
     Attributes:
         xml_path: Path to the XML file being edited
         encoding: Detected encoding of the XML file ('ascii' or 'utf-8')
-        dom: Parsed DOM tree with parse_position attributes on elements
+        dom: Parsed DOM tree; elements from the original file expose parse_position
     """
 
     def __init__(self, xml_path):
@@ -70,8 +98,15 @@ class XMLEditor:
             header = f.read(200).decode("utf-8", errors="ignore")
         self.encoding = "ascii" if 'encoding="ascii"' in header else "utf-8"
 
-        parser = _create_line_tracking_parser()
-        self.dom = defusedxml.minidom.parse(str(self.xml_path), parser)
+        self.dom = _parse_tracked(self.xml_path)
+
+        # Namespace prelude for fragment parsing, rebuilt only when declarations change
+        self._ns_decl = None
+        # Pre-parsed fragment documents keyed by XML string (LRU order)
+        self._fragment_cache = OrderedDict()
+        # Text indexes for get_node(contains=...), built lazily per tag name
+        self._text_indexes = {}
+        self.dom._change_listener = self._notify_changed
 
     def get_node(
         self,
@@ -92,6 +127,8 @@ class XMLEditor:
             line_number: Line number (int) or line range (range) in original XML file (1-indexed)
             contains: Text string that must appear in any text node within the element.
                       Supports both entity notation (&#8220;) and Unicode characters (\u201c).
+                      Served from a per-tag text index built on first use and kept
+                      up to date as the DOM is edited.
 
         Returns:
             defusedxml.minidom.Element: The matching DOM element
@@ -109,8 +146,15 @@ class XMLEditor:
             elem = editor.get_node(tag="w:t", contains="&#8220;Agreement")  # Entity notation
             elem = editor.get_node(tag="w:t", contains="\u201cAgreement")   # Unicode character
         """
+        if contains is not None:
+            # Normalize the search string: convert HTML entities to Unicode characters
+            # This allows searching for both "&#8220;Rowan" and ""Rowan"
+            candidates = self._get_text_index(tag).search(html.unescape(contains))
+        else:
+            candidates = self.dom.getElementsByTagName(tag)
+
         matches = []
-        for elem in self.dom.getElementsByTagName(tag):
+        for elem in candidates:
             # Check line_number filter
             if line_number is not None:
                 parse_pos = getattr(elem, "parse_position", (None,))
@@ -132,15 +176,6 @@ class XMLEditor:
                 ):
                     continue
 
-            # Check contains filter
-            if contains is not None:
-                elem_text = self._get_element_text(elem)
-                # Normalize the search string: convert HTML entities to Unicode characters
-                # This allows searching for both "&#8220;Rowan" and ""Rowan"
-                normalized_contains = html.unescape(contains)
-                if normalized_contains not in elem_text:
-                    continue
-
             # If all applicable filters passed, this is a match
             matches.append(elem)
 
@@ -203,6 +238,35 @@ class XMLEditor:
                 text_parts.append(self._get_element_text(node))
         return "".join(text_parts)
 
+    def _get_text_index(self, tag):
+        """Return the text index for a tag name, building it on first use."""
+        index = self._text_indexes.get(tag)
+        if index is None:
+            index = _TextIndex(self.dom, tag, self._get_element_text)
+            self._text_indexes[tag] = index
+        return index
+
+    def _is_attached(self, node):
+        """Check whether a node is still part of this editor's document tree."""
+        return _is_attached(node, self.dom)
+
+    def _notify_changed(self, parent, node):
+        """
+        Record that the children or the text of parent changed through node.
+
+        Called by the DOM for every child-list mutation and every write to a text
+        node's data, whether it comes from the editor methods or from direct
+        minidom calls. Mutations outside the document (such as building an
+        imported fragment) are ignored; the fragment is picked up when it is
+        inserted. Indexes whose pending changes outgrow the index itself are
+        dropped and rebuilt on their next query.
+        """
+        if not self._text_indexes or not self._is_attached(parent):
+            return
+        for tag, index in list(self._text_indexes.items()):
+            if not index.mark_changed(parent, node):
+                del self._text_indexes[tag]
+
     def replace_node(self, elem, new_content):
         """
         Replace a DOM element with new XML content.
@@ -303,16 +367,70 @@ class XMLEditor:
         """
         Save the edited XML back to the file.
 
-        Serializes the DOM tree and writes it back to the original file path,
-        preserving the original encoding (ascii or utf-8).
+        Streams the serialized DOM tree through a buffered writer instead of
+        building the whole document in memory, preserving the original encoding
+        (ascii or utf-8). Output is byte-identical to dom.toxml(encoding=...).
+        The file is written to a temporary sibling and moved into place, so a
+        failed save leaves the original untouched.
+        """
+        tmp_path = self.xml_path.with_name(self.xml_path.name + ".tmp")
+        try:
+            with open(tmp_path, "wb", buffering=SAVE_BUFFER_SIZE) as raw:
+                # Same writer setup as minidom's toxml(encoding=...)
+                writer = io.TextIOWrapper(
+                    raw,
+                    encoding=self.encoding,
+                    errors="xmlcharrefreplace",
+                    newline="\n",
+                )
+                self.dom.writexml(writer, encoding=self.encoding)
+                writer.flush()
+                writer.detach()
+            tmp_path.replace(self.xml_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    def _declare_namespace(self, prefix, uri):
+        """
+        Declare a namespace prefix on the root element if not already present.
+
+        Invalidates the cached namespace prelude and fragment templates so that
+        subsequent fragments can use the new prefix.
+
+        Args:
+            prefix: Namespace prefix (e.g., "w14")
+            uri: Namespace URI
         """
-        content = self.dom.toxml(encoding=self.encoding)
-        self.xml_path.write_bytes(content)
+        root = self.dom.documentElement
+        if not root.hasAttribute(f"xmlns:{prefix}"):  # type: ignore
+            root.setAttribute(f"xmlns:{prefix}", uri)  # type: ignore
+            self._invalidate_namespace_cache()
+
+    def _invalidate_namespace_cache(self):
+        """Drop the cached namespace prelude and all fragment templates."""
+        self._ns_decl = None
+        self._fragment_cache.clear()
+
+    def _namespace_prelude(self):
+        """Return the xmlns declarations of the root element as an attribute string."""
+        if self._ns_decl is None:
+            root_elem = self.dom.documentElement
+            namespaces = []
+            if root_elem and root_elem.attributes:
+                for i in range(root_elem.attributes.length):
+                    attr = root_elem.attributes.item(i)
+                    if attr.name.startswith("xmlns"):  # type: ignore
+                        namespaces.append(f'{attr.name}="{attr.value}"')  # type: ignore
+            self._ns_decl = " ".join(namespaces)
+        return self._ns_decl
 
     def _parse_fragment(self, xml_content):
         """
         Parse XML fragment and return list of imported nodes.
 
+        Repeated fragments are parsed once and cloned from a cached template.
+
         Args:
             xml_content: String containing XML fragment
 
@@ -322,18 +440,25 @@ class XMLEditor:
         Raises:
             AssertionError: If fragment contains no element nodes
         """
-        # Extract namespace declarations from the root document element
-        root_elem = self.dom.documentElement
-        namespaces = []
-        if root_elem and root_elem.attributes:
-            for i in range(root_elem.attributes.length):
-                attr = root_elem.attributes.item(i)
-                if attr.name.startswith("xmlns"):  # type: ignore
-                    namespaces.append(f'{attr.name}="{attr.value}"')  # type: ignore
-
-        ns_decl = " ".join(namespaces)
-        wrapper = f"<root {ns_decl}>{xml_content}</root>"
-        fragment_doc = defusedxml.minidom.parseString(wrapper)
+        fragment_doc = self._fragment_cache.get(xml_content)
+        if fragment_doc is not None:
+            self._fragment_cache.move_to_end(xml_content)
+        else:
+            try:
+                fragment_doc = defusedxml.minidom.parseString(
+                    f"<root {self._namespace_prelude()}>{xml_content}</root>"
+                )
+            except ExpatError:
+                # Declarations may have been added directly on the DOM; rebuild and retry
+                self._invalidate_namespace_cache()
+                fragment_doc = defusedxml.minidom.parseString(
+                    f"<root {self._namespace_prelude()}>{xml_content}</root>"
+                )
+            if len(xml_content) <= FRAGMENT_CACHE_MAX_LENGTH:
+                self._fragment_cache[xml_content] = fragment_doc
+                if len(self._fragment_cache) > FRAGMENT_CACHE_SIZE:
+                    self._fragment_cache.popitem(last=False)
+
         nodes = [
             self.dom.importNode(child, deep=True)
             for child in fragment_doc.documentElement.childNodes  # type: ignore
@@ -343,32 +468,566 @@ class XMLEditor:
         return nodes
 
 
-def _create_line_tracking_parser():
+class _TrackedElement(xml.dom.minidom.Element):
+    """
+    Element whose source position lives in its document's position arrays.
+
+    minidom nodes get a per-instance __dict__ as soon as any attribute is set on
+    them. Storing only a slot index here, with the line and column numbers in
+    parallel array('I') columns on the document, avoids a dict and a tuple per
+    element. Elements created after parsing have no index and no parse_position.
+
+    Attributes read from the file are kept packed in one flat
+    (qname, namespaceURI, value, ...) tuple. minidom's two attribute dicts and
+    the Attr objects in them (each with its own NodeList and Text child) are
+    only built when something needs them: attribute nodes, the attributes map
+    or any write. Reads through getAttribute/getAttributeNS/hasAttribute and
+    serialization leave the packed form in place.
     """
-    Create a SAX parser that tracks line and column numbers for each element.
 
-    Monkey patches the SAX content handler to store the current line and column
-    position from the underlying expat parser onto each element as a parse_position
-    attribute (line, column) tuple.
+    __slots__ = ("_position", "_packed_attrs")
+
+    def __init__(self, tagName, namespaceURI=None, prefix=None, localName=None):
+        super().__init__(tagName, namespaceURI, prefix, localName)
+        self._packed_attrs = None
+
+    @property
+    def parse_position(self):
+        """(line, column) of the element's start tag in the original file."""
+        index = self._position  # AttributeError for elements created after parsing
+        doc = self.ownerDocument
+        return (doc._lines[index], doc._columns[index])
+
+    # minidom reads and writes _attrs/_attrsNS directly; these properties unpack
+    # the attributes on first access and otherwise defer to the base slots.
+
+    def _unpack_attrs(self):
+        packed = self._packed_attrs
+        self._packed_attrs = None
+        _ELEMENT_ATTRS.__set__(self, {})
+        _ELEMENT_ATTRS_NS.__set__(self, {})
+        for i in range(0, len(packed), 3):
+            # The base method: unpacking is not an attribute change
+            xml.dom.minidom.Element.setAttributeNS(
+                self, packed[i + 1], packed[i], packed[i + 2]
+            )
 
-    Returns:
-        defusedxml.sax.xmlreader.XMLReader: Configured SAX parser
+    def _get_attrs(self):
+        if self._packed_attrs is not None:
+            self._unpack_attrs()
+        return _ELEMENT_ATTRS.__get__(self)
+
+    def _get_attrs_ns(self):
+        if self._packed_attrs is not None:
+            self._unpack_attrs()
+        return _ELEMENT_ATTRS_NS.__get__(self)
+
+    _attrs = property(_get_attrs, _ELEMENT_ATTRS.__set__)
+    _attrsNS = property(_get_attrs_ns, _ELEMENT_ATTRS_NS.__set__)
+
+    def getAttribute(self, attname):
+        packed = self._packed_attrs
+        if packed is None:
+            return super().getAttribute(attname)
+        for i in range(0, len(packed), 3):
+            if packed[i] == attname:
+                return packed[i + 2]
+        return ""
+
+    def getAttributeNS(self, namespaceURI, localName):
+        packed = self._packed_attrs
+        if packed is None:
+            return super().getAttributeNS(namespaceURI, localName)
+        for i in range(0, len(packed), 3):
+            if packed[i + 1] == namespaceURI and _local_name(packed[i]) == localName:
+                return packed[i + 2]
+        return ""
+
+    def hasAttribute(self, name):
+        packed = self._packed_attrs
+        if packed is None:
+            return super().hasAttribute(name)
+        return name in packed[::3]
+
+    def hasAttributeNS(self, namespaceURI, localName):
+        packed = self._packed_attrs
+        if packed is None:
+            return super().hasAttributeNS(namespaceURI, localName)
+        return any(
+            packed[i + 1] == namespaceURI and _local_name(packed[i]) == localName
+            for i in range(0, len(packed), 3)
+        )
+
+    def hasAttributes(self):
+        return self._packed_attrs is not None or super().hasAttributes()
+
+    def writexml(self, writer, indent="", addindent="", newl=""):
+        packed = self._packed_attrs
+        if packed is None:
+            return super().writexml(writer, indent, addindent, newl)
+        # minidom writes each attribute as attributes[name].value, escaped its
+        # own way; serve those values from the packed tuple for the duration of
+        # the call instead of building Attr objects
+        self._packed_attrs = None
+        _ELEMENT_ATTRS.__set__(
+            self,
+            {packed[i]: _AttrValue(packed[i + 2]) for i in range(0, len(packed), 3)},
+        )
+        _ELEMENT_ATTRS_NS.__set__(self, {})
+        try:
+            super().writexml(writer, indent, addindent, newl)
+        finally:
+            _ELEMENT_ATTRS.__set__(self, None)
+            _ELEMENT_ATTRS_NS.__set__(self, None)
+            self._packed_attrs = packed
+
+    # Attribute writes are reported to the owning editor so that indexes keyed
+    # on attribute values can re-read the element.
+
+    def _notify_attribute_changed(self):
+        listener = self.ownerDocument._attribute_listener
+        if listener is not None:
+            listener(self)
+
+    def setAttribute(self, attname, value):
+        super().setAttribute(attname, value)
+        self._notify_attribute_changed()
+
+    def setAttributeNS(self, namespaceURI, qualifiedName, value):
+        super().setAttributeNS(namespaceURI, qualifiedName, value)
+        self._notify_attribute_changed()
+
+    def removeAttribute(self, name):
+        super().removeAttribute(name)
+        self._notify_attribute_changed()
+
+    def removeAttributeNS(self, namespaceURI, localName):
+        super().removeAttributeNS(namespaceURI, localName)
+        self._notify_attribute_changed()
+
+    # Child-list mutations are reported to the owning editor so that derived
+    # structures such as the text index can be updated incrementally.
+
+    def _notify_changed(self, node):
+        listener = self.ownerDocument._change_listener
+        if listener is not None:
+            listener(self, node)
+
+    def appendChild(self, node):
+        result = super().appendChild(node)
+        self._notify_changed(node)
+        return result
+
+    def insertBefore(self, newChild, refChild):
+        result = super().insertBefore(newChild, refChild)
+        self._notify_changed(newChild)
+        return result
+
+    def removeChild(self, oldChild):
+        result = super().removeChild(oldChild)
+        self._notify_changed(oldChild)
+        return result
+
+    def replaceChild(self, newChild, oldChild):
+        result = super().replaceChild(newChild, oldChild)
+        self._notify_changed(newChild)
+        self._notify_changed(oldChild)
+        return result
+
+
+class _AttrValue:
+    """Stand-in for an Attr while a packed element is serialized."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+
+class _TrackedText(xml.dom.minidom.Text):
+    """Text node that reports changes to its data to the owning editor."""
+
+    __slots__ = ()
+
+    def _notify_changed(self):
+        doc = self.ownerDocument
+        if self.parentNode is not None and doc._change_listener is not None:
+            doc._change_listener(self.parentNode, self)
+
+    def _set_text_data(self, data):
+        xml.dom.minidom.Text.data.__set__(self, data)
+        self._notify_changed()
+
+    data = nodeValue = property(xml.dom.minidom.Text.data.__get__, _set_text_data)
+
+    def appendData(self, arg):
+        super().appendData(arg)
+        self._notify_changed()
+
+    def insertData(self, offset, arg):
+        super().insertData(offset, arg)
+        self._notify_changed()
+
+    def deleteData(self, offset, count):
+        super().deleteData(offset, count)
+        self._notify_changed()
+
+    def replaceData(self, offset, count, arg):
+        super().replaceData(offset, count, arg)
+        self._notify_changed()
+
+
+class _TrackedDocument(xml.dom.minidom.Document):
     """
+    Document that creates _TrackedElement nodes and stores their positions.
 
-    def set_content_handler(dom_handler):
-        def startElementNS(name, tagName, attrs):
-            orig_start_cb(name, tagName, attrs)
-            cur_elem = dom_handler.elementStack[-1]
-            cur_elem.parse_position = (
-                parser._parser.CurrentLineNumber,  # type: ignore
-                parser._parser.CurrentColumnNumber,  # type: ignore
+    Whitespace-only text (indentation between elements) is shared through a
+    per-document table, so a pretty-printed part does not hold one copy of the
+    same indentation string per text node.
+    """
+
+    __slots__ = (
+        "_lines",
+        "_columns",
+        "_whitespace",
+        "_change_listener",
+        "_attribute_listener",
+    )
+
+    def __init__(self):
+        super().__init__()
+        self._lines = array("I")
+        self._columns = array("I")
+        self._whitespace = {}
+        # Callable(parent, node) invoked on child-list mutations of tracked elements
+        self._change_listener = None
+        # Callable(elem) invoked after setAttribute/removeAttribute (and NS variants)
+        self._attribute_listener = None
+
+    def createTextNode(self, data):
+        if not isinstance(data, str):
+            raise TypeError("node contents must be a string")
+        if data.isspace():
+            data = self._whitespace.setdefault(data, data)
+        t = _TrackedText()
+        t.ownerDocument = self
+        t.data = data
+        return t
+
+    def createElement(self, tagName):
+        e = _TrackedElement(tagName)
+        e.ownerDocument = self
+        return e
+
+    def createElementNS(self, namespaceURI, qualifiedName):
+        prefix = qualifiedName.split(":", 1)[0] if ":" in qualifiedName else None
+        e = _TrackedElement(qualifiedName, namespaceURI, prefix)
+        e.ownerDocument = self
+        return e
+
+    def _record_position(self, elem, line, column):
+        """Append a position to the arrays and point the element at it."""
+        elem._position = len(self._lines)
+        self._lines.append(line)
+        self._columns.append(column)
+
+
+class _TrackedTreeBuilder(xml.sax.handler.ContentHandler):
+    """
+    SAX content handler that builds a _TrackedDocument for XMLEditor.
+
+    Builds the tree minidom.parse builds with a SAX parser (through
+    xml.dom.pulldom): namespace declarations after the other attributes and no
+    comments, so edited parts serialize exactly as before. On top of that it
+    records each element's position, stores its attributes packed, and shares
+    tag names, namespace URIs, attribute names and attribute values through a
+    table that only lives for the parse.
+
+    expat delivers character data in chunks (at line breaks, entity references
+    and buffer boundaries), and pulldom makes one text node per chunk. Runs of
+    chunks are merged here, but whitespace-only chunks are never merged with
+    text: _get_element_text skips whitespace-only nodes, so extracted text
+    stays the same.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.document = _TrackedDocument()
+        self._stack = [self.document]
+        # namespace URI -> prefix, one dict per open prefix mapping
+        self._contexts = [{xml.dom.XML_NAMESPACE: "xml"}]
+        self._xmlns_attrs = []
+        self._strings = {}
+        self._text = []
+        self._text_is_space = False
+
+    def startPrefixMapping(self, prefix, uri):
+        uri = _shared(self._strings, uri)
+        self._xmlns_attrs.append(
+            (f"xmlns:{prefix}" if prefix else "xmlns", XMLNS_NAMESPACE, uri)
+        )
+        context = self._contexts[-1].copy()
+        context[uri] = prefix or None
+        self._contexts.append(context)
+
+    def endPrefixMapping(self, prefix):
+        self._contexts.pop()
+
+    def startElementNS(self, name, qname, attrs):
+        self._flush_text()
+        doc = self.document
+        strings = self._strings
+        context = self._contexts[-1]
+        uri, local_name = name
+        if uri:
+            uri = _shared(strings, uri)
+            prefix = context[uri]
+            tag = _shared(strings, f"{prefix}:{local_name}" if prefix else local_name)
+            elem = _TrackedElement(tag, uri, prefix)
+        else:
+            elem = _TrackedElement(_shared(strings, local_name))
+        elem.ownerDocument = doc
+
+        packed = []
+        for (attr_uri, attr_local_name), value in attrs.items():
+            if attr_uri:
+                attr_uri = _shared(strings, attr_uri)
+                attr_prefix = context[attr_uri]
+                if attr_prefix:
+                    attr_local_name = f"{attr_prefix}:{attr_local_name}"
+            packed += (
+                _shared(strings, attr_local_name),
+                attr_uri,
+                _shared(strings, value),
             )
+        if self._xmlns_attrs:
+            for attr in self._xmlns_attrs:
+                packed += attr
+            self._xmlns_attrs = []
+        if packed:
+            elem._packed_attrs = tuple(packed)
+
+        self._stack[-1].appendChild(elem)
+        self._stack.append(elem)
+        doc._record_position(
+            elem, self._locator.getLineNumber(), self._locator.getColumnNumber()
+        )
+
+    def endElementNS(self, name, qname):
+        self._flush_text()
+        self._stack.pop()
+
+    def characters(self, content):
+        is_space = content.isspace()
+        if self._text and is_space != self._text_is_space:
+            self._flush_text()
+        self._text.append(content)
+        self._text_is_space = is_space
+
+    ignorableWhitespace = characters
+
+    def processingInstruction(self, target, data):
+        self._flush_text()
+        self._stack[-1].appendChild(
+            self.document.createProcessingInstruction(target, data)
+        )
+
+    def _flush_text(self):
+        """Append the pending character data as one text node."""
+        if self._text:
+            data = self._text[0] if len(self._text) == 1 else "".join(self._text)
+            self._stack[-1].appendChild(self.document.createTextNode(data))
+            self._text = []
+
+
+class _TextIndex:
+    """
+    N-gram index over the text of all elements with a given tag name.
+
+    Each indexed element gets an integer id; its normalized text (as returned by
+    XMLEditor._get_element_text) is split into overlapping n-grams, and every n-gram
+    maps to an array('I') posting list of ids. A substring query intersects the
+    posting lists of its n-grams and verifies the remaining candidates against
+    their current text, so a lookup touches only the elements that can match.
+
+    Edits are applied lazily: mark_changed records mutation points and the next
+    search re-indexes the affected elements (ancestors of the mutated parent and
+    matching elements inside inserted or removed subtrees). Re-indexed and removed
+    elements leave stale ids in the posting lists, which are skipped at query time
+    and compacted away once they outnumber live entries.
+
+    Writes to a text node's data are reported like child-list mutations, so
+    direct DOM edits are reflected in the next query.
+    """
+
+    def __init__(self, dom, tag, get_text):
+        self.tag = tag
+        self._dom = dom
+        self._get_text = get_text
+        self._elems = []  # id -> element, None once stale
+        self._texts = []  # id -> indexed text, None once stale
+        self._ids = {}  # element -> current id
+        self._grams = {}  # n-gram -> array("I") of ids
+        self._pending = []  # (parent, node) mutation points not yet applied
+        for elem in dom.getElementsByTagName(tag):
+            self._add(elem)
+
+    def mark_changed(self, parent, node):
+        """
+        Record a child-list mutation.
 
-        orig_start_cb = dom_handler.startElementNS
-        dom_handler.startElementNS = startElementNS
-        orig_set_content_handler(dom_handler)
+        Returns:
+            bool: False if so many changes are pending that rebuilding the index
+                from scratch is cheaper; the caller should drop the index.
+        """
+        self._pending.append((parent, node))
+        return len(self._pending) <= len(self._ids) + 64
+
+    def search(self, query):
+        """
+        Return elements whose text contains query, in document order.
+
+        Args:
+            query: Normalized (entity-unescaped) substring to search for
+
+        Returns:
+            list: Matching elements
+        """
+        self._apply_pending()
+        n = TEXT_INDEX_GRAM
+        if len(query) < n:
+            ids = [
+                i
+                for i, text in enumerate(self._texts)
+                if text is not None and query in text
+            ]
+        else:
+            postings = []
+            for gram in {query[i : i + n] for i in range(len(query) - n + 1)}:
+                posting = self._grams.get(gram)
+                if posting is None:
+                    return []
+                postings.append(posting)
+            postings.sort(key=len)
+            candidates = set(postings[0])
+            for posting in postings[1:]:
+                candidates.intersection_update(posting)
+                if not candidates:
+                    return []
+            ids = sorted(candidates)
 
+        matches = []
+        for i in ids:
+            elem = self._elems[i]
+            if elem is not None and query in self._get_text(elem):
+                matches.append(elem)
+        if len(matches) > 1:
+            # Re-indexed elements get new ids, so id order is not document order
+            matched = set(matches)
+            matches = [
+                elem
+                for elem in self._dom.getElementsByTagName(self.tag)
+                if elem in matched
+            ]
+        return matches
+
+    def _add(self, elem, text=None):
+        """Index an element under a new id, extracting its text unless given."""
+        if text is None:
+            text = self._get_text(elem)
+        elem_id = len(self._elems)
+        self._elems.append(elem)
+        self._texts.append(text)
+        self._ids[elem] = elem_id
+        n = TEXT_INDEX_GRAM
+        grams = self._grams
+        for gram in {text[i : i + n] for i in range(len(text) - n + 1)}:
+            posting = grams.get(gram)
+            if posting is None:
+                posting = grams[gram] = array("I")
+            posting.append(elem_id)
+
+    def _apply_pending(self):
+        """Re-index every element whose text may have changed since the last query."""
+        if not self._pending:
+            return
+        affected = {}
+        for parent, node in self._pending:
+            ancestor = parent
+            while ancestor is not None:
+                if getattr(ancestor, "tagName", None) == self.tag:
+                    affected[ancestor] = None
+                ancestor = ancestor.parentNode
+            if node.nodeType == node.ELEMENT_NODE:
+                if node.tagName == self.tag:
+                    affected[node] = None
+                for elem in node.getElementsByTagName(self.tag):
+                    affected[elem] = None
+        self._pending.clear()
+
+        for elem in affected:
+            elem_id = self._ids.pop(elem, None)
+            if elem_id is not None:
+                self._elems[elem_id] = None
+                self._texts[elem_id] = None
+            if _is_attached(elem, self._dom):
+                self._add(elem)
+
+        if len(self._elems) > 2 * len(self._ids):
+            self._compact()
+
+    def _compact(self):
+        """Rebuild ids and posting lists from the live entries, keeping their text."""
+        live = [
+            (elem, text)
+            for elem, text in zip(self._elems, self._texts)
+            if elem is not None
+        ]
+        self._elems, self._texts, self._ids, self._grams = [], [], {}, {}
+        for elem, text in live:
+            self._add(elem, text)
+
+
+def _is_attached(node, dom):
+    """Check whether node is connected to the document dom through its ancestors."""
+    while node.parentNode is not None:
+        node = node.parentNode
+    return node is dom
+
+
+def _shared(strings, value):
+    """Return the copy of value already in the strings table, adding it if new."""
+    return strings.setdefault(value, value)
+
+
+def _local_name(qname):
+    """Local part of a qualified name, as minidom derives it."""
+    return qname.split(":", 1)[-1]
+
+
+def _parse_tracked(xml_path):
+    """
+    Parse an XML file into a _TrackedDocument.
+
+    Uses defusedxml's SAX parser with namespace processing, fed the way
+    minidom.parse feeds it, and a _TrackedTreeBuilder to build the tree.
+
+    Args:
+        xml_path: Path to the XML file
+
+    Returns:
+        _TrackedDocument: Parsed document; its elements expose parse_position
+    """
+    builder = _TrackedTreeBuilder()
     parser = defusedxml.sax.make_parser()
-    orig_set_content_handler = parser.setContentHandler
-    parser.setContentHandler = set_content_handler  # type: ignore
-    return parser
+    parser.setFeature(xml.sax.handler.feature_namespaces, True)
+    parser.setContentHandler(builder)
+    builder.setDocumentLocator(xml.sax.expatreader.ExpatLocator(parser))
+    # Feed in minidom.parse's chunk size: expat splits character data at chunk
+    # boundaries, and the text nodes (and so _get_element_text, which skips
+    # whitespace-only nodes) must come out the same
+    with open(xml_path, "rb") as f:
+        while chunk := f.read(xml.dom.pulldom.default_bufsize):
+            parser.feed(chunk)
+    parser.close()
+    return builder.document
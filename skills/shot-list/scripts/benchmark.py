@@ -0,0 +1,484 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for the screenplay parser.
+
+Run from the scripts directory:
+    python benchmark.py pagination --scripts 1000
+    python benchmark.py pagination --fdx exports/ --max-error 0.1
+    python benchmark.py pdf --shots 1000 10000 50000
+    python benchmark.py pdf-parallel --shots 50000 --workers 8
+    python benchmark.py pdf-incremental --shots 1000
+
+Each benchmark prints its measurements and exits non-zero when a gate fails,
+so it can be wired into CI to catch regressions.
+"""
+
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+from parse_screenplay import (
+    HEADING,
+    Paginator,
+    assemble_scenes,
+    parse_fountain,
+    tokenize_fdx,
+    tokenize_fountain,
+)
+
+
+# Directory of this script, used as the working directory for subprocesses
+SCRIPTS_DIR = Path(__file__).parent
+
+LOCATIONS = ['KITCHEN', 'PRECINCT HOUSE', 'ROOFTOP', 'DINER', 'PARKING GARAGE', 'MOTEL ROOM']
+TIMES = ['DAY', 'NIGHT', 'CONTINUOUS', 'LATER']
+NAMES = ['SARAH', 'JAKE', 'DETECTIVE MORALES', 'OLD MAN', 'NURSE', 'DISPATCHER']
+WORDS = (
+    'the a door light rain window slowly turns toward empty street glass '
+    'phone rings silence she he they waits runs across room table coffee '
+    'gun badge photograph dark shadow car engine stops looks away'
+).split()
+
+
+def write_synthetic_script(scenes: int, seed: int = 0) -> str:
+    """
+    Build a Fountain screenplay with varied action and dialogue lengths.
+    
+    Args:
+        scenes: Number of scenes
+        seed: Random seed, so runs are repeatable
+    
+    Returns:
+        Fountain text
+    """
+    rng = random.Random(seed)
+    
+    def sentence(low, high):
+        words = rng.choices(WORDS, k=rng.randint(low, high))
+        return ' '.join(words).capitalize() + '.'
+    
+    lines = [f'Title: Synthetic {seed}', '', 'FADE IN:', '']
+    for number in range(scenes):
+        prefix = rng.choice(['INT.', 'EXT.'])
+        lines.extend([f'{prefix} {rng.choice(LOCATIONS)} - {rng.choice(TIMES)}', ''])
+        for _ in range(rng.randint(2, 8)):
+            if rng.random() < 0.4:
+                lines.extend([' '.join(sentence(4, 14) for _ in range(rng.randint(1, 4))), ''])
+            else:
+                lines.append(rng.choice(NAMES))
+                if rng.random() < 0.2:
+                    lines.append('(quietly)')
+                lines.extend([' '.join(sentence(3, 12) for _ in range(rng.randint(1, 3))), ''])
+        if number % 5 == 4:
+            lines.extend(['CUT TO:', ''])
+    return '\n'.join(lines)
+
+
+def synthetic_shots(count: int, seed: int = 0) -> list:
+    """
+    Build a shot list of about 3-12 shots per scene with varied text lengths.
+    
+    Args:
+        count: Number of shots
+        seed: Random seed, so runs are repeatable
+    
+    Returns:
+        List of shot dicts as taken by create_shot_list_pdf
+    """
+    rng = random.Random(seed)
+    shots = []
+    scene = 0
+    while len(shots) < count:
+        scene += 1
+        heading = f'{rng.choice(["INT.", "EXT."])} {rng.choice(LOCATIONS)} - {rng.choice(TIMES)}'
+        for number in range(min(rng.randint(3, 12), count - len(shots))):
+            shots.append({
+                'scene': scene,
+                'scene_heading': heading,
+                'shot': chr(ord('A') + number),
+                'setup': number // 2 + 1,
+                'shot_type': rng.choice(['WS', 'MS', 'MCU', 'CU', 'ECU', 'OTS']),
+                'framing': ' '.join(rng.choices(WORDS, k=rng.randint(1, 6))).capitalize(),
+                'movement': rng.choice(['STATIC', 'DOLLY', 'TRACK', 'PAN', 'HANDHELD']),
+                'description': ' '.join(rng.choices(WORDS, k=rng.randint(3, 30))).capitalize() + '.',
+                'notes': rng.choice(['', '50mm', '85mm, shallow DOF', 'Practical lighting from windows']),
+            })
+    return shots
+
+
+def legacy_shot_list_pdf(shots: list, output_path: str):
+    """
+    The shot list as built before streaming: a Paragraph per cell, a Table
+    and TableStyle per scene, and every flowable held until doc.build.
+    """
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import landscape, letter
+    from reportlab.lib.units import inch
+    from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+    
+    from generate_shot_list_pdf import HEADERS, get_styles
+    
+    styles = get_styles()
+    doc = SimpleDocTemplate(
+        output_path, pagesize=landscape(letter), leftMargin=0.5*inch,
+        rightMargin=0.5*inch, topMargin=0.5*inch, bottomMargin=0.5*inch
+    )
+    elements = [Paragraph('Benchmark', styles['title']), Spacer(1, 12)]
+    
+    scenes = {}
+    for shot in shots:
+        scenes.setdefault(shot['scene'], []).append(shot)
+    col_widths = [0.6*inch, 0.5*inch, 0.5*inch, 1.8*inch, 0.7*inch, 2.8*inch, 2.0*inch]
+    
+    for scene_num in sorted(scenes):
+        scene_shots = scenes[scene_num]
+        elements.append(Paragraph(scene_shots[0]['scene_heading'], styles['scene_header']))
+        table_data = [[Paragraph(h, styles['header_cell']) for h in HEADERS]]
+        for shot in scene_shots:
+            table_data.append([
+                Paragraph(f"{shot['scene']}{shot['shot']}", styles['cell']),
+                Paragraph(str(shot['setup']), styles['cell']),
+                Paragraph(shot['shot_type'], styles['cell']),
+                Paragraph(shot['framing'], styles['cell']),
+                Paragraph(shot['movement'], styles['cell']),
+                Paragraph(shot['description'], styles['cell']),
+                Paragraph(shot['notes'], styles['cell'])
+            ])
+        table = Table(table_data, colWidths=col_widths, repeatRows=1)
+        style = TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2c3e50')),
+            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 1), (-1, -1), 9),
+            ('BOTTOMPADDING', (0, 1), (-1, -1), 6),
+            ('TOPPADDING', (0, 1), (-1, -1), 6),
+            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#cccccc')),
+        ])
+        for i in range(2, len(table_data), 2):
+            style.add('BACKGROUND', (0, i), (-1, i), colors.HexColor('#f8f9fa'))
+        table.setStyle(style)
+        elements.append(table)
+        elements.append(Spacer(1, 12))
+    
+    doc.build(elements)
+
+
+# Render a synthetic shot list in a fresh interpreter: argv is the builder
+# ('stream' or 'legacy'), shot count and output path. Prints
+# [seconds, peak RSS in KB, output bytes].
+_RENDER_PDF = """
+import json, os, resource, sys, time
+from benchmark import legacy_shot_list_pdf, synthetic_shots
+from generate_shot_list_pdf import create_shot_list_pdf, create_shot_list_pdf_parallel
+builder, count, output = sys.argv[1], int(sys.argv[2]), sys.argv[3]
+shots = synthetic_shots(count)
+start = time.perf_counter()
+if builder == 'stream':
+    create_shot_list_pdf(iter(shots), output, 'Benchmark', date='today')
+elif builder.startswith('parallel'):
+    workers = int(builder.split(':')[1])
+    create_shot_list_pdf_parallel(shots, output, 'Benchmark', date='today', workers=workers)
+else:
+    legacy_shot_list_pdf(shots, output)
+seconds = time.perf_counter() - start
+peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps([seconds, peak_kb, os.path.getsize(output)]))
+"""
+
+
+def _render_pdf(builder: str, count: int, output: Path) -> list:
+    """
+    Run _RENDER_PDF in a subprocess so peak memory is measured per build.
+    
+    builder is 'stream', 'legacy' or 'parallel:<workers>'. Peak memory of
+    parallel builds covers the merging process only, not its workers.
+    """
+    result = subprocess.run(
+        [sys.executable, '-c', _RENDER_PDF, builder, str(count), str(output)],
+        cwd=SCRIPTS_DIR,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr)
+    return json.loads(result.stdout)
+
+
+def bench_pdf(args):
+    """Render shot lists of increasing size, streaming vs the legacy all-in-memory build."""
+    failures = []
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for count in args.shots:
+            seconds, peak_kb, size = _render_pdf('stream', count, Path(temp_dir) / 'stream.pdf')
+            line = (f'{count:>6} shots: streaming {seconds:6.1f} s, peak RSS {peak_kb / 1024:6.1f} MB'
+                    f' ({size / 1e6:.1f} MB PDF)')
+            if count <= args.legacy_max:
+                legacy_seconds, legacy_kb, _ = _render_pdf('legacy', count, Path(temp_dir) / 'legacy.pdf')
+                line += f'; legacy {legacy_seconds:6.1f} s, peak RSS {legacy_kb / 1024:6.1f} MB'
+                if seconds >= legacy_seconds:
+                    failures.append(f'Streaming not faster than legacy at {count} shots')
+                if peak_kb >= legacy_kb:
+                    failures.append(f'Streaming uses as much memory as legacy at {count} shots')
+            print(line)
+    
+    if failures:
+        print('FAILED - ' + '\n         '.join(failures))
+        return False
+    print('PASSED - Streaming build faster and smaller than legacy')
+    return True
+
+
+def bench_pdf_parallel(args):
+    """Render shot lists serially and in a process pool, and compare wall time."""
+    from pypdf import PdfReader
+    
+    # Speedup is bounded by the cores actually available
+    expected = min(args.workers, os.cpu_count() or 1)
+    failures = []
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for count in args.shots:
+            serial_path = Path(temp_dir) / 'serial.pdf'
+            parallel_path = Path(temp_dir) / 'parallel.pdf'
+            serial_seconds, _, _ = _render_pdf('stream', count, serial_path)
+            seconds, _, _ = _render_pdf(f'parallel:{args.workers}', count, parallel_path)
+            speedup = serial_seconds / seconds
+            serial_pages = len(PdfReader(serial_path).pages)
+            pages = len(PdfReader(parallel_path).pages)
+            print(f'{count:>6} shots: serial {serial_seconds:6.1f} s ({serial_pages} pages), '
+                  f'{args.workers} workers {seconds:6.1f} s ({pages} pages), speedup {speedup:.2f}x')
+            
+            if speedup < args.min_efficiency * expected:
+                failures.append(
+                    f'Speedup {speedup:.2f}x at {count} shots, expected at least '
+                    f'{args.min_efficiency * expected:.2f}x on {expected} cores'
+                )
+            # Fragments start on new pages, so a few extra pages are expected
+            if pages > serial_pages + args.workers * 2:
+                failures.append(f'{pages - serial_pages} extra pages at {count} shots')
+    
+    if failures:
+        print('FAILED - ' + '\n         '.join(failures))
+        return False
+    print(f'PASSED - Parallel build scales across {expected} cores')
+    return True
+
+
+def bench_pdf_incremental(args):
+    """Time rebuilding a cached shot list after changing one shot against a full build."""
+    from generate_shot_list_pdf import create_shot_list_pdf, create_shot_list_pdf_cached
+    
+    shots = synthetic_shots(args.shots)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache_dir = Path(temp_dir) / 'cache'
+        output = Path(temp_dir) / 'shot_list.pdf'
+        
+        full_seconds = _best_time(
+            lambda: create_shot_list_pdf(shots, str(output), 'Benchmark', date='today')
+        )
+        start = time.perf_counter()
+        create_shot_list_pdf_cached(shots, str(output), cache_dir, 'Benchmark', date='today')
+        cold_seconds = time.perf_counter() - start
+        
+        edits = iter(range(len(shots)))
+        
+        def rebuild():
+            shots[len(shots) // 2]['notes'] = f'Revision {next(edits)}'
+            return create_shot_list_pdf_cached(shots, str(output), cache_dir, 'Benchmark', date='today')
+        
+        seconds = _best_time(rebuild)
+        report = rebuild()
+    
+    ratio = seconds / full_seconds
+    print(f'{args.shots} shots: full build {full_seconds:.2f} s, cold cache {cold_seconds:.2f} s, '
+          f'one shot changed {seconds:.2f} s ({report["rendered"]} of {report["scenes"]} scenes rendered, '
+          f'{ratio:.0%} of a full build)')
+    
+    if ratio > args.max_ratio:
+        print(f'FAILED - Rebuild took {ratio:.0%} of a full build (max {args.max_ratio:.0%})')
+        return False
+    print('PASSED - Incremental rebuild within budget')
+    return True
+
+
+def compare_fdx(path):
+    """
+    Compare the pages and eighths Final Draft recorded with a Paginator estimate.
+    
+    Args:
+        path: Final Draft file saved with scene properties
+    
+    Returns:
+        dict with 'pages' as (recorded, estimated) and 'eighths' as
+        (recorded, estimated) for every scene with a recorded length, or
+        None if the file is not well-formed or has no recorded scene pages
+    """
+    info = {}
+    paginator = Paginator()
+    recorded_pages = 0
+    eighths = []
+    recorded = None  # Length recorded for the current scene
+    
+    try:
+        for kind, text, meta in tokenize_fdx(path, info):
+            if kind == HEADING:
+                if recorded:
+                    eighths.append((recorded, paginator.scene_eighths()))
+                recorded = meta.get('length_eighths')
+                if 'page' in meta:
+                    end_page = meta['page'] + ((recorded or 1) - 1) // 8
+                    recorded_pages = max(recorded_pages, end_page)
+            paginator.add(kind, text, meta is not None and 'new_page' in meta)
+    except ET.ParseError:
+        return None
+    if recorded:
+        eighths.append((recorded, paginator.scene_eighths()))
+    
+    if not info['scene_pages']:
+        return None
+    return {'pages': (recorded_pages, paginator.page_count), 'eighths': eighths}
+
+
+def _best_time(func, runs=3):
+    """Fastest of several runs of func, in seconds."""
+    best = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        seconds = time.perf_counter() - start
+        best = seconds if best is None else min(best, seconds)
+    return best
+
+
+def bench_pagination(args):
+    """Time pagination over many scripts and check it against Final Draft's own counts."""
+    scripts = [write_synthetic_script(args.scenes, seed) for seed in range(args.scripts)]
+    size_mb = sum(len(script) for script in scripts) / 1e6
+    
+    def assemble():
+        for script in scripts:
+            for _ in assemble_scenes(tokenize_fountain(script.split('\n'))):
+                pass
+    
+    def parse():
+        return [parse_fountain(script)['page_count'] for script in scripts]
+    
+    # Scene assembly alone, then with the paginator in the same pass
+    assemble_seconds = _best_time(assemble)
+    parse_seconds = _best_time(parse)
+    pages = parse()
+    overhead = parse_seconds / assemble_seconds - 1
+    
+    print(f'{args.scripts} scripts x {args.scenes} scenes ({size_mb:.1f} MB), {sum(pages)} pages')
+    print(f'  scene assembly:        {assemble_seconds:6.2f} s')
+    print(f'  parse with pagination: {parse_seconds:6.2f} s, '
+          f'{args.scripts / parse_seconds:.0f} scripts/s ({overhead:+.0%})')
+    
+    failures = []
+    if overhead > args.max_overhead:
+        failures.append(f'Pagination overhead above {args.max_overhead:.0%}')
+    
+    if args.fdx:
+        compared = []
+        for path in sorted(Path(args.fdx).glob('*.fdx')):
+            result = compare_fdx(path)
+            if result is None:
+                print(f'  {path.name}: no recorded scene pages, skipped')
+                continue
+            recorded, estimated = result['pages']
+            error = abs(estimated - recorded) / recorded if recorded else 0.0
+            eighths_error = (
+                sum(abs(e - r) for r, e in result['eighths']) / len(result['eighths'])
+                if result['eighths'] else 0.0
+            )
+            print(f'  {path.name}: {recorded} pages recorded, {estimated} estimated '
+                  f'({error:.0%}), scene length off by {eighths_error:.1f}/8 on average')
+            compared.append(error)
+        if compared:
+            mean_error = sum(compared) / len(compared)
+            print(f'  mean page count error over {len(compared)} scripts: {mean_error:.1%}')
+            if mean_error > args.max_error:
+                failures.append(f'Mean page count error above {args.max_error:.0%}')
+        else:
+            print('  No Final Draft files with recorded scene pages found')
+    
+    if failures:
+        print('FAILED - ' + '\n         '.join(failures))
+        return False
+    print('PASSED - Pagination within budget')
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Screenplay parser benchmarks')
+    subparsers = parser.add_subparsers(dest='benchmark', required=True)
+    
+    pagination = subparsers.add_parser(
+        'pagination', help='Paginator throughput and accuracy against Final Draft'
+    )
+    pagination.add_argument('--scripts', type=int, default=1_000)
+    pagination.add_argument('--scenes', type=int, default=60)
+    pagination.add_argument(
+        '--max-overhead',
+        type=float,
+        default=0.5,
+        help='Fail if pagination slows parsing by more than this fraction (default: 0.5)',
+    )
+    pagination.add_argument(
+        '--fdx', default=None, help='Directory of Final Draft files saved with scene properties'
+    )
+    pagination.add_argument(
+        '--max-error',
+        type=float,
+        default=0.1,
+        help='Fail if the mean page count error against --fdx exceeds this (default: 0.1)',
+    )
+    pagination.set_defaults(func=bench_pagination)
+    
+    pdf = subparsers.add_parser('pdf', help='Streaming shot list PDF vs the legacy build')
+    pdf.add_argument('--shots', type=int, nargs='+', default=[1_000, 10_000, 50_000])
+    pdf.add_argument(
+        '--legacy-max',
+        type=int,
+        default=10_000,
+        help='Only run the legacy build up to this many shots (default: 10000)',
+    )
+    pdf.set_defaults(func=bench_pdf)
+    
+    pdf_parallel = subparsers.add_parser(
+        'pdf-parallel', help='Parallel fragment rendering vs the serial streaming build (needs pypdf)'
+    )
+    pdf_parallel.add_argument('--shots', type=int, nargs='+', default=[10_000, 50_000])
+    pdf_parallel.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    pdf_parallel.add_argument(
+        '--min-efficiency',
+        type=float,
+        default=0.6,
+        help='Fail if speedup is below this fraction of the available cores (default: 0.6)',
+    )
+    pdf_parallel.set_defaults(func=bench_pdf_parallel)
+    
+    pdf_incremental = subparsers.add_parser(
+        'pdf-incremental', help='Cached scene fragments vs a full rebuild (needs pypdf)'
+    )
+    pdf_incremental.add_argument('--shots', type=int, default=1_000)
+    pdf_incremental.add_argument(
+        '--max-ratio',
+        type=float,
+        default=0.5,
+        help='Fail if a one-shot rebuild takes more than this fraction of a full build (default: 0.5)',
+    )
+    pdf_incremental.set_defaults(func=bench_pdf_incremental)
+    
+    args = parser.parse_args()
+    sys.exit(0 if args.func(args) else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+"""
+Compare two drafts of a screenplay scene by scene.
+
+Usage:
+    from parse_screenplay import parse_screenplay
+    from diff_screenplay import diff_scripts, format_diff
+
+    diff = diff_scripts(parse_screenplay('draft1.fountain'), parse_screenplay('draft2.fountain'))
+    print(format_diff(diff))
+
+Command line:
+    python diff_screenplay.py draft1.fountain draft2.fountain [--json]
+
+Scenes are aligned in three passes:
+    1. Identical heading and content (by hash), so untouched scenes match
+       however they were renumbered
+    2. Same heading, preferring the most similar text when a heading repeats
+    3. Text similarity (difflib) for scenes whose heading was rewritten
+Matched scenes whose order changed are reported as moved; scenes left over
+are added or removed.
+"""
+
+import argparse
+import bisect
+import hashlib
+import json
+from difflib import SequenceMatcher
+
+
+# Minimum similarity (share of matching body lines) for pairing scenes whose
+# headings differ
+SIMILARITY_THRESHOLD = 0.6
+
+# Body lines shared by more unmatched scenes than this are not used to find
+# candidate pairs
+MAX_LINE_POSTINGS = 50
+
+# Unmatched scenes under a repeated heading are compared with this many
+# same-heading scenes on either side of their position
+HEADING_WINDOW = 10
+
+
+def scene_lines(scene: dict) -> list:
+    """Action and dialogue of a scene as normalized lines, in script order per kind."""
+    lines = [' '.join(line.split()) for line in scene.get('action', [])]
+    for line in scene.get('dialogue', []):
+        lines.append(f"{line['character']}: {' '.join(line['text'].split())}")
+    return lines
+
+
+def scene_text(scene: dict) -> str:
+    """Heading, action and dialogue of a scene as one normalized string."""
+    return '\n'.join([normalize_heading(scene['heading'])] + scene_lines(scene))
+
+
+def normalize_heading(heading: str) -> str:
+    """Uppercase a heading and collapse its whitespace."""
+    return ' '.join(heading.split()).upper()
+
+
+def scene_hash(scene: dict) -> str:
+    """Content hash of a scene; equal hashes mean the scene is unchanged."""
+    return hashlib.sha256(scene_text(scene).encode('utf-8')).hexdigest()
+
+
+def diff_scripts(old: dict, new: dict, threshold: float = SIMILARITY_THRESHOLD) -> dict:
+    """
+    Diff two parse_screenplay results.
+    
+    Args:
+        old: Parsed earlier draft
+        new: Parsed later draft
+        threshold: Minimum similarity (0-1) for pairing scenes with
+            different headings
+    
+    Returns:
+        dict with:
+            - added: [{'number', 'heading'}] scenes only in the new draft
+            - removed: [{'number', 'heading'}] scenes only in the old draft
+            - moved: [{'old_number', 'new_number', 'heading'}] matched scenes
+              that changed position relative to the others
+            - modified: [{'old_number', 'new_number', 'heading', 'changes',
+              'characters_added', 'characters_removed', 'similarity'}] where
+              changes lists 'heading', 'action' and/or 'dialogue'
+            - unchanged: Number of matched scenes with identical content
+            - mapping: {old scene number: new scene number} for every match
+            - characters: {'added', 'removed'} across the whole script
+    """
+    old_scenes = old['scenes']
+    new_scenes = new['scenes']
+    old_hashes = [scene_hash(scene) for scene in old_scenes]
+    new_hashes = [scene_hash(scene) for scene in new_scenes]
+    
+    pairs = _match_identical(old_hashes, new_hashes)
+    pairs.update(_match_similar(old_scenes, new_scenes, pairs, threshold))
+    matched_new = set(pairs.values())
+    old_characters = set(old['characters'])
+    new_characters = set(new['characters'])
+    
+    diff = {
+        'added': [
+            _scene_ref(scene) for j, scene in enumerate(new_scenes) if j not in matched_new
+        ],
+        'removed': [
+            _scene_ref(scene) for i, scene in enumerate(old_scenes) if i not in pairs
+        ],
+        'moved': [],
+        'modified': [],
+        'unchanged': 0,
+        'mapping': {},
+        'characters': {
+            'added': [c for c in new['characters'] if c not in old_characters],
+            'removed': [c for c in old['characters'] if c not in new_characters]
+        }
+    }
+    
+    in_order = _longest_increasing(sorted(pairs.items(), key=lambda pair: pair[1]))
+    
+    for i, j in sorted(pairs.items(), key=lambda pair: pair[1]):
+        old_scene, new_scene = old_scenes[i], new_scenes[j]
+        diff['mapping'][old_scene['number']] = new_scene['number']
+        
+        if i not in in_order:
+            diff['moved'].append({
+                'old_number': old_scene['number'],
+                'new_number': new_scene['number'],
+                'heading': new_scene['heading']
+            })
+        
+        if old_hashes[i] == new_hashes[j]:
+            diff['unchanged'] += 1
+        else:
+            diff['modified'].append(_scene_changes(old_scene, new_scene))
+    
+    return diff
+
+
+def _scene_ref(scene: dict) -> dict:
+    """Number and heading identifying a scene in the diff."""
+    return {'number': scene['number'], 'heading': scene['heading']}
+
+
+def _match_identical(old_hashes: list, new_hashes: list) -> dict:
+    """Pair scenes with equal hashes, in order when a scene is repeated."""
+    positions = {}
+    for i, digest in enumerate(old_hashes):
+        positions.setdefault(digest, []).append(i)
+    
+    pairs = {}
+    for j, digest in enumerate(new_hashes):
+        candidates = positions.get(digest)
+        if candidates:
+            pairs[candidates.pop(0)] = j
+    return pairs
+
+
+def _match_similar(old_scenes: list, new_scenes: list, matched: dict, threshold: float) -> dict:
+    """
+    Pair the remaining scenes by heading and text similarity.
+    
+    Similarity is the share of matching body lines. Each new scene is only
+    compared with old scenes that share a body line with it (any pair above
+    threshold must) and with the nearest old scenes under the same heading,
+    so a heavy rewrite does not compare every pair of scenes. Candidate
+    pairs are same-heading pairs at any similarity and other pairs with
+    similarity of at least threshold. They are taken greedily, best first:
+    same heading before different heading, then by similarity, then by how
+    close the two scenes sit in their scripts.
+    """
+    old_left = [i for i in range(len(old_scenes)) if i not in matched]
+    matched_new = set(matched.values())
+    new_left = [j for j in range(len(new_scenes)) if j not in matched_new]
+    if not old_left or not new_left:
+        return {}
+    
+    old_lines = {i: scene_lines(old_scenes[i]) for i in old_left}
+    old_headings = {i: normalize_heading(old_scenes[i]['heading']) for i in old_left}
+    
+    line_index = {}
+    heading_index = {}
+    for i in old_left:
+        for line in set(old_lines[i]):
+            line_index.setdefault(line, []).append(i)
+        heading_index.setdefault(old_headings[i], []).append(i)
+    
+    candidates = []
+    for j in new_left:
+        lines = scene_lines(new_scenes[j])
+        heading = normalize_heading(new_scenes[j]['heading'])
+        
+        nearby = set()
+        for line in set(lines):
+            postings = line_index.get(line, ())
+            # Stock lines ("Yeah.") say little about which scene this is
+            if len(postings) <= MAX_LINE_POSTINGS:
+                nearby.update(postings)
+        same_heading_scenes = heading_index.get(heading, [])
+        position = bisect.bisect_left(same_heading_scenes, j)
+        nearby.update(same_heading_scenes[
+            max(0, position - HEADING_WINDOW):position + HEADING_WINDOW
+        ])
+        
+        matcher = SequenceMatcher(None, autojunk=False)
+        matcher.set_seq2(lines)  # seq2 is the cached side
+        for i in nearby:
+            same_heading = old_headings[i] == heading
+            if not same_heading and not (old_lines[i] and lines):
+                continue
+            matcher.set_seq1(old_lines[i])
+            # Cheap upper bounds first
+            if not same_heading and (
+                matcher.real_quick_ratio() < threshold or matcher.quick_ratio() < threshold
+            ):
+                continue
+            ratio = matcher.ratio()
+            if same_heading or ratio >= threshold:
+                candidates.append((same_heading, ratio, -abs(i - j), i, j))
+    
+    candidates.sort(reverse=True)
+    pairs = {}
+    used_new = set()
+    for _, _, _, i, j in candidates:
+        if i not in pairs and j not in used_new:
+            pairs[i] = j
+            used_new.add(j)
+    return pairs
+
+
+def _longest_increasing(pairs: list) -> set:
+    """
+    Old indices of the largest set of pairs that kept their relative order.
+    
+    Args:
+        pairs: (old index, new index) sorted by new index
+    
+    Returns:
+        Set of old indices in the longest increasing subsequence
+    """
+    tails = []  # Smallest old index ending an increasing run of each length
+    tail_positions = []
+    previous = [None] * len(pairs)
+    
+    for position, (i, _) in enumerate(pairs):
+        length = bisect.bisect_left(tails, i)
+        if length == len(tails):
+            tails.append(i)
+            tail_positions.append(position)
+        else:
+            tails[length] = i
+            tail_positions[length] = position
+        previous[position] = tail_positions[length - 1] if length else None
+    
+    in_order = set()
+    position = tail_positions[-1] if tail_positions else None
+    while position is not None:
+        in_order.add(pairs[position][0])
+        position = previous[position]
+    return in_order
+
+
+def _scene_changes(old_scene: dict, new_scene: dict) -> dict:
+    """Describe how a matched scene changed between drafts."""
+    changes = []
+    if normalize_heading(old_scene['heading']) != normalize_heading(new_scene['heading']):
+        changes.append('heading')
+    if old_scene.get('action', []) != new_scene.get('action', []):
+        changes.append('action')
+    if old_scene.get('dialogue', []) != new_scene.get('dialogue', []):
+        changes.append('dialogue')
+    
+    old_characters = set(old_scene['characters'])
+    new_characters = set(new_scene['characters'])
+    
+    return {
+        'old_number': old_scene['number'],
+        'new_number': new_scene['number'],
+        'heading': new_scene['heading'],
+        'changes': changes,
+        'characters_added': [c for c in new_scene['characters'] if c not in old_characters],
+        'characters_removed': [c for c in old_scene['characters'] if c not in new_characters],
+        'similarity': round(
+            SequenceMatcher(None, scene_lines(old_scene), scene_lines(new_scene), autojunk=False).ratio(),
+            3
+        )
+    }
+
+
+def format_diff(diff: dict) -> str:
+    """Create a readable summary of a script diff."""
+    lines = []
+    lines.append(
+        f"Added: {len(diff['added'])}  Removed: {len(diff['removed'])}  "
+        f"Moved: {len(diff['moved'])}  Modified: {len(diff['modified'])}  "
+        f"Unchanged: {diff['unchanged']}"
+    )
+    
+    for scene in diff['added']:
+        lines.append(f"  + {scene['number']}. {scene['heading']}")
+    for scene in diff['removed']:
+        lines.append(f"  - {scene['number']}. {scene['heading']}")
+    for scene in diff['moved']:
+        lines.append(f"  > {scene['old_number']} -> {scene['new_number']}. {scene['heading']}")
+    for scene in diff['modified']:
+        lines.append(
+            f"  ~ {scene['old_number']} -> {scene['new_number']}. {scene['heading']} "
+            f"({', '.join(scene['changes']) or 'characters'})"
+        )
+        if scene['characters_added']:
+            lines.append(f"      Characters added: {', '.join(scene['characters_added'])}")
+        if scene['characters_removed']:
+            lines.append(f"      Characters removed: {', '.join(scene['characters_removed'])}")
+    
+    if diff['characters']['added']:
+        lines.append(f"Characters added: {', '.join(diff['characters']['added'])}")
+    if diff['characters']['removed']:
+        lines.append(f"Characters removed: {', '.join(diff['characters']['removed'])}")
+    
+    return '\n'.join(lines)
+
+
+def main():
+    from parse_screenplay import parse_screenplay
+    
+    parser = argparse.ArgumentParser(description='Compare two drafts of a screenplay')
+    parser.add_argument('old', help='Earlier draft')
+    parser.add_argument('new', help='Later draft')
+    parser.add_argument('--json', action='store_true', help='Print the diff as JSON')
+    parser.add_argument('--threshold', type=float, default=SIMILARITY_THRESHOLD,
+                        help='Minimum similarity for matching scenes with new headings')
+    args = parser.parse_args()
+    
+    diff = diff_scripts(parse_screenplay(args.old), parse_screenplay(args.new), args.threshold)
+    if args.json:
+        print(json.dumps(diff, indent=2))
+    else:
+        print(format_diff(diff))
+
+
+if __name__ == '__main__':
+    main()
@@ -9,25 +9,157 @@ from reportlab.platypus import (
     SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak
 )
 from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT
+from reportlab.lib.utils import simpleSplit
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.pdfgen import canvas
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from itertools import chain, groupby
+from pathlib import Path
+import hashlib
 import json
+import os
+import shutil
+import tempfile
+
+
+# Shots per table; longer scenes are split into several tables so reportlab
+# never lays out thousands of rows at once
+SCENE_CHUNK_ROWS = 100
+
+# Flowables kept ready ahead of the layout while streaming
+FLOWABLE_LOOKAHEAD = 8
+
+# Page footer: project title on the left, "Page X of N" on the right
+FOOTER_FONT = 'Helvetica'
+FOOTER_FONT_SIZE = 8
+
+# Fragments per worker when rendering in parallel, to even out the load
+FRAGMENTS_PER_WORKER = 2
+
+# Bump whenever the rendered layout changes, so cached scene fragments are
+# not reused
+FRAGMENT_CACHE_VERSION = 1
+
+# Columns of CSV exports. Scheduling imports map columns by position, so new
+# columns go at the end.
+CSV_FIELDS = ['scene', 'shot', 'setup', 'shot_type', 'framing', 'movement',
+              'description', 'notes', 'lens', 'characters', 'scene_heading']
+
+# Table column headings
+HEADERS = ['SHOT', 'SETUP', 'TYPE', 'FRAMING', 'MOVE', 'DESCRIPTION', 'NOTES']
+
+# Cell font and the left + right padding TableStyle gives every cell
+CELL_FONT = 'Helvetica'
+CELL_FONT_SIZE = 9
+CELL_PADDING = 12
+
+# Shared by every shot table
+SHOT_TABLE_STYLE = TableStyle([
+    # Header row
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2c3e50')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 9),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
+    ('TOPPADDING', (0, 0), (-1, 0), 8),
+    ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+    
+    # Data rows
+    ('FONTNAME', (0, 1), (-1, -1), CELL_FONT),
+    ('FONTSIZE', (0, 1), (-1, -1), CELL_FONT_SIZE),
+    ('LEADING', (0, 1), (-1, -1), 11),
+    ('BOTTOMPADDING', (0, 1), (-1, -1), 6),
+    ('TOPPADDING', (0, 1), (-1, -1), 6),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    
+    # Alternating row colors
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f8f9fa')]),
+    
+    # Borders
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#cccccc')),
+    ('LINEBELOW', (0, 0), (-1, 0), 1.5, colors.HexColor('#2c3e50')),
+    
+    # Alignment
+    ('ALIGN', (0, 0), (2, -1), 'CENTER'),
+    ('ALIGN', (4, 0), (4, -1), 'CENTER'),
+])
+
+_styles = None
+
+
+def get_styles() -> dict:
+    """Paragraph styles for the shot list, created once and shared."""
+    global _styles
+    if _styles is None:
+        styles = getSampleStyleSheet()
+        _styles = {
+            'title': ParagraphStyle(
+                'TitleStyle',
+                parent=styles['Heading1'],
+                fontSize=18,
+                spaceAfter=6,
+                textColor=colors.HexColor('#1a1a1a')
+            ),
+            'subtitle': ParagraphStyle(
+                'SubtitleStyle',
+                parent=styles['Normal'],
+                fontSize=10,
+                textColor=colors.HexColor('#666666'),
+                spaceAfter=12
+            ),
+            'scene_header': ParagraphStyle(
+                'SceneHeader',
+                parent=styles['Heading2'],
+                fontSize=12,
+                spaceBefore=16,
+                spaceAfter=8,
+                textColor=colors.HexColor('#1a1a1a'),
+                backColor=colors.HexColor('#f0f0f0'),
+                borderPadding=6
+            ),
+            'cell': ParagraphStyle(
+                'CellStyle',
+                parent=styles['Normal'],
+                fontSize=CELL_FONT_SIZE,
+                leading=11
+            ),
+            'header_cell': ParagraphStyle(
+                'HeaderCell',
+                parent=styles['Normal'],
+                fontSize=9,
+                leading=11,
+                textColor=colors.white,
+                alignment=TA_CENTER
+            ),
+        }
+    return _styles
 
 
 def create_shot_list_pdf(
-    shots: list,
+    shots,
     output_path: str,
     project_title: str = "Shot List",
     production: str = "",
     director: str = "",
     dp: str = "",
     date: str = None,
-    orientation: str = "landscape"
+    orientation: str = "landscape",
+    page_total: bool = False
 ):
     """
     Generate a professional PDF shot list.
     
+    Flowables are generated scene by scene while the document is laid out
+    (see iter_shot_list_flowables), so memory stays flat for very long
+    shot lists.
+    
+    Every page gets a footer with the project title and "Page X". With
+    page_total, it reads "Page X of N" instead; N is only known at the end,
+    so every page is then held in memory until the document is complete.
+    
     Args:
-        shots: List of shot dictionaries with keys:
+        shots: List (or any iterable) of shot dictionaries with keys:
             - scene: Scene number
             - shot: Shot letter/number (A, B, C or 1, 2, 3)
             - setup: Camera setup number
@@ -45,72 +177,367 @@ def create_shot_list_pdf(
         dp: DP/Cinematographer name (optional)
         date: Date string (defaults to today)
         orientation: 'landscape' or 'portrait'
+        page_total: Number pages "Page X of N" (holds all pages in memory)
     """
     
+    doc = shot_list_doc(output_path, project_title, orientation)
+    flowables = FlowableStream(iter_shot_list_flowables(
+        shots, project_title, production, director, dp, date, orientation
+    ))
+    if page_total:
+        doc.build(flowables, canvasmaker=NumberedCanvas)
+    else:
+        doc.build(flowables, onFirstPage=draw_page_footer, onLaterPages=draw_page_footer)
+    return output_path
+
+
+def create_shot_list_pdf_parallel(
+    shots,
+    output_path: str,
+    project_title: str = "Shot List",
+    production: str = "",
+    director: str = "",
+    dp: str = "",
+    date: str = None,
+    orientation: str = "landscape",
+    workers: int = None
+):
+    """
+    Generate a PDF shot list by rendering runs of scenes in a process pool.
+    
+    Scenes are split into FRAGMENTS_PER_WORKER runs per worker of about
+    equal shot count. Each run is rendered to its own PDF, and the fragments
+    are merged in order. The title block is only rendered at the start of
+    the first fragment, and the "Page X of N" footers are stamped on during
+    the merge, once N is known. Every fragment starts on a new page.
+    
+    Merging needs pypdf (pip install pypdf). Without it, or with a single
+    worker or scene, this falls back to create_shot_list_pdf.
+    
+    Args:
+        shots, output_path, ...: As for create_shot_list_pdf
+        workers: Number of worker processes (default: os.cpu_count())
+    """
+    try:
+        import pypdf  # noqa: F401
+    except ImportError:
+        pypdf = None
+    
     if date is None:
         date = datetime.now().strftime("%B %d, %Y")
+    workers = workers or os.cpu_count() or 1
+    scenes = [
+        (scene_num, heading, list(scene_shots))
+        for scene_num, heading, scene_shots in group_shots_by_scene(shots)
+    ]
+    
+    if pypdf is None or workers == 1 or len(scenes) < 2:
+        return create_shot_list_pdf(
+            [shot for _, _, scene_shots in scenes for shot in scene_shots],
+            output_path, project_title, production, director, dp, date, orientation,
+            page_total=True
+        )
     
+    runs = split_scenes(scenes, workers * FRAGMENTS_PER_WORKER)
+    work_dir = tempfile.mkdtemp(prefix='shot_list_')
+    try:
+        jobs = [
+            (
+                str(Path(work_dir) / f'fragment_{index:04d}.pdf'),
+                run,
+                (project_title, production, director, dp, date) if index == 0 else None,
+                project_title,
+                orientation
+            )
+            for index, run in enumerate(runs)
+        ]
+        merge_fragments(render_fragments(jobs, workers), output_path, project_title)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return output_path
+
+
+def create_shot_list_pdf_cached(
+    shots,
+    output_path: str,
+    cache_dir: str,
+    project_title: str = "Shot List",
+    production: str = "",
+    director: str = "",
+    dp: str = "",
+    date: str = None,
+    orientation: str = "landscape",
+    workers: int = 1
+) -> dict:
+    """
+    Generate a PDF shot list, re-rendering only scenes that changed.
+    
+    Every scene is rendered to its own PDF fragment, cached under cache_dir
+    by a hash of its shots and the layout options, and the fragments are
+    merged with fresh "Page X of N" footers. When one shot changes, only its
+    scene is rendered again. Every scene starts on a new page. The title
+    block is rendered with the first scene, so a new date or title only
+    re-renders that scene. The cache is never pruned; delete old
+    directories under cache_dir to reclaim space.
+    
+    Needs pypdf (pip install pypdf).
+    
+    Args:
+        shots, output_path, ...: As for create_shot_list_pdf
+        cache_dir: Directory for cached scene fragments
+        workers: Worker processes for rendering changed scenes (default: 1;
+            None for os.cpu_count())
+    
+    Returns:
+        dict with:
+            - path: output_path
+            - scenes: Number of scenes
+            - rendered: Number of scenes rendered
+            - cached: Number of scenes taken from the cache
+    """
+    if date is None:
+        date = datetime.now().strftime("%B %d, %Y")
+    
+    jobs = []
+    fragments = []
+    for index, (scene_num, heading, scene_shots) in enumerate(group_shots_by_scene(shots)):
+        scene = (scene_num, heading, list(scene_shots))
+        title_block = (project_title, production, director, dp, date) if index == 0 else None
+        path = fragment_path(cache_dir, scene, title_block, orientation)
+        fragments.append(path)
+        if not os.path.exists(path):
+            jobs.append((path, [scene], title_block, project_title, orientation))
+    
+    render_fragments(jobs, workers)
+    merge_fragments(fragments, output_path, project_title)
+    return {
+        'path': output_path,
+        'scenes': len(fragments),
+        'rendered': len(jobs),
+        'cached': len(fragments) - len(jobs)
+    }
+
+
+def fragment_path(cache_dir: str, scene: tuple, title_block, orientation: str) -> str:
+    """Cache file for a scene fragment, keyed by everything that affects its pages."""
+    key = json.dumps(
+        [FRAGMENT_CACHE_VERSION, scene, title_block, orientation],
+        sort_keys=True,
+        default=str
+    )
+    digest = hashlib.sha256(key.encode('utf-8')).hexdigest()
+    return str(Path(cache_dir) / f'v{FRAGMENT_CACHE_VERSION}' / digest[:2] / f'{digest}.pdf')
+
+
+def split_scenes(scenes: list, count: int) -> list:
+    """Split (scene number, heading, shots) tuples into up to count runs of similar shot count."""
+    total = sum(len(scene_shots) for _, _, scene_shots in scenes)
+    target = max(1, -(-total // count))
+    runs = [[]]
+    size = 0
+    for scene in scenes:
+        if size >= target:
+            runs.append([])
+            size = 0
+        runs[-1].append(scene)
+        size += len(scene[2])
+    return runs
+
+
+def render_fragments(jobs: list, workers: int = None) -> list:
+    """Run render_fragment over jobs, in a process pool unless workers is 1; returns the paths."""
+    if workers == 1 or len(jobs) < 2:
+        return [render_fragment(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(render_fragment, jobs))
+
+
+def render_fragment(job) -> str:
+    """
+    Render one run of scenes to a PDF fragment without footers; returns its path.
+    
+    The fragment is written atomically, so a cache never holds a partial file.
+    """
+    path, scenes, title_block, project_title, orientation = job
+    
+    flowables = iter_scene_flowables(scenes, orientation)
+    if title_block is not None:
+        flowables = chain(iter_title_flowables(*title_block), flowables)
+    
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=Path(path).parent, suffix='.tmp')
+    os.close(fd)
+    try:
+        shot_list_doc(tmp_path, project_title, orientation).build(FlowableStream(flowables))
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return path
+
+
+def merge_fragments(fragments: list, output_path: str, project_title: str):
+    """
+    Concatenate PDF fragments and stamp every page with its footer.
+    
+    Footers are appended to each page as an extra content stream rather than
+    with PageObject.merge_page, which reparses every page's content and costs
+    about as much as rendering it.
+    """
+    from pypdf import PdfReader, PdfWriter
+    from pypdf.generic import ArrayObject, DecodedStreamObject, DictionaryObject, NameObject
+    
+    writer = PdfWriter()
+    for fragment in fragments:
+        writer.append(PdfReader(fragment))
+    
+    font = writer._add_object(DictionaryObject({
+        NameObject('/Type'): NameObject('/Font'),
+        NameObject('/Subtype'): NameObject('/Type1'),
+        NameObject('/BaseFont'): NameObject(f'/{FOOTER_FONT}'),
+        NameObject('/Encoding'): NameObject('/WinAnsiEncoding')
+    }))
+    # Isolates the page's graphics state from the footer
+    save_state = DecodedStreamObject()
+    save_state.set_data(b'q')
+    save_state = writer._add_object(save_state)
+    
+    page_count = len(writer.pages)
+    for page_number, page in enumerate(writer.pages, 1):
+        footer = DecodedStreamObject()
+        footer.set_data(footer_operators(
+            page_number, page_count, project_title, float(page.mediabox.width)
+        ))
+        
+        contents = page.raw_get('/Contents')
+        if isinstance(contents.get_object(), ArrayObject):
+            contents = list(contents.get_object())
+        else:
+            contents = [contents]
+        page[NameObject('/Contents')] = ArrayObject(
+            [save_state] + contents + [writer._add_object(footer)]
+        )
+        
+        if '/Resources' not in page:
+            page[NameObject('/Resources')] = DictionaryObject()
+        resources = page['/Resources']
+        if '/Font' not in resources:
+            resources[NameObject('/Font')] = DictionaryObject()
+        resources['/Font'][NameObject('/FShotListFooter')] = font
+    
+    writer.add_metadata({'/Title': project_title})
+    with open(output_path, 'wb') as f:
+        writer.write(f)
+
+
+def footer_operators(page_number: int, page_count: int, project_title: str, page_width: float) -> bytes:
+    """PDF operators drawing the same footer as draw_footer, after restoring the page's state."""
+    label = f"Page {page_number} of {page_count}"
+    x = page_width - 0.5*inch - stringWidth(label, FOOTER_FONT, FOOTER_FONT_SIZE)
+    
+    def show(text, x):
+        escaped = text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+        return f"BT /FShotListFooter {FOOTER_FONT_SIZE} Tf {x:.2f} {0.3*inch:.2f} Td ({escaped}) Tj ET"
+    
+    return (
+        f"Q q 0.4 0.4 0.4 rg {show(project_title, 0.5*inch)} {show(label, x)} Q"
+    ).encode('cp1252', 'replace')
+
+
+def shot_list_doc(output_path: str, project_title: str, orientation: str) -> SimpleDocTemplate:
+    """Document template shared by whole shot lists and fragments."""
     pagesize = landscape(letter) if orientation == "landscape" else letter
     
-    doc = SimpleDocTemplate(
+    return SimpleDocTemplate(
         output_path,
         pagesize=pagesize,
+        title=project_title,
         leftMargin=0.5*inch,
         rightMargin=0.5*inch,
         topMargin=0.5*inch,
         bottomMargin=0.5*inch
     )
+
+
+def draw_footer(pdf_canvas, page_number: int, page_count, project_title: str):
+    """Draw the project title and "Page X of N" (or "Page X" without a count) along the bottom margin."""
+    width, _ = pdf_canvas._pagesize
+    label = f"Page {page_number}" if page_count is None else f"Page {page_number} of {page_count}"
+    pdf_canvas.saveState()
+    pdf_canvas.setFont(FOOTER_FONT, FOOTER_FONT_SIZE)
+    pdf_canvas.setFillColor(colors.HexColor('#666666'))
+    pdf_canvas.drawString(0.5*inch, 0.3*inch, project_title)
+    pdf_canvas.drawRightString(width - 0.5*inch, 0.3*inch, label)
+    pdf_canvas.restoreState()
+
+
+def draw_page_footer(pdf_canvas, doc):
+    """Page callback for a streaming build: footer without the page count."""
+    draw_footer(pdf_canvas, pdf_canvas.getPageNumber(), None, doc.title)
+
+
+class NumberedCanvas(canvas.Canvas):
+    """
+    Canvas that holds finished pages back until the document is complete,
+    then draws each page's footer with the final page count.
+    """
     
-    styles = getSampleStyleSheet()
-    
-    # Custom styles
-    title_style = ParagraphStyle(
-        'TitleStyle',
-        parent=styles['Heading1'],
-        fontSize=18,
-        spaceAfter=6,
-        textColor=colors.HexColor('#1a1a1a')
-    )
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._page_states = []
     
-    subtitle_style = ParagraphStyle(
-        'SubtitleStyle',
-        parent=styles['Normal'],
-        fontSize=10,
-        textColor=colors.HexColor('#666666'),
-        spaceAfter=12
-    )
+    def showPage(self):
+        self._page_states.append(dict(self.__dict__))
+        self._startPage()
     
-    scene_header_style = ParagraphStyle(
-        'SceneHeader',
-        parent=styles['Heading2'],
-        fontSize=12,
-        spaceBefore=16,
-        spaceAfter=8,
-        textColor=colors.HexColor('#1a1a1a'),
-        backColor=colors.HexColor('#f0f0f0'),
-        borderPadding=6
-    )
+    def save(self):
+        page_count = len(self._page_states)
+        for state in self._page_states:
+            self.__dict__.update(state)
+            draw_footer(self, self._pageNumber, page_count, self._doc.info.title)
+            super().showPage()
+        super().save()
+
+
+def iter_shot_list_flowables(
+    shots,
+    project_title: str = "Shot List",
+    production: str = "",
+    director: str = "",
+    dp: str = "",
+    date: str = None,
+    orientation: str = "landscape"
+):
+    """
+    Yield the flowables of a shot list, one scene at a time.
     
-    cell_style = ParagraphStyle(
-        'CellStyle',
-        parent=styles['Normal'],
-        fontSize=9,
-        leading=11
-    )
+    A list of shots is grouped by scene number and sorted; any other
+    iterable is streamed and must deliver each scene's shots together.
+    Arguments are as for create_shot_list_pdf.
     
-    header_cell_style = ParagraphStyle(
-        'HeaderCell',
-        parent=styles['Normal'],
-        fontSize=9,
-        leading=11,
-        textColor=colors.white,
-        alignment=TA_CENTER
-    )
+    Yields:
+        Title, subtitle and spacer, then for every scene its heading, its
+        shot tables (SCENE_CHUNK_ROWS shots each) and a spacer
+    """
+    yield from iter_title_flowables(project_title, production, director, dp, date)
+    yield from iter_scene_flowables(group_shots_by_scene(shots), orientation)
+
+
+def iter_title_flowables(
+    project_title: str,
+    production: str = "",
+    director: str = "",
+    dp: str = "",
+    date: str = None
+):
+    """Yield the title block at the top of the first page."""
+    if date is None:
+        date = datetime.now().strftime("%B %d, %Y")
     
-    elements = []
+    styles = get_styles()
     
     # Header
-    elements.append(Paragraph(project_title, title_style))
+    yield Paragraph(project_title, styles['title'])
     
     header_parts = []
     if production:
@@ -121,92 +548,138 @@ def create_shot_list_pdf(
         header_parts.append(f"DP: {dp}")
     header_parts.append(date)
     
-    elements.append(Paragraph(" | ".join(header_parts), subtitle_style))
-    elements.append(Spacer(1, 12))
+    yield Paragraph(" | ".join(header_parts), styles['subtitle'])
+    yield Spacer(1, 12)
+
+
+def iter_scene_flowables(scenes, orientation: str = "landscape"):
+    """
+    Yield each scene's heading, shot tables and spacer.
     
-    # Group shots by scene
-    scenes = {}
-    for shot in shots:
-        scene_num = shot.get('scene', 1)
-        if scene_num not in scenes:
-            scenes[scene_num] = {
-                'heading': shot.get('scene_heading', f'Scene {scene_num}'),
-                'shots': []
-            }
-        scenes[scene_num]['shots'].append(shot)
+    Args:
+        scenes: Iterable of (scene number, heading, shots), as from
+            group_shots_by_scene
+        orientation: 'landscape' or 'portrait'
+    """
+    styles = get_styles()
     
     # Column widths (landscape)
     if orientation == "landscape":
         col_widths = [0.6*inch, 0.5*inch, 0.5*inch, 1.8*inch, 0.7*inch, 2.8*inch, 2.0*inch]
     else:
         col_widths = [0.5*inch, 0.4*inch, 0.4*inch, 1.4*inch, 0.6*inch, 2.2*inch, 1.6*inch]
+    # Widest plain string each column can show on one line
+    text_widths = [width - CELL_PADDING for width in col_widths]
+    # Headings too wide for their column wrap as Paragraphs
+    wrapped_headers = {
+        i for i, (header, width) in enumerate(zip(HEADERS, text_widths))
+        if stringWidth(header, 'Helvetica-Bold', 9) > width
+    }
     
-    # Table header
-    headers = ['SHOT', 'SETUP', 'TYPE', 'FRAMING', 'MOVE', 'DESCRIPTION', 'NOTES']
-    
-    for scene_num in sorted(scenes.keys()):
-        scene = scenes[scene_num]
-        
+    for scene_num, heading, scene_shots in scenes:
         # Scene heading
-        elements.append(Paragraph(scene['heading'], scene_header_style))
-        
-        # Build table data
-        table_data = [[Paragraph(h, header_cell_style) for h in headers]]
+        yield Paragraph(heading, styles['scene_header'])
         
-        for shot in scene['shots']:
-            shot_id = f"{shot.get('scene', '')}{shot.get('shot', '')}"
-            row = [
-                Paragraph(shot_id, cell_style),
-                Paragraph(str(shot.get('setup', '')), cell_style),
-                Paragraph(shot.get('shot_type', ''), cell_style),
-                Paragraph(shot.get('framing', ''), cell_style),
-                Paragraph(shot.get('movement', ''), cell_style),
-                Paragraph(shot.get('description', ''), cell_style),
-                Paragraph(shot.get('notes', ''), cell_style)
-            ]
-            table_data.append(row)
-        
-        # Create table
-        table = Table(table_data, colWidths=col_widths, repeatRows=1)
-        
-        # Table styling
-        style = TableStyle([
-            # Header row
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2c3e50')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 9),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
-            ('TOPPADDING', (0, 0), (-1, 0), 8),
-            
-            # Data rows
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 1), (-1, -1), 9),
-            ('BOTTOMPADDING', (0, 1), (-1, -1), 6),
-            ('TOPPADDING', (0, 1), (-1, -1), 6),
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-            
-            # Borders
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#cccccc')),
-            ('LINEBELOW', (0, 0), (-1, 0), 1.5, colors.HexColor('#2c3e50')),
-            
-            # Alignment
-            ('ALIGN', (0, 0), (2, -1), 'CENTER'),
-            ('ALIGN', (4, 0), (4, -1), 'CENTER'),
-        ])
-        
-        # Alternating row colors
-        for i in range(1, len(table_data)):
-            if i % 2 == 0:
-                style.add('BACKGROUND', (0, i), (-1, i), colors.HexColor('#f8f9fa'))
-        
-        table.setStyle(style)
-        elements.append(table)
-        elements.append(Spacer(1, 12))
+        rows = []
+        for shot in scene_shots:
+            rows.append(shot_row(shot, text_widths, styles['cell']))
+            if len(rows) == SCENE_CHUNK_ROWS:
+                yield shot_table(rows, col_widths, wrapped_headers)
+                rows = []
+        if rows:
+            yield shot_table(rows, col_widths, wrapped_headers)
+        yield Spacer(1, 12)
+
+
+def group_shots_by_scene(shots):
+    """
+    Group shots into scenes.
     
-    # Build PDF
-    doc.build(elements)
-    return output_path
+    Args:
+        shots: List of shots, grouped by scene number and sorted, or any
+            other iterable, grouped by runs of the same scene number
+    
+    Yields:
+        (scene number, scene heading, iterable of the scene's shots)
+    """
+    if isinstance(shots, list):
+        scenes = {}
+        for shot in shots:
+            scenes.setdefault(shot.get('scene', 1), []).append(shot)
+        for scene_num in sorted(scenes.keys()):
+            scene_shots = scenes[scene_num]
+            yield scene_num, scene_shots[0].get('scene_heading', f'Scene {scene_num}'), scene_shots
+        return
+    
+    for scene_num, run in groupby(shots, key=lambda shot: shot.get('scene', 1)):
+        first = next(run)
+        yield scene_num, first.get('scene_heading', f'Scene {scene_num}'), chain([first], run)
+
+
+def shot_row(shot: dict, text_widths: list, cell_style) -> list:
+    """Table cells of one shot: plain strings where they fit, else Paragraphs."""
+    values = [
+        f"{shot.get('scene', '')}{shot.get('shot', '')}",
+        str(shot.get('setup', '')),
+        shot.get('shot_type', ''),
+        shot.get('framing', ''),
+        shot.get('movement', ''),
+        shot.get('description', ''),
+        shot.get('notes', '')
+    ]
+    return [cell(value, width, cell_style) for value, width in zip(values, text_widths)]
+
+
+def cell(text: str, width: float, style):
+    """
+    A table cell for text. Plain text becomes a string, wrapped here once
+    to the column width (reportlab lays out strings line by line); text with
+    markup stays a Paragraph.
+    """
+    if '<' in text or '&' in text:
+        return Paragraph(text, style)
+    # Cheap bound first: no Helvetica glyph is wider than the font size
+    if '\n' not in text and len(text) * CELL_FONT_SIZE <= width:
+        return text
+    return '\n'.join(simpleSplit(text, CELL_FONT, CELL_FONT_SIZE, width))
+
+
+def shot_table(rows: list, col_widths: list, wrapped_headers=()) -> Table:
+    """One table of shot rows under the column headings."""
+    header_style = get_styles()['header_cell']
+    header_row = [
+        Paragraph(header, header_style) if i in wrapped_headers else header
+        for i, header in enumerate(HEADERS)
+    ]
+    table = Table([header_row] + rows, colWidths=col_widths, repeatRows=1)
+    table.setStyle(SHOT_TABLE_STYLE)
+    return table
+
+
+class FlowableStream(list):
+    """
+    The story list handed to doc.build, filled from a generator as it drains.
+    
+    reportlab consumes the story from the front and may look a few
+    flowables ahead (keepWithNext) or push split parts back, so a short
+    buffer of FLOWABLE_LOOKAHEAD flowables is topped up whenever the build
+    loop checks the length.
+    """
+    
+    def __init__(self, flowables):
+        super().__init__()
+        self._source = iter(flowables)
+    
+    def __len__(self):
+        size = super().__len__()
+        while size < FLOWABLE_LOOKAHEAD and self._source is not None:
+            flowable = next(self._source, None)
+            if flowable is None:
+                self._source = None
+                break
+            self.append(flowable)
+            size += 1
+        return size
 
 
 def shots_from_json(json_path: str) -> list:
@@ -215,74 +688,175 @@ def shots_from_json(json_path: str) -> list:
         return json.load(f)
 
 
-def shots_to_csv(shots: list, output_path: str):
-    """Export shots to CSV for scheduling software."""
+def iter_shots(path: str):
+    """
+    Yield shots from a .jsonl/.ndjson, .csv or .json file.
+    
+    JSON-lines and CSV files are read one shot at a time. A .json file holds
+    a single array; it is loaded whole and returned as a list, so
+    create_shot_list_pdf still groups and sorts it by scene.
+    """
+    ext = Path(path).suffix.lower()
+    if ext in ('.jsonl', '.ndjson'):
+        return iter_shots_jsonl(path)
+    if ext == '.csv':
+        return iter_shots_csv(path)
+    return shots_from_json(path)
+
+
+def iter_shots_jsonl(path: str):
+    """Yield shots from a JSON-lines file, one object per line; blank lines are skipped."""
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def iter_shots_csv(path: str):
+    """
+    Yield shots from a CSV file with a header row, as written by shots_to_csv.
+    
+    Empty cells are left out, numeric scene and setup values become ints and
+    characters becomes a list, so shots read back as they were written.
+    """
     import csv
     
-    fieldnames = ['scene', 'shot', 'setup', 'shot_type', 'framing', 
-                  'movement', 'description', 'notes', 'lens', 'characters']
+    # utf-8-sig drops the byte order mark spreadsheet exports often start with
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        for row in csv.DictReader(f):
+            shot = {key: value for key, value in row.items() if key and value}
+            for key in ('scene', 'setup'):
+                if shot.get(key, '').isdigit():
+                    shot[key] = int(shot[key])
+            if 'characters' in shot:
+                shot['characters'] = [name.strip() for name in shot['characters'].split(',')]
+            yield shot
+
+
+def shots_to_csv(shots, output_path: str) -> int:
+    """
+    Export shots to CSV for scheduling software.
+    
+    Args:
+        shots: Iterable of shot dicts; written as they are read
+        output_path: CSV file to write
+    
+    Returns:
+        Number of shots written
+    """
+    import csv
     
-    with open(output_path, 'w', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
-        writer.writeheader()
+    count = 0
+    with open(output_path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(CSV_FIELDS)
         for shot in shots:
-            row = {k: shot.get(k, '') for k in fieldnames}
-            if isinstance(row.get('characters'), list):
-                row['characters'] = ', '.join(row['characters'])
-            writer.writerow(row)
+            characters = shot.get('characters')
+            if isinstance(characters, list):
+                shot = {**shot, 'characters': ', '.join(characters)}
+            writer.writerow([shot.get(k, '') for k in CSV_FIELDS])
+            count += 1
+    return count
 
 
-if __name__ == "__main__":
-    # Example usage
-    example_shots = [
-        {
-            'scene': 1,
-            'scene_heading': 'INT. COFFEE SHOP - DAY',
-            'shot': 'A',
-            'setup': 1,
-            'shot_type': 'WS',
-            'framing': 'Wide establishing',
-            'movement': 'STATIC',
-            'description': 'Coffee shop interior, morning rush. SARAH enters frame.',
-            'notes': 'Practical lighting from windows'
-        },
-        {
-            'scene': 1,
-            'shot': 'B',
-            'setup': 1,
-            'shot_type': 'MS',
-            'framing': 'Medium on Sarah',
-            'movement': 'TRACK',
-            'description': 'Follow Sarah as she scans the room looking for someone.',
-            'notes': 'Steadicam or gimbal'
-        },
-        {
-            'scene': 1,
-            'shot': 'C',
-            'setup': 2,
-            'shot_type': 'OTS',
-            'framing': 'Over Jake to Sarah',
-            'movement': 'STATIC',
-            'description': 'Sarah approaches table, dialogue begins.',
-            'notes': '50mm lens'
-        },
-        {
-            'scene': 1,
-            'shot': 'D',
-            'setup': 3,
-            'shot_type': 'CU',
-            'framing': 'Close on Sarah',
-            'movement': 'STATIC',
-            'description': 'Reaction to Jake\'s revelation.',
-            'notes': '85mm, shallow DOF'
-        },
-    ]
+def shots_to_jsonl(shots, output_path: str) -> int:
+    """Write shots to a JSON-lines file as they are read; returns the number written."""
+    count = 0
+    with open(output_path, 'w', encoding='utf-8') as f:
+        for shot in shots:
+            f.write(json.dumps(shot) + '\n')
+            count += 1
+    return count
+
+
+def main():
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Generate a PDF shot list')
+    parser.add_argument('shots', nargs='?', default=None,
+                        help='Shots as .jsonl, .csv or .json, grouped by scene (default: an example list)')
+    parser.add_argument('--output', default=None, help='PDF to write (default: next to the shots file)')
+    parser.add_argument('--csv', default=None, help='Also export the shots to this CSV file')
+    parser.add_argument('--title', default='Shot List')
+    parser.add_argument('--production', default='')
+    parser.add_argument('--director', default='')
+    parser.add_argument('--dp', default='')
+    parser.add_argument('--date', default=None)
+    parser.add_argument('--orientation', choices=['landscape', 'portrait'], default='landscape')
+    args = parser.parse_args()
     
+    if args.shots is None:
+        example_shots = [
+            {
+                'scene': 1,
+                'scene_heading': 'INT. COFFEE SHOP - DAY',
+                'shot': 'A',
+                'setup': 1,
+                'shot_type': 'WS',
+                'framing': 'Wide establishing',
+                'movement': 'STATIC',
+                'description': 'Coffee shop interior, morning rush. SARAH enters frame.',
+                'notes': 'Practical lighting from windows'
+            },
+            {
+                'scene': 1,
+                'shot': 'B',
+                'setup': 1,
+                'shot_type': 'MS',
+                'framing': 'Medium on Sarah',
+                'movement': 'TRACK',
+                'description': 'Follow Sarah as she scans the room looking for someone.',
+                'notes': 'Steadicam or gimbal'
+            },
+            {
+                'scene': 1,
+                'shot': 'C',
+                'setup': 2,
+                'shot_type': 'OTS',
+                'framing': 'Over Jake to Sarah',
+                'movement': 'STATIC',
+                'description': 'Sarah approaches table, dialogue begins.',
+                'notes': '50mm lens'
+            },
+            {
+                'scene': 1,
+                'shot': 'D',
+                'setup': 3,
+                'shot_type': 'CU',
+                'framing': 'Close on Sarah',
+                'movement': 'STATIC',
+                'description': 'Reaction to Jake\'s revelation.',
+                'notes': '85mm, shallow DOF'
+            },
+        ]
+        
+        create_shot_list_pdf(
+            shots=example_shots,
+            output_path='/tmp/example_shot_list.pdf',
+            project_title='THE MEETING',
+            director='Jane Smith',
+            dp='John Doe'
+        )
+        print("Example PDF created: /tmp/example_shot_list.pdf")
+        return
+    
+    # Shots are streamed from the file, once per output
+    output_path = args.output or str(Path(args.shots).with_suffix('.pdf'))
     create_shot_list_pdf(
-        shots=example_shots,
-        output_path='/tmp/example_shot_list.pdf',
-        project_title='THE MEETING',
-        director='Jane Smith',
-        dp='John Doe'
+        iter_shots(args.shots),
+        output_path,
+        project_title=args.title,
+        production=args.production,
+        director=args.director,
+        dp=args.dp,
+        date=args.date,
+        orientation=args.orientation
     )
-    print("Example PDF created: /tmp/example_shot_list.pdf")
+    print(f"Shot list PDF created: {output_path}")
+    if args.csv:
+        count = shots_to_csv(iter_shots(args.shots), args.csv)
+        print(f"{count} shots exported to {args.csv}")
+
+
+if __name__ == "__main__":
+    main()
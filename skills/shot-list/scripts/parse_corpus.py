@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+Parse a whole directory of screenplays in parallel, with a result cache.
+
+Usage:
+    from parse_corpus import run_corpus
+
+    report = run_corpus('season_2/', 'breakdown/', workers=4)
+
+Command line:
+    python parse_corpus.py season_2/ --output breakdown/
+    python parse_screenplay.py season_2/ --output breakdown/
+
+Every .fountain, .fdx and .txt file under the directory is parsed in a worker
+process. Parsed results are cached on disk by content hash, so rerunning over
+a slate only reparses drafts that changed. The output directory gets:
+    - index.jsonl: One line per script, in path order (see _run_job)
+    - summaries/<relative path>.txt: summarize_script output per script
+    - cache/: The parse cache, unless another cache directory is given
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from parse_screenplay import parse_content, summarize_script
+
+
+SCRIPT_EXTENSIONS = frozenset({'.fountain', '.fdx', '.txt'})
+
+# Bump whenever parser output changes, so cached results are not reused
+CACHE_VERSION = 2
+
+
+def find_scripts(directory, exclude=()) -> list:
+    """
+    List screenplay files under a directory, sorted by path.
+    
+    Hidden files and directories, and anything under an excluded directory
+    (such as the output of a previous run), are skipped.
+    
+    Args:
+        directory: Directory to walk
+        exclude: Directories to leave out
+    
+    Returns:
+        List of Path
+    """
+    directory = Path(directory)
+    excluded = {Path(path).resolve() for path in exclude}
+    scripts = []
+    
+    for root, dirs, files in os.walk(directory):
+        root = Path(root)
+        dirs[:] = [
+            d for d in dirs
+            if not d.startswith('.') and (root / d).resolve() not in excluded
+        ]
+        for name in files:
+            if not name.startswith('.') and Path(name).suffix.lower() in SCRIPT_EXTENSIONS:
+                scripts.append(root / name)
+    
+    return sorted(scripts)
+
+
+def run_corpus(directory, output_dir, cache_dir=None, workers=None) -> dict:
+    """
+    Parse every screenplay under a directory into an index and summaries.
+    
+    Args:
+        directory: Directory holding .fountain, .fdx and .txt scripts
+        output_dir: Directory for index.jsonl and summaries/
+        cache_dir: Parse cache directory (default: output_dir/cache)
+        workers: Number of worker processes (default: os.cpu_count()). With 1,
+            scripts are parsed in this process.
+    
+    Returns:
+        dict with:
+            - index: Path of index.jsonl
+            - scripts, parsed, cached, failed: Script counts
+            - errors: (path, error) for every script that failed
+            - bytes: Total size of the scripts read
+            - seconds: Wall time
+            - scripts_per_second, mb_per_second: Throughput
+    """
+    directory = Path(directory)
+    output_dir = Path(output_dir)
+    cache_dir = Path(cache_dir) if cache_dir else output_dir / 'cache'
+    summary_dir = output_dir / 'summaries'
+    output_dir.mkdir(parents=True, exist_ok=True)
+    
+    start = time.perf_counter()
+    paths = find_scripts(directory, exclude=(output_dir, cache_dir))
+    jobs = [
+        (str(path), path.relative_to(directory).as_posix(), str(cache_dir), str(summary_dir))
+        for path in paths
+    ]
+    
+    report = {
+        'index': output_dir / 'index.jsonl',
+        'scripts': len(jobs),
+        'parsed': 0,
+        'cached': 0,
+        'failed': 0,
+        'errors': [],
+        'bytes': 0
+    }
+    
+    with open(report['index'], 'w', encoding='utf-8') as index:
+        if workers == 1 or len(jobs) < 2:
+            _write_records(index, map(_run_job, jobs), report)
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                # Small scripts parse in milliseconds; batch them per worker
+                chunksize = max(1, len(jobs) // ((workers or os.cpu_count() or 1) * 8))
+                _write_records(index, pool.map(_run_job, jobs, chunksize=chunksize), report)
+    
+    seconds = time.perf_counter() - start
+    report['seconds'] = seconds
+    report['scripts_per_second'] = len(jobs) / seconds if seconds else 0.0
+    report['mb_per_second'] = report['bytes'] / 1e6 / seconds if seconds else 0.0
+    return report
+
+
+def _write_records(index, records, report):
+    """Append index lines in order while tallying the report counts."""
+    for record in records:
+        index.write(json.dumps(record) + '\n')
+        report['bytes'] += record['bytes']
+        if record['error']:
+            report['failed'] += 1
+            report['errors'].append((record['path'], record['error']))
+        elif record['cached']:
+            report['cached'] += 1
+        else:
+            report['parsed'] += 1
+
+
+def _run_job(job) -> dict:
+    """
+    Parse (or load from the cache) one script and write its summary.
+    
+    Never raises. The returned index record has path, sha256, format, bytes,
+    cached, seconds and error, plus title, scene_count, characters,
+    page_count and summary (relative to the output directory) on success.
+    """
+    path, relative, cache_dir, summary_dir = job
+    ext = Path(path).suffix.lower()
+    record = {
+        'path': relative,
+        'sha256': None,
+        'format': ext.lstrip('.'),
+        'bytes': 0,
+        'cached': False,
+        'seconds': 0.0,
+        'error': None
+    }
+    start = time.perf_counter()
+    
+    try:
+        data = Path(path).read_bytes()
+        record['bytes'] = len(data)
+        record['sha256'] = hashlib.sha256(data).hexdigest()
+        
+        cache_path = _cache_path(cache_dir, record['sha256'], ext)
+        parsed = _read_cache(cache_path)
+        if parsed is None:
+            parsed = parse_content(data, ext)
+            _write_cache(cache_path, parsed)
+        else:
+            record['cached'] = True
+        
+        summary_path = Path(summary_dir) / f'{relative}.txt'
+        summary_path.parent.mkdir(parents=True, exist_ok=True)
+        summary_path.write_text(summarize_script(parsed) + '\n', encoding='utf-8')
+        
+        record.update({
+            'title': parsed['title'],
+            'scene_count': len(parsed['scenes']),
+            'characters': parsed['characters'],
+            'page_count': parsed['page_count'],
+            'summary': f'summaries/{relative}.txt'
+        })
+    except Exception as e:
+        record['error'] = f'{type(e).__name__}: {e}'
+    finally:
+        record['seconds'] = round(time.perf_counter() - start, 4)
+    
+    return record
+
+
+def _cache_path(cache_dir, digest: str, ext: str) -> Path:
+    """Cache file for a script; the suffix is part of the key since it picks the parser."""
+    return Path(cache_dir) / f'v{CACHE_VERSION}' / digest[:2] / f'{digest}{ext}.json'
+
+
+def _read_cache(cache_path: Path):
+    """Load a cached parse result, or None if missing or unreadable."""
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_cache(cache_path: Path, parsed: dict):
+    """Store a parse result atomically, so concurrent runs never see partial files."""
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(parsed, f)
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Parse a directory of screenplays')
+    parser.add_argument('directory', help='Directory of .fountain, .fdx and .txt scripts')
+    parser.add_argument('--output', required=True, help='Directory for index.jsonl and summaries')
+    parser.add_argument('--cache', default=None, help='Parse cache directory (default: <output>/cache)')
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args()
+    
+    report = run_corpus(args.directory, args.output, cache_dir=args.cache, workers=args.workers)
+    
+    for path, error in report['errors']:
+        print(f'FAILED - {path}: {error}')
+    print(
+        f"{report['scripts']} scripts ({report['parsed']} parsed, {report['cached']} cached, "
+        f"{report['failed']} failed) in {report['seconds']:.2f} s - "
+        f"{report['scripts_per_second']:.1f} scripts/s, {report['mb_per_second']:.1f} MB/s"
+    )
+    print(f"Index: {report['index']}")
+    return 1 if report['failed'] else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -1,253 +1,757 @@
 #!/usr/bin/env python3
 """Parse screenplays from various formats to extract scene structure."""
 
+import io
 import re
 import xml.etree.ElementTree as ET
+from collections import namedtuple
 from pathlib import Path
 
 
+# Token kinds produced by the tokenizers
+HEADING = 'heading'
+CHARACTER = 'character'
+PARENTHETICAL = 'parenthetical'
+DIALOGUE = 'dialogue'
+ACTION = 'action'
+TRANSITION = 'transition'
+
+# One classified screenplay element. For CHARACTER tokens, text is the cue with
+# extensions such as (V.O.) or (CONT'D) removed. meta carries format-specific
+# details (see tokenize_fdx) and is None for plain text and Fountain.
+Token = namedtuple('Token', ['kind', 'text', 'meta'], defaults=[None])
+
+TIMES_OF_DAY = 'DAY|NIGHT|MORNING|EVENING|DUSK|DAWN|CONTINUOUS|LATER|SAME'
+
+# Scene heading prefixes, checked (first character, then first four) before
+# running the heading patterns; INT./EXT. and EXT./INT. share them
+HEADING_START = frozenset('IiEe')
+HEADING_PREFIXES = frozenset({'INT.', 'EXT.', 'I/E.'})
+
+# Plain text scene heading: prefix, whitespace, location, optional time of day
+TEXT_HEADING_PATTERN = re.compile(
+    r'^((?:INT\.|EXT\.|INT\./EXT\.|EXT\./INT\.|I/E\.)\s+.+?)'
+    r'(?:\s+-\s+|\s+)?(DAY|NIGHT|MORNING|EVENING|CONTINUOUS|LATER|SAME)?\s*$',
+    re.IGNORECASE
+)
+# Fountain scene heading: the prefix alone is enough
+FOUNTAIN_HEADING_PATTERN = re.compile(r'^(?:INT\.|EXT\.|INT\./EXT\.|I/E\.)', re.IGNORECASE)
+FOUNTAIN_TITLE_PATTERN = re.compile(r'^Title:\s*(.+)$', re.MULTILINE | re.IGNORECASE)
+
+# All-caps lines that are transitions rather than character cues: anything
+# ending in "TO:", or starting with one of these words. The alternation is
+# anchored, so a cue is rejected after its first few characters.
+TRANSITION_PATTERN = re.compile(
+    r'(?:(?:SMASH|MATCH|JUMP|QUICK|SLOW|TIME) )?(?:CUT|FADE|DISSOLVE|WIPE)\b'
+    r'|(?:BACK TO|INTERCUT|THE END|END OF)\b'
+)
+# All-caps lines that are scene directions (kept as action), not character cues
+DIRECTION_PATTERN = re.compile(
+    r'\b(?:INSERT|TITLE CARD|FLASHBACK|DREAM|MONTAGE|SERIES OF)\b|\bSUPER:'
+)
+# Page-break markers repeated by screenwriting software; they carry no content
+CONTINUATION_START = frozenset('(C')
+CONTINUATION_PATTERN = re.compile(r"^(?:\(MORE\)|\(CONT'D\)|\(?CONTINUED\)?:?.*)$")
+
+CUE_EXTENSION_PATTERN = re.compile(r'\s*\(.*?\)\s*')
+DUAL_DIALOGUE_PATTERN = re.compile(r'\s*[\^@].*')
+LOCATION_PREFIX_PATTERN = re.compile(r'^(?:INT\.|EXT\.|INT\./EXT\.|I/E\.)\s*', re.IGNORECASE)
+# Time of day after a dash anywhere in the heading, or as its last word
+LOCATION_TIME_PATTERN = re.compile(
+    rf'\s*-\s*(?:{TIMES_OF_DAY}).*$|\s+(?:{TIMES_OF_DAY})\s*$', re.IGNORECASE
+)
+TIME_PATTERN = re.compile(rf'-\s*({TIMES_OF_DAY})|\s({TIMES_OF_DAY})\s*$', re.IGNORECASE)
+
+# Final Draft scene length ("1 3/8", "6/8", "2") in eighths of a page
+FDX_LENGTH_PATTERN = re.compile(r'^\s*(?:(\d+)(?:\s+|$))?(?:(\d+)/8)?\s*$')
+FDX_PAGE_PATTERN = re.compile(r'^\s*(\d+)')
+
+# Standard screenplay layout (Courier 12 on US Letter): printed lines per
+# page, and per element its width in characters and blank lines before it
+LINES_PER_PAGE = 55
+ELEMENT_WIDTHS = {
+    HEADING: 60,
+    ACTION: 60,
+    CHARACTER: 38,
+    PARENTHETICAL: 25,
+    DIALOGUE: 35,
+    TRANSITION: 60,
+}
+SPACE_BEFORE = {
+    HEADING: 1,
+    ACTION: 1,
+    CHARACTER: 1,
+    PARENTHETICAL: 0,
+    DIALOGUE: 0,
+    TRANSITION: 1,
+}
+# Lines of the following element that must share a page with this one
+KEEP_WITH_NEXT = {HEADING: 2, CHARACTER: 1, PARENTHETICAL: 1}
+# Least lines of action or dialogue left at the bottom of a page when split
+MIN_SPLIT_LINES = 2
+# A pre-wrapped line filled at least this far is continued by the next line
+WRAPPED_LINE_FILL = 0.7
+
+# Final Draft paragraph types that map onto tokens
+FDX_TOKEN_KINDS = {
+    'Scene Heading': HEADING,
+    'Character': CHARACTER,
+    'Parenthetical': PARENTHETICAL,
+    'Dialogue': DIALOGUE,
+    'Action': ACTION,
+    'Transition': TRANSITION,
+}
+
+
 def parse_screenplay(file_path: str) -> dict:
     """
     Parse screenplay from supported formats.
     
     Returns dict with:
         - title: Project title if found
-        - scenes: List of scene dicts
-        - characters: Set of all characters
+        - scenes: List of scene dicts, with the 'page' each starts on and
+          its 'length_eighths' (see Paginator)
+        - characters: List of all characters, in order of first appearance
         - page_count: Estimated pages
     """
     path = Path(file_path)
     ext = path.suffix.lower()
     
+    if ext == '.fdx':
+        # Streamed from disk; only malformed files are read whole
+        parsed = read_fdx(file_path)
+        if parsed is not None:
+            return parsed
+    
     with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
         content = f.read()
     
     if ext == '.fdx':
-        return parse_fdx(content)
+        return parse_text(content)  # Fallback to text parsing
     elif ext == '.fountain':
         return parse_fountain(content)
     else:  # .txt or other text formats
         return parse_text(content)
 
 
+def parse_content(data: bytes, ext: str) -> dict:
+    """
+    Parse screenplay bytes already read into memory.
+    
+    Args:
+        data: Raw file content
+        ext: File suffix selecting the format ('.fountain', '.fdx', '.txt')
+    
+    Returns:
+        The same dict as parse_screenplay
+    """
+    ext = ext.lower()
+    
+    if ext == '.fdx':
+        parsed = read_fdx(io.BytesIO(data))
+        if parsed is not None:
+            return parsed
+    
+    # Decode like open(..., errors='ignore') with universal newlines
+    text = data.decode('utf-8', errors='ignore')
+    text = text.replace('\r\n', '\n').replace('\r', '\n')
+    
+    if ext == '.fountain':
+        return parse_fountain(text)
+    return parse_text(text)  # .txt, other text formats and malformed .fdx
+
+
+def iter_scenes(file_path: str, include_text: bool = True):
+    """
+    Yield scene dicts one at a time while reading a screenplay file.
+    
+    The file is read line by line and each scene is yielded as soon as the
+    next heading (or the end of the file) completes it, so memory is bounded
+    by the largest scene rather than the whole script. Final Draft files are
+    streamed paragraph by paragraph; a malformed one is read as plain text
+    if the error comes before its first scene.
+    
+    Args:
+        file_path: Path to a .fountain, .fdx or plain text screenplay
+        include_text: If False, action and dialogue lists are left empty and
+            only headings and characters are collected
+    
+    Yields:
+        Scene dicts as built by create_scene_dict
+    """
+    ext = Path(file_path).suffix.lower()
+    
+    if ext == '.fdx':
+        yielded = False
+        try:
+            scenes = assemble_scenes(tokenize_fdx(file_path), include_text, Paginator())
+            for scene in scenes:
+                yielded = True
+                yield scene
+            return
+        except ET.ParseError:
+            if yielded:
+                raise
+        # Not well-formed XML; fall back to text parsing like parse_fdx
+    
+    tokenize = tokenize_fountain if ext == '.fountain' else tokenize_text
+    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+        yield from assemble_scenes(tokenize(f), include_text, Paginator(prewrapped=True))
+
+
 def parse_text(text: str) -> dict:
     """Parse plain text screenplay format."""
-    scenes = []
-    characters = set()
+    paginator = Paginator(prewrapped=True)
+    scenes, characters = build_scenes(tokenize_text(text.split('\n')), paginator)
+    return {
+        'title': extract_title(text),
+        'scenes': scenes,
+        'characters': characters,
+        'page_count': paginator.page_count
+    }
+
+
+def parse_fountain(text: str) -> dict:
+    """Parse Fountain markup format."""
+    title_match = FOUNTAIN_TITLE_PATTERN.search(text)
+    paginator = Paginator(prewrapped=True)
+    scenes, characters = build_scenes(tokenize_fountain(text.split('\n')), paginator)
+    return {
+        'title': title_match.group(1).strip() if title_match else '',
+        'scenes': scenes,
+        'characters': characters,
+        'page_count': paginator.page_count
+    }
+
+
+def parse_fdx(xml_content: str) -> dict:
+    """Parse Final Draft XML format."""
+    parsed = read_fdx(io.BytesIO(xml_content.encode('utf-8')))
+    if parsed is None:
+        return parse_text(xml_content)  # Fallback to text parsing
+    return parsed
+
+
+def read_fdx(source):
+    """
+    Parse a Final Draft file incrementally.
     
-    # Scene heading patterns
-    scene_pattern = r'^[\s]*((?:INT\.|EXT\.|INT\./EXT\.|EXT\./INT\.|I/E\.)\s+.+?)(?:\s+-\s+|\s+)?(DAY|NIGHT|MORNING|EVENING|CONTINUOUS|LATER|SAME)?[\s]*$'
+    Besides the usual keys, the result has:
+        - revisions: {revision ID: {'name', 'mark', 'color'}} from the
+          document's revision sets
+        - page_breaks: Number of paragraphs that start a new page
     
-    lines = text.split('\n')
-    current_scene = None
-    scene_num = 0
+    FDX scenes also carry 'scene_number' and a sorted 'revisions' list (see
+    tokenize_fdx). Their 'page' and 'length_eighths' are the ones Final
+    Draft recorded when present, and estimated by a Paginator otherwise.
+    page_count is likewise the last page reached by a recorded scene, or
+    the estimate.
+    
+    Args:
+        source: Path or binary file object
+    
+    Returns:
+        dict, or None if the source is not well-formed XML
+    """
+    info = {}
+    paginator = Paginator()
+    try:
+        scenes, characters = build_scenes(tokenize_fdx(source, info), paginator)
+    except ET.ParseError:
+        return None
+    
+    for scene in scenes:
+        for revision_id in scene['revisions']:
+            info['revisions'].setdefault(revision_id, {})
+    
+    return {
+        'title': info['title'],
+        'scenes': scenes,
+        'characters': characters,
+        'page_count': fdx_page_count(scenes) if info['scene_pages'] else paginator.page_count,
+        'revisions': info['revisions'],
+        'page_breaks': info['page_breaks']
+    }
+
+
+def tokenize_text(lines):
+    """
+    Classify each line of a plain text screenplay once.
+    
+    Args:
+        lines: Iterable of lines, e.g. text.split('\\n') or an open file
+    
+    A character cue is followed by optional parentheticals and one line of
+    dialogue; everything else that is not a heading or transition is action.
+    
+    Yields:
+        Token for every non-blank line except page-break markers
+    """
     in_dialogue = False
-    current_character = None
     
-    for line in lines:
-        stripped = line.strip()
+    for stripped in map(str.strip, lines):
+        if not stripped:
+            continue
         
-        # Check for scene heading
-        match = re.match(scene_pattern, stripped, re.IGNORECASE)
-        if match:
-            if current_scene:
-                scenes.append(current_scene)
-            scene_num += 1
-            current_scene = {
-                'number': scene_num,
-                'heading': stripped.upper(),
-                'location': extract_location(stripped),
-                'time': match.group(2) if match.group(2) else '',
-                'int_ext': 'INT' if 'INT' in stripped.upper() else 'EXT',
-                'characters': set(),
-                'action': [],
-                'dialogue': []
-            }
+        first = stripped[0]
+        if is_heading_start(stripped) and TEXT_HEADING_PATTERN.match(stripped):
             in_dialogue = False
-            current_character = None
+            yield Token(HEADING, stripped)
             continue
         
-        if not current_scene:
+        if first in CONTINUATION_START and CONTINUATION_PATTERN.match(stripped):
             continue
         
-        # Check for character cue (ALL CAPS, typically indented)
+        # Character cue (ALL CAPS, typically indented)
         if stripped.isupper() and 2 < len(stripped) < 45:
-            # Filter out transitions and formatting elements
-            exclude = ['CUT TO', 'FADE', 'DISSOLVE', 'SMASH', 'MATCH', 'INSERT', 
-                      'BACK TO', 'END OF', 'TITLE CARD', 'SUPER:', 'INTERCUT',
-                      'FLASHBACK', 'DREAM', 'MONTAGE', 'SERIES OF', 'THE END',
-                      'CONTINUED', 'MORE', 'CONT\'D']
-            if not any(t in stripped for t in exclude):
-                # Extract character name (remove parentheticals)
-                char_name = re.sub(r'\s*\(.*?\)\s*', '', stripped).strip()
-                if char_name:
-                    characters.add(char_name)
-                    current_scene['characters'].add(char_name)
-                    current_character = char_name
-                    in_dialogue = True
-                    continue
+            if is_transition(stripped):
+                in_dialogue = False
+                yield Token(TRANSITION, stripped)
+                continue
+            char_name = CUE_EXTENSION_PATTERN.sub('', stripped).strip()
+            if char_name and not DIRECTION_PATTERN.search(char_name):
+                in_dialogue = True
+                yield Token(CHARACTER, char_name)
+                continue
         
-        # Dialogue (indented text after character)
-        if in_dialogue and stripped:
-            # Parenthetical
+        if in_dialogue:
             if stripped.startswith('(') and stripped.endswith(')'):
-                current_scene['dialogue'].append({
-                    'character': current_character,
-                    'type': 'parenthetical',
-                    'text': stripped
-                })
+                yield Token(PARENTHETICAL, stripped)
             else:
-                current_scene['dialogue'].append({
-                    'character': current_character,
-                    'type': 'dialogue',
-                    'text': stripped
-                })
-                in_dialogue = False  # Reset after dialogue block
-        elif stripped and not in_dialogue:
-            # Action line
-            current_scene['action'].append(stripped)
-    
-    # Don't forget the last scene
-    if current_scene:
-        scenes.append(current_scene)
-    
-    # Convert character sets to lists
-    for s in scenes:
-        s['characters'] = list(s['characters'])
-    
-    return {
-        'title': extract_title(text),
-        'scenes': scenes,
-        'characters': list(characters),
-        'page_count': estimate_pages(text)
-    }
+                in_dialogue = False  # One dialogue line per cue
+                yield Token(DIALOGUE, stripped)
+        else:
+            yield Token(ACTION, stripped)
 
 
-def parse_fountain(text: str) -> dict:
-    """Parse Fountain markup format."""
-    scenes = []
-    characters = set()
-    title = ""
+def tokenize_fountain(lines):
+    """
+    Classify each line of a Fountain screenplay once.
     
-    # Extract title page
-    title_match = re.search(r'^Title:\s*(.+)$', text, re.MULTILINE | re.IGNORECASE)
-    if title_match:
-        title = title_match.group(1).strip()
+    Dialogue runs from a character cue to the next blank line. Forced
+    headings (.), characters (@) and transitions (>) are honoured; centered
+    text (> ... <) is kept as action.
     
-    # Split by page break or scene headings
-    scene_pattern = r'^(\.?(?:INT\.|EXT\.|INT\./EXT\.|EXT\./INT\.|I/E\.).+)$'
+    Args:
+        lines: Iterable of lines, e.g. text.split('\\n') or an open file
     
-    lines = text.split('\n')
-    current_scene = None
-    scene_num = 0
+    Yields:
+        Token for every non-blank line except page-break markers
+    """
+    in_dialogue = False
     
-    for i, line in enumerate(lines):
-        stripped = line.strip()
+    for stripped in map(str.strip, lines):
+        if not stripped:
+            in_dialogue = False
+            continue
         
-        # Forced scene heading (starts with .)
-        if stripped.startswith('.') and len(stripped) > 1:
-            heading = stripped[1:].strip()
-            if current_scene:
-                scenes.append(current_scene)
-            scene_num += 1
-            current_scene = create_scene_dict(scene_num, heading)
+        # Forced scene heading (starts with a single .)
+        if stripped.startswith('.') and len(stripped) > 1 and stripped[1] != '.':
+            in_dialogue = False
+            yield Token(HEADING, stripped[1:].strip())
             continue
         
         # Standard scene heading
-        if re.match(r'^(?:INT\.|EXT\.|INT\./EXT\.|I/E\.)', stripped, re.IGNORECASE):
-            if current_scene:
-                scenes.append(current_scene)
-            scene_num += 1
-            current_scene = create_scene_dict(scene_num, stripped)
+        if is_heading_start(stripped) and FOUNTAIN_HEADING_PATTERN.match(stripped):
+            in_dialogue = False
+            yield Token(HEADING, stripped)
+            continue
+        
+        if in_dialogue:
+            if stripped.startswith('(') and stripped.endswith(')'):
+                yield Token(PARENTHETICAL, stripped)
+            else:
+                yield Token(DIALOGUE, stripped)
+            continue
+        
+        if stripped.startswith('>'):
+            if stripped.endswith('<'):
+                yield Token(ACTION, stripped[1:-1].strip())
+            else:
+                yield Token(TRANSITION, stripped[1:].strip())
             continue
         
-        if not current_scene:
+        if stripped[0] in CONTINUATION_START and CONTINUATION_PATTERN.match(stripped):
             continue
         
-        # Character (ALL CAPS line, not a transition)
-        if stripped.isupper() and len(stripped) > 1 and len(stripped) < 45:
-            if not stripped.endswith(':') and not any(t in stripped for t in ['CUT TO', 'FADE']):
-                char_name = re.sub(r'\s*[\^@].*', '', stripped)  # Remove dual dialogue markers
-                char_name = re.sub(r'\s*\(.*?\)', '', char_name).strip()
-                if char_name:
-                    characters.add(char_name)
-                    current_scene['characters'].add(char_name)
+        # Character (ALL CAPS line or forced with @), not a transition
+        forced = stripped.startswith('@')
+        if forced or (stripped.isupper() and 1 < len(stripped) < 45):
+            if not forced and (stripped.endswith(':') or is_transition(stripped)):
+                yield Token(TRANSITION, stripped)
+                continue
+            cue = stripped[1:] if forced else stripped
+            char_name = DUAL_DIALOGUE_PATTERN.sub('', cue)  # Remove dual dialogue markers
+            char_name = CUE_EXTENSION_PATTERN.sub('', char_name).strip()
+            if char_name and (forced or not DIRECTION_PATTERN.search(char_name)):
+                in_dialogue = True
+                yield Token(CHARACTER, char_name)
+                continue
         
-        # Track action
-        elif stripped and not stripped.startswith('>') and not stripped.startswith('('):
-            current_scene['action'].append(stripped)
+        yield Token(ACTION, stripped)
+
+
+def tokenize_fdx(source, info=None):
+    """
+    Stream the body paragraphs of a Final Draft file as tokens.
     
-    if current_scene:
-        scenes.append(current_scene)
+    Each <Paragraph> is handled when it closes, and every finished top-level
+    element is dropped, so memory does not grow with the file. Paragraph
+    types map onto tokens through FDX_TOKEN_KINDS. Tokens carry meta when
+    the paragraph has any of:
+        - revisions: Set of RevisionID values on its <Text> runs
+        - new_page: True for StartsNewPage="Yes"
+        - scene_number: A scene heading's Number attribute
+        - page, length_eighths: The page number and length in eighths that
+          Final Draft recorded in a heading's <SceneProperties>
     
-    for s in scenes:
-        s['characters'] = list(s['characters'])
+    Args:
+        source: Path or binary file object
+        info: Optional dict, filled in while parsing with 'title',
+            'revisions' ({ID: {'name', 'mark', 'color'}}), 'page_breaks'
+            (paragraphs with StartsNewPage="Yes") and 'scene_pages'
+            (headings with a page recorded)
     
-    return {
-        'title': title,
-        'scenes': scenes,
-        'characters': list(characters),
-        'page_count': estimate_pages(text)
-    }
+    Yields:
+        Token for every body paragraph of a known type
+    
+    Raises:
+        xml.etree.ElementTree.ParseError: If the XML is not well-formed
+    """
+    if info is None:
+        info = {}
+    info.update(title='', revisions={}, page_breaks=0, scene_pages=0)
+    
+    depth = 0
+    root = None
+    section = None  # Top-level element being read: Content, TitlePage, ...
+    
+    for event, elem in ET.iterparse(source, events=('start', 'end')):
+        if event == 'start':
+            depth += 1
+            if depth == 1:
+                root = elem
+            elif depth == 2:
+                section = elem
+            continue
+        
+        elem_depth = depth
+        depth -= 1
+        tag = elem.tag
+        
+        if tag == 'Paragraph' and section is not None:
+            if section.tag == 'Content':
+                token = _fdx_paragraph_token(elem, info)
+                if token is not None:
+                    yield token
+            elif section.tag == 'TitlePage' and not info['title']:
+                if elem.get('Type') == 'Title':
+                    text = elem.findtext('Text')
+                    if text:
+                        info['title'] = text.strip()
+        elif tag == 'Revision' and section is not None and section.tag == 'Revisions':
+            info['revisions'][elem.get('ID', '')] = {
+                'name': elem.get('Name', ''),
+                'mark': elem.get('Mark', ''),
+                'color': elem.get('Color', '')
+            }
+        
+        # Drop finished top-level paragraphs and sections
+        if elem_depth == 3 and section.tag == 'Content':
+            del section[:]
+        elif elem_depth == 2:
+            del root[:]
+            section = None
 
 
-def parse_fdx(xml_content: str) -> dict:
-    """Parse Final Draft XML format."""
-    scenes = []
-    characters = set()
-    title = ""
+def _fdx_paragraph_token(para, info):
+    """Build the token for one closed body <Paragraph>, updating info counts."""
+    texts = para.findall('Text')
+    if len(texts) == 1:
+        text = texts[0].text or ''
+    else:
+        # Styled text is split across several <Text> runs
+        text = ''.join(t.text or '' for t in texts)
     
-    try:
-        root = ET.fromstring(xml_content)
-    except ET.ParseError:
-        return parse_text(xml_content)  # Fallback to text parsing
+    new_page = para.get('StartsNewPage') == 'Yes'
+    if new_page:
+        info['page_breaks'] += 1
+    
+    kind = FDX_TOKEN_KINDS.get(para.get('Type', ''))
+    if kind is None:
+        return None
+    if kind == CHARACTER:
+        text = CUE_EXTENSION_PATTERN.sub('', text).strip()
+        if not text:
+            return None
+    
+    meta = {}
+    for t in texts:
+        revision_id = t.get('RevisionID')
+        if revision_id:
+            meta.setdefault('revisions', set()).add(revision_id)
+    if new_page:
+        meta['new_page'] = True
+    if kind == HEADING:
+        meta['scene_number'] = para.get('Number', '')
+        properties = para.find('SceneProperties')
+        if properties is not None:
+            page = FDX_PAGE_PATTERN.match(properties.get('Page', ''))
+            if page:
+                meta['page'] = int(page.group(1))
+                info['scene_pages'] += 1
+            length = parse_fdx_length(properties.get('Length', ''))
+            if length:
+                meta['length_eighths'] = length
+    return Token(kind, text, meta or None)
+
+
+def parse_fdx_length(length: str):
+    """Convert a Final Draft scene length ("1 3/8") to eighths, or None."""
+    match = FDX_LENGTH_PATTERN.match(length)
+    if not match or not (match.group(1) or match.group(2)):
+        return None
+    return int(match.group(1) or 0) * 8 + int(match.group(2) or 0)
+
+
+def fdx_page_count(scenes: list) -> int:
+    """Last page reached by any scene, from its page and length in eighths."""
+    last_page = 0
+    for scene in scenes:
+        end_page = scene['page'] + (scene['length_eighths'] - 1) // 8
+        last_page = max(last_page, end_page)
+    return last_page
+
+
+def build_scenes(tokens, paginator=None) -> tuple:
+    """
+    Assemble all scene dicts from a token stream.
     
-    # Get title
-    title_page = root.find('.//TitlePage')
-    if title_page is not None:
-        title_elem = title_page.find('.//Paragraph[@Type="Title"]/Text')
-        if title_elem is not None and title_elem.text:
-            title = title_elem.text.strip()
+    Args:
+        tokens: Iterable of Token
+        paginator: Optional Paginator laying out the same tokens
     
+    Returns:
+        (scenes, characters) where characters lists every character in
+        order of first appearance
+    """
+    scenes = list(assemble_scenes(tokens, paginator=paginator))
+    characters = {}
+    for scene in scenes:
+        characters.update(dict.fromkeys(scene['characters']))
+    return scenes, list(characters)
+
+
+def assemble_scenes(tokens, include_text: bool = True, paginator=None):
+    """
+    Turn a token stream into scene dicts, yielding each scene once complete.
+    
+    Tokens before the first heading are ignored, and transitions are not
+    recorded.
+    
+    Args:
+        tokens: Iterable of Token
+        include_text: If False, action and dialogue tokens are skipped
+        paginator: Optional Paginator fed every token in the same pass. Scenes
+            then get the 'page' they start on and their 'length_eighths',
+            unless the tokens' meta already recorded them.
+    
+    Yields:
+        Scene dicts as built by create_scene_dict
+    """
     current_scene = None
+    scene_characters = None
+    scene_revisions = None
+    current_character = None
     scene_num = 0
     
-    content = root.find('Content')
-    if content is None:
-        return {'title': title, 'scenes': [], 'characters': [], 'page_count': 0}
-    
-    for para in content.findall('Paragraph'):
-        para_type = para.get('Type', '')
-        text_elem = para.find('Text')
-        text = text_elem.text if text_elem is not None and text_elem.text else ''
-        
-        if para_type == 'Scene Heading':
+    for kind, text, meta in tokens:
+        if kind == HEADING:
             if current_scene:
-                scenes.append(current_scene)
+                yield finish_scene(current_scene, scene_characters, scene_revisions, paginator)
+            if paginator is not None:
+                paginator.add(kind, text, meta is not None and 'new_page' in meta)
             scene_num += 1
             current_scene = create_scene_dict(scene_num, text)
+            scene_characters = {}
+            scene_revisions = None
+            current_character = None
+            if paginator is not None:
+                current_scene['page'] = paginator.page
+                current_scene['length_eighths'] = None
+            if meta is not None:
+                # Final Draft scenes also record where they sit in the script
+                current_scene['scene_number'] = meta['scene_number']
+                if 'page' in meta:
+                    current_scene['page'] = meta['page']
+                current_scene['length_eighths'] = meta.get('length_eighths')
+                scene_revisions = set(meta.get('revisions', ()))
+            continue
+        
+        if paginator is not None:
+            paginator.add(kind, text, meta is not None and 'new_page' in meta)
+        if current_scene is None:
+            continue
         
-        elif para_type == 'Character' and current_scene:
-            char_name = re.sub(r'\s*\(.*?\)', '', text).strip()
-            if char_name:
-                characters.add(char_name)
-                current_scene['characters'].add(char_name)
+        if meta is not None and 'revisions' in meta:
+            scene_revisions.update(meta['revisions'])
         
-        elif para_type == 'Action' and current_scene:
+        if kind == CHARACTER:
+            scene_characters[text] = None
+            current_character = text
+        elif not include_text:
+            continue
+        elif kind == ACTION:
             current_scene['action'].append(text)
+        elif kind == DIALOGUE or kind == PARENTHETICAL:
+            current_scene['dialogue'].append({
+                'character': current_character,
+                'type': kind,
+                'text': text
+            })
     
+    # Don't forget the last scene
     if current_scene:
-        scenes.append(current_scene)
+        yield finish_scene(current_scene, scene_characters, scene_revisions, paginator)
+
+
+def finish_scene(scene: dict, characters: dict, revisions, paginator=None) -> dict:
+    """Store the collected characters, FDX revision IDs and estimated length on a scene."""
+    scene['characters'] = list(characters)
+    if revisions is not None:
+        scene['revisions'] = sorted(revisions)
+    if paginator is not None and scene.get('length_eighths') is None:
+        scene['length_eighths'] = paginator.scene_eighths()
+    return scene
+
+
+class Paginator:
+    """
+    Lay out screenplay elements on standard pages to count pages and eighths.
     
-    for s in scenes:
-        s['characters'] = list(s['characters'])
+    Elements are wrapped to their ELEMENT_WIDTHS and spaced by SPACE_BEFORE.
+    Headings, cues and parentheticals are kept with what follows them. Long
+    action is split across pages, and split dialogue gets a (MORE) line and a
+    repeated cue. A scene's length runs from its heading to its last printed
+    line, in eighths of LINES_PER_PAGE (at least 1/8), as in Final Draft.
     
-    return {
-        'title': title,
-        'scenes': scenes,
-        'characters': list(characters),
-        'page_count': len(scenes)  # Rough estimate
-    }
+    Plain text and Fountain often arrive one printed line per token. With
+    prewrapped=True, an action or dialogue line that follows a line of the
+    same kind filled to WRAPPED_LINE_FILL of its width is treated as part of
+    the same paragraph, with no blank line between them.
+    
+    Usage:
+        paginator = Paginator()
+        for kind, text, meta in tokens:
+            paginator.add(kind, text)
+        paginator.page_count
+    """
+    
+    def __init__(self, prewrapped: bool = False, lines_per_page: int = LINES_PER_PAGE):
+        self.prewrapped = prewrapped
+        self.lines_per_page = lines_per_page
+        self.page = 1  # Page the last element was placed on
+        self.line = 0  # Lines used on that page
+        self.scene_start = None  # Absolute line of the current scene's heading
+        self._previous = None  # (kind, text) of the last element
+    
+    @property
+    def page_count(self) -> int:
+        """Pages used so far (0 before any element was added)."""
+        return self.page if self._previous is not None else 0
+    
+    def scene_eighths(self) -> int:
+        """Length of the current scene so far, in eighths of a page."""
+        if self.scene_start is None:
+            return 0
+        lines = (self.page - 1) * self.lines_per_page + self.line - self.scene_start
+        return max(1, round(lines * 8 / self.lines_per_page))
+    
+    def add(self, kind: str, text: str, new_page: bool = False):
+        """
+        Place one element after the previous ones.
+        
+        Args:
+            kind: Token kind
+            text: Element text (one paragraph, or one line when prewrapped)
+            new_page: Start the element on a new page
+        """
+        width = ELEMENT_WIDTHS[kind]
+        lines = 1 if len(text) <= width else wrapped_lines(text, width)
+        space = SPACE_BEFORE[kind]
+        previous = self._previous
+        if self.prewrapped and previous is not None and space and previous[0] == kind:
+            if len(previous[1]) >= WRAPPED_LINE_FILL * width and len(previous[1]) <= width:
+                space = 0
+        elif kind == ACTION and previous is not None and previous[0] == DIALOGUE and self.prewrapped:
+            # Plain text tokenizes dialogue after its first line as action
+            if WRAPPED_LINE_FILL * ELEMENT_WIDTHS[DIALOGUE] <= len(previous[1]) <= ELEMENT_WIDTHS[DIALOGUE]:
+                space = 0
+                kind = DIALOGUE
+        self._previous = (kind, text)
+        
+        if new_page and self.line:
+            self._new_page()
+        if self.line == 0:
+            space = 0  # Blank lines are dropped at the top of a page
+        
+        remaining = self.lines_per_page - self.line - space
+        needed = lines + KEEP_WITH_NEXT.get(kind, 0)
+        if needed > remaining:
+            if kind == ACTION and remaining >= MIN_SPLIT_LINES and lines > remaining:
+                # Fill the page and carry the rest of the paragraph over
+                lines -= remaining
+                self._new_page()
+            elif kind == DIALOGUE and remaining > MIN_SPLIT_LINES and lines >= remaining:
+                # (MORE) at the bottom, CHARACTER (CONT'D) at the top
+                lines -= remaining - 1
+                self._new_page()
+                self.line = 1
+            else:
+                self._new_page()
+                if kind == DIALOGUE or kind == PARENTHETICAL:
+                    self.line = 1  # The cue moves over with its dialogue
+            space = 0
+        
+        self.line += space
+        if kind == HEADING:
+            self.scene_start = (self.page - 1) * self.lines_per_page + self.line
+        
+        # Paragraphs longer than a page run on over several
+        self.line += lines
+        while self.line > self.lines_per_page:
+            self.line -= self.lines_per_page
+            self.page += 1
+    
+    def _new_page(self):
+        self.page += 1
+        self.line = 0
+
+
+def wrapped_lines(text: str, width: int) -> int:
+    """
+    Count the lines text takes when word-wrapped greedily at width characters.
+    
+    Lines break at the last space that fits (the space itself is dropped);
+    words longer than a line are broken wherever the line is full.
+    """
+    lines = 1
+    start = 0
+    while len(text) - start > width:
+        end = text.rfind(' ', start, start + width + 1)
+        start = end + 1 if end > start else start + width
+        lines += 1
+    return lines
+
+
+def is_heading_start(line: str) -> bool:
+    """Cheap test for a scene heading prefix on a stripped, non-empty line."""
+    return line[0] in HEADING_START and line[:4].upper() in HEADING_PREFIXES
+
+
+def is_transition(line: str) -> bool:
+    """Check whether a stripped all-caps line is a transition (CUT TO:, FADE OUT. ...)."""
+    return line.endswith('TO:') or TRANSITION_PATTERN.match(line) is not None
 
 
 def create_scene_dict(num: int, heading: str) -> dict:
@@ -258,7 +762,7 @@ def create_scene_dict(num: int, heading: str) -> dict:
         'location': extract_location(heading),
         'time': extract_time(heading),
         'int_ext': 'INT' if 'INT' in heading.upper() else 'EXT',
-        'characters': set(),
+        'characters': [],
         'action': [],
         'dialogue': []
     }
@@ -267,16 +771,17 @@ def create_scene_dict(num: int, heading: str) -> dict:
 def extract_location(heading: str) -> str:
     """Extract location from scene heading."""
     # Remove INT./EXT. prefix and time suffix
-    loc = re.sub(r'^(?:INT\.|EXT\.|INT\./EXT\.|I/E\.)\s*', '', heading, flags=re.IGNORECASE)
-    loc = re.sub(r'\s*-\s*(DAY|NIGHT|MORNING|EVENING|CONTINUOUS|LATER|SAME).*$', '', loc, flags=re.IGNORECASE)
+    loc = LOCATION_PREFIX_PATTERN.sub('', heading)
+    loc = LOCATION_TIME_PATTERN.sub('', loc)
     return loc.strip()
 
 
 def extract_time(heading: str) -> str:
     """Extract time of day from scene heading."""
-    match = re.search(r'-\s*(DAY|NIGHT|MORNING|EVENING|DUSK|DAWN|CONTINUOUS|LATER|SAME)', 
-                      heading, re.IGNORECASE)
-    return match.group(1).upper() if match else ''
+    match = TIME_PATTERN.search(heading)
+    if not match:
+        return ''
+    return (match.group(1) or match.group(2)).upper()
 
 
 def extract_title(text: str) -> str:
@@ -292,9 +797,11 @@ def extract_title(text: str) -> str:
 
 
 def estimate_pages(text: str) -> int:
-    """Estimate page count (roughly 55 lines per page)."""
-    lines = [l for l in text.split('\n') if l.strip()]
-    return max(1, len(lines) // 55)
+    """Estimate the page count of a plain text screenplay (see Paginator)."""
+    paginator = Paginator(prewrapped=True)
+    for kind, text, _ in tokenize_text(text.split('\n')):
+        paginator.add(kind, text)
+    return paginator.page_count
 
 
 def summarize_script(parsed: dict) -> str:
@@ -320,8 +827,13 @@ def summarize_script(parsed: dict) -> str:
 
 if __name__ == "__main__":
     import sys
-    if len(sys.argv) > 1:
+    if len(sys.argv) > 1 and Path(sys.argv[1]).is_dir():
+        # Corpus mode: parse every script under the directory
+        from parse_corpus import main
+        sys.exit(main())
+    elif len(sys.argv) > 1:
         result = parse_screenplay(sys.argv[1])
         print(summarize_script(result))
     else:
         print("Usage: parse_screenplay.py <script_file>")
+        print("       parse_screenplay.py <directory> --output <dir> [--workers N]")